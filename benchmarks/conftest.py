@@ -0,0 +1,23 @@
+"""Provide benchmark fixtures built offline from the test fixtures."""
+
+import pytest
+
+from tests.common import cached_rates
+
+
+@pytest.fixture
+def plan_rates(tmp_path):
+    """TOU plan with four energy periods."""
+    return cached_rates(tmp_path, "plan_data.json", api="benchmark")
+
+
+@pytest.fixture
+def tier_rates(tmp_path):
+    """Tiered plan read with a mid-ladder meter reading."""
+    return cached_rates(tmp_path, "plan_tier_data.json", api="benchmark", reading=10.3)
+
+
+@pytest.fixture
+def demand_rates(tmp_path):
+    """Plan with demand schedules."""
+    return cached_rates(tmp_path, "plan_demand_data.json", api="benchmark")
@@ -0,0 +1,153 @@
+"""Drive Rates against the mock OpenEI server and report throughput."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from collections import Counter
+from os.path import join
+from typing import Any
+
+import aiohttp
+
+import openeihttp
+from benchmarks.mock_server import MockOpenEI
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return p50/p90/p99/max of latency samples in milliseconds."""
+    if not samples:
+        return {}
+    if len(samples) == 1:
+        cuts = [samples[0]] * 99
+    else:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p90": cuts[89] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+async def run_load(
+    server: MockOpenEI,
+    plans: int = 1000,
+    concurrency: int = 100,
+    mode: str = "update",
+) -> dict[str, Any]:
+    """Run one load test against a started server and return a report."""
+    if mode == "batch":
+        return await _run_batch(server, plans, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            clients = [
+                openeihttp.Rates(
+                    api="loadtest",
+                    lat=1.0,
+                    lon=1.0,
+                    plan=f"plan{index:06d}",
+                    cache_file=join(cache_dir, f"plan{index:06d}"),
+                    session=session,
+                    base_url=server.url,
+                )
+                for index in range(plans)
+            ]
+
+            async def one(client: openeihttp.Rates) -> None:
+                async with semaphore:
+                    start = time.perf_counter()
+                    try:
+                        if mode == "lookup":
+                            await client.lookup_plans()
+                        else:
+                            await client.update()
+                    except Exception as err:
+                        outcomes[type(err).__name__] += 1
+                    else:
+                        outcomes["ok"] += 1
+                    latencies.append(time.perf_counter() - start)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(client) for client in clients))
+            elapsed = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "plans": plans,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "throughput_rps": plans / elapsed if elapsed else 0.0,
+        "latency_ms": percentiles(latencies),
+        "outcomes": dict(outcomes),
+        "server": dict(server.stats),
+    }
+
+
+async def _run_batch(server: MockOpenEI, plans: int, concurrency: int) -> dict[str, Any]:
+    """Look up ``plans`` locations, half of them repeats, with lookup_many()."""
+    locations = [(float(index % max(1, plans // 2)), 1.0) for index in range(plans)]
+    started = time.perf_counter()
+    results = await openeihttp.lookup_many(
+        "loadtest", locations, concurrency=concurrency, base_url=server.url
+    )
+    elapsed = time.perf_counter() - started
+    outcomes = Counter(
+        "ok" if result.error is None else type(result.error).__name__ for result in results
+    )
+    return {
+        "mode": "batch",
+        "plans": plans,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "throughput_rps": plans / elapsed if elapsed else 0.0,
+        "outcomes": dict(outcomes),
+        "server": dict(server.stats),
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the server, run the load and stop the server."""
+    server = MockOpenEI(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        payload_size=args.payload_size,
+        seed=args.seed,
+    )
+    async with server:
+        return await run_load(server, args.plans, args.concurrency, args.mode)
+
+
+def main() -> None:
+    """Parse arguments and print the report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["update", "lookup", "batch"], default="update")
+    parser.add_argument("--plans", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--log-level", default="CRITICAL")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+    report = asyncio.run(_main(args))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
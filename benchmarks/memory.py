@@ -0,0 +1,156 @@
+"""Measure memory retained and peaked by Rates, its data and the cache.
+
+Run ``python -m benchmarks.memory`` for a JSON report, or use the
+``measure_*`` helpers from benchmarks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import tempfile
+import tracemalloc
+from collections.abc import Awaitable
+from os.path import join
+from typing import Any, Callable, TypeVar
+
+import openeihttp
+from benchmarks.mock_server import MockOpenEI
+from openeihttp.cache import OpenEICache
+from tests.common import load_plan
+
+_T = TypeVar("_T")
+
+
+def _retained(
+    loop: asyncio.AbstractEventLoop, build: Callable[[], Awaitable[_T]]
+) -> tuple[_T, int, int]:
+    """Run ``build`` and return its result, retained bytes and peak bytes.
+
+    Both numbers are relative to a baseline taken after a collection, so
+    they cover only what ``build`` allocated. The result is kept alive
+    until after the measurement.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = loop.run_until_complete(build())
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current - baseline, peak - baseline
+
+
+def _plan_payload(filename: str = "plan_data.json") -> str:
+    """Return one plan item encoded as JSON."""
+    return json.dumps(load_plan(filename))
+
+
+def measure_parsed_data(
+    loop: asyncio.AbstractEventLoop, filename: str = "plan_data.json"
+) -> dict[str, int]:
+    """Measure the parsed plan dictionary on its own."""
+    payload = _plan_payload(filename)
+
+    async def build() -> Any:
+        return json.loads(payload)
+
+    _, retained, peak = _retained(loop, build)
+    return {"retained_bytes": retained, "peak_bytes": peak}
+
+
+def measure_cache_read(loop: asyncio.AbstractEventLoop, cache_dir: str) -> dict[str, int]:
+    """Measure one OpenEICache.read_cache() result."""
+    cache = OpenEICache(join(cache_dir, "memory_cache"))
+    loop.run_until_complete(cache.write_cache(_plan_payload().encode("utf-8")))
+    _, retained, peak = _retained(loop, cache.read_cache)
+    return {"retained_bytes": retained, "peak_bytes": peak}
+
+
+def measure_rates_update(
+    loop: asyncio.AbstractEventLoop, cache_dir: str, instances: int = 100
+) -> dict[str, int]:
+    """Measure Rates objects loaded from their cache by update()."""
+    payload = _plan_payload()
+    for index in range(instances):
+        with open(join(cache_dir, f"plan{index}"), "w", encoding="utf-8") as file:
+            file.write(payload)
+
+    async def build() -> list[openeihttp.Rates]:
+        fleet = [
+            openeihttp.Rates(api="memory", cache_file=join(cache_dir, f"plan{index}"))
+            for index in range(instances)
+        ]
+        for rates in fleet:
+            await rates.update()
+        return fleet
+
+    _, retained, peak = _retained(loop, build)
+    return {
+        "instances": instances,
+        "retained_bytes": retained,
+        "per_instance_bytes": retained // instances,
+        "peak_bytes": peak,
+    }
+
+
+def measure_requests(
+    loop: asyncio.AbstractEventLoop, cache_dir: str, payload_size: int = 1_000_000
+) -> dict[str, dict[str, int]]:
+    """Measure lookup_plans() results and peak memory of decoding a plan reply."""
+    server = MockOpenEI(payload_size=payload_size)
+    loop.run_until_complete(server.start())
+    try:
+        lookup = openeihttp.Rates(api="memory", lat=1.0, lon=1.0, base_url=server.url)
+        _, lookup_retained, lookup_peak = _retained(loop, lookup.lookup_plans)
+
+        rates = openeihttp.Rates(
+            api="memory",
+            plan="memory",
+            cache_file=join(cache_dir, "request_plan"),
+            base_url=server.url,
+        )
+        _, data_retained, data_peak = _retained(loop, rates.update_data)
+    finally:
+        loop.run_until_complete(server.stop())
+    return {
+        "lookup_plans": {"retained_bytes": lookup_retained, "peak_bytes": lookup_peak},
+        "update_data": {
+            "payload_bytes": rates.last_response_bytes[1],
+            "retained_bytes": data_retained,
+            "peak_bytes": data_peak,
+        },
+    }
+
+
+def report(instances: int = 100, payload_size: int = 1_000_000) -> dict[str, Any]:
+    """Run every measurement and return the combined report."""
+    loop = asyncio.new_event_loop()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            return {
+                "parsed_data": measure_parsed_data(loop),
+                "cache_read": measure_cache_read(loop, cache_dir),
+                "rates_update": measure_rates_update(loop, cache_dir, instances),
+                **measure_requests(loop, cache_dir, payload_size),
+            }
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """Print the memory report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=100)
+    parser.add_argument("--payload-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    print(json.dumps(report(args.instances, args.payload_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Local stand-in for the OpenEI utility_rates endpoint."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+from collections import Counter
+from typing import Any
+
+from aiohttp import web
+
+from tests.common import load_fixture, load_plan
+
+RATE_LIMIT_BODY = load_fixture("rate_limit.json")
+
+
+class MockOpenEI:
+    """Serve OpenEI-shaped replies over a real socket.
+
+    Plan fetches (``getpage``) return the fixture plan relabelled with the
+    requested id; location lookups return the fixture lookup list. Latency,
+    server errors, rate-limit replies and payload padding are configurable.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        payload_size: int = 0,
+        plan: dict[str, Any] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.payload_size = payload_size
+        self.plan = plan or load_plan("plan_data.json")
+        self.lookup = json.loads(load_fixture("lookup.json"))
+        self.stats: Counter[str] = Counter()
+        self._random = random.Random(seed)  # noqa: S311
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/utility_rates", self._handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening and return the endpoint URL."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}/utility_rates"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockOpenEI:
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    def _plan_document(self, label: str) -> dict[str, Any]:
+        """Return the plan relabelled and padded to the configured size."""
+        plan = copy.copy(self.plan)
+        plan["label"] = label
+        if self.payload_size:
+            padding = self.payload_size - len(json.dumps(plan))
+            if padding > 0:
+                plan["description"] = plan.get("description", "") + "x" * padding
+        return {"items": [plan]}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer one utility_rates request."""
+        self.stats["requests"] += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            return web.Response(status=429, text=RATE_LIMIT_BODY, content_type="application/json")
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=503, text="Service Unavailable")
+
+        label = request.query.get("getpage")
+        body = self._plan_document(label) if label else self.lookup
+        return web.json_response(body)
+
+
+def main() -> None:
+    """Run the mock server in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    args = parser.parse_args()
+    server = MockOpenEI(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        payload_size=args.payload_size,
+    )
+    web.run_app(server.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
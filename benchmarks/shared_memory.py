@@ -0,0 +1,140 @@
+"""Measure resident memory per worker process for three ways of holding tariffs.
+
+* ``rates``: every worker loads each plan's cache file into a Rates object.
+* ``compiled``: every worker unpickles its own copy of the compiled tariffs.
+* ``shared``: a loader compiles the tariffs into one SharedTariffs block and
+  every worker attaches to it.
+
+Workers are spawned so none inherits the parent's heap, and each one reports
+how much its RSS grew after loading, split into private (anonymous) and
+shared-memory pages as reported by ``/proc/self/status`` on Linux. Run
+``python -m benchmarks.shared_memory`` for a JSON report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import multiprocessing
+import pickle
+import tempfile
+from os.path import join
+from typing import Any
+
+import openeihttp
+from benchmarks.synthetic import generate_plans
+
+MODES = ("rates", "compiled", "shared")
+YEAR = openeihttp.IntervalData(datetime.datetime(2021, 1, 1), [0.8] * 8760)
+
+
+def _status() -> dict[str, int]:
+    """Return VmRSS, RssAnon and RssShmem of this process in bytes."""
+    fields = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as file:
+            for line in file:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssShmem"):
+                    fields[key] = int(value.split()[0]) * 1024
+    except OSError:
+        import resource
+
+        fields["VmRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return fields
+
+
+def _load(mode: str, source: str, plans: int) -> Any:
+    """Load every tariff the way ``mode`` does and bill one meter-year."""
+    if mode == "rates":
+        fleet = [
+            openeihttp.Rates(api="memory", cache_file=join(source, f"plan{index}"))
+            for index in range(plans)
+        ]
+        asyncio.run(openeihttp.warm_up(fleet))
+        tariffs = [openeihttp.CompiledTariff.from_rates(fleet[0])]
+        held: Any = fleet
+    elif mode == "compiled":
+        with open(join(source, "compiled.pickle"), "rb") as file:
+            held = pickle.load(file)  # noqa: S301
+        tariffs = list(held.values())
+    else:
+        held = openeihttp.SharedTariffs(source)
+        tariffs = [held[plan] for plan in held]
+    tariffs[0].bill(YEAR)
+    return held
+
+
+def _worker(mode: str, source: str, plans: int, queue: Any) -> None:
+    """Report how much RSS loading the tariffs added to this process."""
+    before = _status()
+    held = _load(mode, source, plans)
+    after = _status()
+    queue.put({key: after[key] - before.get(key, 0) for key in after})
+    del held
+
+
+def measure_workers(mode: str, plans: int = 2000, workers: int = 4) -> dict[str, Any]:
+    """Return the average RSS growth per worker for one mode."""
+    context = multiprocessing.get_context("spawn")
+    documents = list(generate_plans(plans, periods=6, tiers=3, demand_periods=2, sell=True))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        shared = None
+        source = cache_dir
+        if mode == "rates":
+            for index, document in enumerate(documents):
+                with open(join(cache_dir, f"plan{index}"), "w", encoding="utf-8") as file:
+                    json.dump(document, file)
+        else:
+            compiled = {doc["label"]: openeihttp.CompiledTariff(doc) for doc in documents}
+            if mode == "compiled":
+                with open(join(cache_dir, "compiled.pickle"), "wb") as file:
+                    pickle.dump(compiled, file)
+            else:
+                shared = openeihttp.SharedTariffs.create(compiled)
+                source = shared.name
+        try:
+            queue = context.Queue()
+            processes = [
+                context.Process(target=_worker, args=(mode, source, plans, queue))
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            results = [queue.get() for _ in processes]
+            for process in processes:
+                process.join()
+        finally:
+            if shared is not None:
+                block = shared.size
+                shared.close()
+                shared.unlink()
+
+    report: dict[str, Any] = {"plans": plans, "workers": workers}
+    for key, name in (("VmRSS", "rss"), ("RssAnon", "private"), ("RssShmem", "shared")):
+        values = [result[key] for result in results if key in result]
+        if values:
+            report[f"{name}_bytes_per_worker"] = sum(values) // len(values)
+    if shared is not None:
+        report["block_bytes"] = block
+    return report
+
+
+def report(plans: int = 2000, workers: int = 4) -> dict[str, Any]:
+    """Measure every mode and return the combined report."""
+    return {mode: measure_workers(mode, plans, workers) for mode in MODES}
+
+
+def main() -> None:
+    """Print the per-worker memory report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plans", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(report(args.plans, args.workers), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Generate synthetic OpenEI-shaped tariffs for scaling tests."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from typing import Any
+
+SUMMER = range(5, 9)  # June through September, zero-based
+DGRULES = ("Net Metering", "Net Billing Instantaneous", "Net Billing Hourly", "Buy All Sell All")
+
+
+def _schedule(rng: random.Random, periods: int, weekend: bool) -> list[list[int]]:
+    """Return a 12x24 period schedule that uses every period.
+
+    Periods are split between a summer and a winter season; within a
+    season each day is cut into contiguous blocks, one per period.
+    """
+    if periods == 1:
+        return [[0] * 24 for _ in range(12)]
+    summer_periods = list(range(periods // 2 or 1))
+    winter_periods = list(range(len(summer_periods), periods)) or summer_periods
+    table = []
+    for month in range(12):
+        season = summer_periods if month in SUMMER else winter_periods
+        cuts = sorted(rng.sample(range(1, 24), len(season) - 1)) if len(season) > 1 else []
+        row = []
+        block = 0
+        for hour in range(24):
+            while block < len(cuts) and hour >= cuts[block]:
+                block += 1
+            row.append(season[block])
+        if weekend:
+            # Weekends collapse to the season's lowest period
+            row = [season[0]] * 24
+        table.append(row)
+    return table
+
+
+def _tiers(
+    rng: random.Random, tiers: int, unit: str, sell: bool, base: float
+) -> list[dict[str, Any]]:
+    """Return a tier ladder with increasing limits and rates."""
+    ladder = []
+    limit = 0.0
+    rate = base
+    for tier in range(tiers):
+        entry: dict[str, Any] = {"rate": round(rate, 5), "adj": round(rng.uniform(0, 0.03), 5)}
+        if sell:
+            entry["sell"] = round(rate * rng.uniform(0.3, 0.8), 5)
+        if tier < tiers - 1:
+            limit += rng.uniform(100, 500)
+            entry["max"] = round(limit, 1)
+        entry["unit"] = unit
+        ladder.append(entry)
+        rate *= rng.uniform(1.05, 1.3)
+    return ladder
+
+
+def generate_plan(
+    label: str | None = None,
+    periods: int = 4,
+    tiers: int = 1,
+    demand_periods: int = 0,
+    demand_tiers: int = 1,
+    flat_demand: bool = False,
+    sell: bool = False,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Return one full-detail plan document.
+
+    The result is shaped like an item of a ``detail=full`` reply and can be
+    assigned to Rates data or written to a cache file.
+    """
+    if not 1 <= periods <= 48 or demand_periods > 48:
+        raise ValueError("Schedules support 1 to 48 periods (24 per season)")
+    rng = random.Random(seed)  # noqa: S311
+    label = label or f"{rng.getrandbits(96):024x}"
+    plan: dict[str, Any] = {
+        "label": label,
+        "uri": f"https://apps.openei.org/IURDB/rate/view/{label}",
+        "sector": "Residential",
+        "country": "USA",
+        "name": f"Synthetic {periods}-period {tiers}-tier plan",
+        "utility": f"Synthetic Utility {rng.randint(1, 500)}",
+        "eiaid": rng.randint(1, 99999),
+        "approved": True,
+        "startdate": 1609459200,
+        "dgrules": rng.choice(DGRULES),
+        "fixedchargefirstmeter": round(rng.uniform(5, 20), 2),
+        "fixedchargeunits": "$/month",
+        "mincharge": round(rng.uniform(0, 10), 2),
+        "minchargeunits": "$/month",
+        "energyratestructure": [
+            _tiers(rng, tiers, "kWh", sell, rng.uniform(0.05, 0.35)) for _ in range(periods)
+        ],
+        "energyweekdayschedule": _schedule(rng, periods, weekend=False),
+        "energyweekendschedule": _schedule(rng, periods, weekend=True),
+    }
+    if demand_periods:
+        plan["demandrateunit"] = "kW"
+        plan["demandratestructure"] = [
+            _tiers(rng, demand_tiers, "kW", False, rng.uniform(2, 15))
+            for _ in range(demand_periods)
+        ]
+        plan["demandweekdayschedule"] = _schedule(rng, demand_periods, weekend=False)
+        plan["demandweekendschedule"] = _schedule(rng, demand_periods, weekend=True)
+    if flat_demand:
+        plan["flatdemandunit"] = "kW"
+        plan["flatdemandstructure"] = [
+            _tiers(rng, demand_tiers, "kW", False, rng.uniform(2, 15)) for _ in range(2)
+        ]
+        plan["flatdemandmonths"] = [1 if month in SUMMER else 0 for month in range(12)]
+    return plan
+
+
+def generate_plans(count: int, seed: int = 0, **options: Any) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` distinct, reproducible plans."""
+    for index in range(count):
+        yield generate_plan(label=f"synthetic{index:018d}", seed=seed + index, **options)
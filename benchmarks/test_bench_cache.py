@@ -0,0 +1,72 @@
+"""Benchmark OpenEICache reads and writes."""
+
+import asyncio
+import json
+
+import pytest
+
+import openeihttp
+from openeihttp import cache as cache_module
+from openeihttp.cache import OpenEICache
+from tests.common import load_plan
+
+COMPRESSION = [None, "gzip", "zstd"]
+
+
+@pytest.fixture
+def loop():
+    """Provide a private event loop for driving the async cache."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def payload():
+    """Encoded full-detail plan."""
+    return json.dumps(load_plan("plan_demand_data.json")).encode("utf-8")
+
+
+@pytest.mark.parametrize("compression", COMPRESSION)
+def test_cache_write(benchmark, loop, tmp_path, payload, compression):
+    if compression == "zstd" and cache_module._zstd() is None:
+        pytest.skip("no zstd backend installed")
+    cache = OpenEICache(str(tmp_path / "cache"), compression=compression)
+    benchmark(lambda: loop.run_until_complete(cache.write_cache(payload)))
+
+
+@pytest.mark.parametrize("compression", COMPRESSION)
+def test_cache_read(benchmark, loop, tmp_path, payload, compression):
+    if compression == "zstd" and cache_module._zstd() is None:
+        pytest.skip("no zstd backend installed")
+    cache = OpenEICache(str(tmp_path / "cache"), compression=compression)
+    loop.run_until_complete(cache.write_cache(payload))
+    benchmark.extra_info["file_bytes"] = (tmp_path / "cache").stat().st_size
+    result = benchmark(lambda: loop.run_until_complete(cache.read_cache()))
+    assert result["label"] == "5cacc9d15457a31d537780e2"
+
+
+def test_cache_exists(benchmark, loop, tmp_path, payload):
+    cache = OpenEICache(str(tmp_path / "cache"))
+    loop.run_until_complete(cache.write_cache(payload))
+    assert benchmark(lambda: loop.run_until_complete(cache.cache_exists()))
+
+
+@pytest.mark.parametrize("mode", ["sequential", "warm_up"])
+def test_cache_fleet_startup(benchmark, loop, tmp_path, payload, mode):
+    """Load 200 plan caches one by one with update() or together with warm_up()."""
+    for index in range(200):
+        (tmp_path / f"plan{index}").write_bytes(payload)
+
+    async def start():
+        fleet = [
+            openeihttp.Rates(api="benchmark", cache_file=str(tmp_path / f"plan{index}"))
+            for index in range(200)
+        ]
+        if mode == "warm_up":
+            assert await openeihttp.warm_up(fleet, concurrency=32) == []
+        else:
+            for rates in fleet:
+                await rates.update()
+
+    benchmark(lambda: loop.run_until_complete(start()))
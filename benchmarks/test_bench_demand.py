@@ -0,0 +1,35 @@
+"""Benchmark demand charges over a year of interval data."""
+
+import datetime
+
+import pytest
+
+from benchmarks.synthetic import generate_plan
+from openeihttp import CompiledTariff, IntervalData, demand_charges, demand_charges_numpy
+
+QUARTER = datetime.timedelta(minutes=15)
+YEAR = IntervalData(
+    datetime.datetime(2021, 1, 1), [0.2 + (i % 96) / 200 for i in range(35040)], QUARTER
+)
+
+
+@pytest.mark.parametrize("minutes", [15, 30, 60])
+def test_demand_charges_year(benchmark, minutes):
+    """Price TOU and flat demand for 35,040 15-minute readings."""
+    tariff = CompiledTariff(
+        generate_plan(periods=4, demand_periods=4, demand_tiers=2, flat_demand=True, seed=1)
+    )
+    window = datetime.timedelta(minutes=minutes)
+    assert len(benchmark(demand_charges, tariff, YEAR, window)) == 12
+
+
+@pytest.mark.parametrize("minutes", [15, 30, 60])
+def test_demand_charges_numpy_year(benchmark, minutes):
+    """Price the same year with the NumPy engine."""
+    np = pytest.importorskip("numpy")
+    tariff = CompiledTariff(
+        generate_plan(periods=4, demand_periods=4, demand_tiers=2, flat_demand=True, seed=1)
+    )
+    year = YEAR._replace(values=np.asarray(YEAR.values))
+    window = datetime.timedelta(minutes=minutes)
+    assert len(benchmark(demand_charges_numpy, tariff, year, window)) == 12
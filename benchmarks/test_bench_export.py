@@ -0,0 +1,28 @@
+"""Benchmark price timeline exports for a year."""
+
+import datetime
+
+import pytest
+
+from openeihttp.export import price_table, to_arrow, to_numpy
+
+START = datetime.datetime(2021, 1, 1)
+END = datetime.datetime(2022, 1, 1)
+QUARTER = datetime.timedelta(minutes=15)
+
+
+def test_price_table_year(benchmark, plan_rates):
+    """Build 35,040 quarter-hour rows as Python lists."""
+    assert len(benchmark(price_table, plan_rates, START, END, QUARTER)["rate"]) == 35040
+
+
+def test_to_numpy_year(benchmark, plan_rates):
+    """Build the same rows as NumPy arrays."""
+    pytest.importorskip("numpy")
+    assert len(benchmark(to_numpy, plan_rates, START, END, QUARTER)["rate"]) == 35040
+
+
+def test_to_arrow_year(benchmark, plan_rates):
+    """Build the same rows as an Arrow table."""
+    pytest.importorskip("pyarrow")
+    assert benchmark(to_arrow, plan_rates, START, END, QUARTER).num_rows == 35040
@@ -0,0 +1,42 @@
+"""Benchmark package import time with -X importtime."""
+
+import os
+import subprocess
+import sys
+
+import openeihttp
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(openeihttp.__file__))
+DEFERRED = ("aiohttp", "aiofiles", "asyncio", "multiprocessing", "concurrent")
+
+
+def import_profile():
+    """Import the package in a fresh interpreter and parse -X importtime."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, openeihttp; print(','.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_ROOT,
+        env={**os.environ, "PYTHONPATH": PACKAGE_ROOT},
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative, set(result.stdout.strip().split(","))
+
+
+def test_import_time(benchmark):
+    cumulative, modules = benchmark.pedantic(import_profile, rounds=5)
+    benchmark.extra_info["openeihttp_us"] = cumulative["openeihttp"]
+    assert not [name for name in modules if name.split(".")[0] in DEFERRED]
@@ -0,0 +1,25 @@
+"""Run a small load test against the mock server."""
+
+import asyncio
+
+from benchmarks.load_test import run_load
+from benchmarks.mock_server import MockOpenEI
+
+
+async def _load(mode, **server_options):
+    async with MockOpenEI(seed=1, **server_options) as server:
+        return await run_load(server, plans=200, concurrency=50, mode=mode)
+
+
+def test_load_update(benchmark):
+    report = benchmark.pedantic(lambda: asyncio.run(_load("update")), rounds=1)
+    assert report["outcomes"] == {"ok": 200}
+    assert report["server"]["requests"] == 200
+
+
+def test_load_lookup_with_faults(benchmark):
+    report = benchmark.pedantic(
+        lambda: asyncio.run(_load("lookup", error_rate=0.1, rate_limit_rate=0.1)), rounds=1
+    )
+    assert sum(report["outcomes"].values()) == 200
+    assert report["outcomes"].get("APIError", 0) > 0
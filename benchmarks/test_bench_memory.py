@@ -0,0 +1,52 @@
+"""Report memory footprints as benchmark extra info."""
+
+import asyncio
+
+import pytest
+
+from benchmarks import memory, shared_memory
+
+
+@pytest.fixture
+def loop():
+    """Provide a private event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_memory_parsed_data(benchmark, loop):
+    result = benchmark.pedantic(memory.measure_parsed_data, args=(loop,), rounds=1)
+    benchmark.extra_info.update(result)
+    assert result["retained_bytes"] > 0
+
+
+def test_memory_cache_read(benchmark, loop, tmp_path):
+    result = benchmark.pedantic(memory.measure_cache_read, args=(loop, str(tmp_path)), rounds=1)
+    benchmark.extra_info.update(result)
+    assert result["retained_bytes"] > 0
+
+
+def test_memory_rates_update(benchmark, loop, tmp_path):
+    result = benchmark.pedantic(
+        memory.measure_rates_update, args=(loop, str(tmp_path), 50), rounds=1
+    )
+    benchmark.extra_info.update(result)
+    assert result["per_instance_bytes"] > 0
+
+
+def test_memory_requests(benchmark, loop, tmp_path):
+    result = benchmark.pedantic(
+        memory.measure_requests, args=(loop, str(tmp_path), 500_000), rounds=1
+    )
+    benchmark.extra_info.update(
+        {f"{name}_{key}": value for name, values in result.items() for key, value in values.items()}
+    )
+    assert result["update_data"]["peak_bytes"] >= result["update_data"]["payload_bytes"]
+
+
+@pytest.mark.parametrize("mode", shared_memory.MODES)
+def test_memory_shared_workers(benchmark, mode):
+    result = benchmark.pedantic(shared_memory.measure_workers, args=(mode, 300, 2), rounds=1)
+    benchmark.extra_info.update(result)
+    assert result["rss_bytes_per_worker"] > 0
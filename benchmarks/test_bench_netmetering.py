@@ -0,0 +1,32 @@
+"""Benchmark an annual net-metering settlement for a solar customer."""
+
+import datetime
+
+import pytest
+
+from benchmarks.synthetic import generate_plan
+from openeihttp import CompiledTariff, IntervalData, net_metering, net_metering_numpy
+from openeihttp.netmetering import RULES
+
+HOURS = 8760
+IMPORTS = IntervalData(
+    datetime.datetime(2021, 1, 1), [0.8 if 9 <= h % 24 < 16 else 1.2 for h in range(HOURS)]
+)
+EXPORTS = [2.0 if 9 <= h % 24 < 16 else 0.0 for h in range(HOURS)]
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_net_metering_year(benchmark, rule):
+    """Settle a year of hourly import and export readings."""
+    tariff = CompiledTariff(generate_plan(periods=4, tiers=2, sell=True, seed=3))
+    assert len(benchmark(net_metering, tariff, IMPORTS, EXPORTS, rule).months) == 12
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_net_metering_numpy_year(benchmark, rule):
+    """Settle the same year with the NumPy engine."""
+    np = pytest.importorskip("numpy")
+    tariff = CompiledTariff(generate_plan(periods=4, tiers=2, sell=True, seed=3))
+    imports = IMPORTS._replace(values=np.asarray(IMPORTS.values))
+    result = benchmark(net_metering_numpy, tariff, imports, np.asarray(EXPORTS), rule)
+    assert len(result.months) == 12
@@ -0,0 +1,47 @@
+"""Benchmark compiled tariff billing, live accumulation and the process-pool portfolio."""
+
+import datetime
+import os
+
+import pytest
+
+from benchmarks.synthetic import generate_plans
+from openeihttp import BillAccumulator, CompiledTariff, IntervalData, bill_portfolio
+
+YEAR = IntervalData(datetime.datetime(2021, 1, 1), [0.8] * 8760)
+METERS = int(os.environ.get("OPENEI_BENCH_METERS", "200"))
+
+
+@pytest.fixture(scope="module")
+def tariffs():
+    """Twenty tiered TOU tariffs."""
+    return {
+        plan["label"]: CompiledTariff(plan)
+        for plan in generate_plans(20, periods=4, tiers=3, sell=True)
+    }
+
+
+def test_bill_year(benchmark, tariffs):
+    """Bill one meter-year of hourly readings."""
+    tariff = next(iter(tariffs.values()))
+    assert len(benchmark(tariff.bill, YEAR)) == 12
+
+
+@pytest.mark.parametrize("workers", [1, None], ids=["one_worker", "all_cpus"])
+def test_bill_portfolio(benchmark, tariffs, workers):
+    """Bill METERS meter-years spread over the tariffs."""
+    labels = list(tariffs)
+    meters = [(index, labels[index % len(labels)], YEAR) for index in range(METERS)]
+    benchmark.extra_info["meters"] = METERS
+
+    def run():
+        return sum(1 for _ in bill_portfolio(meters, tariffs, max_workers=workers))
+
+    assert benchmark.pedantic(run, rounds=3) == METERS
+
+
+def test_accumulator_add(benchmark, tariffs):
+    """Feed one live reading into a running bill."""
+    accumulator = BillAccumulator(next(iter(tariffs.values())))
+    when = datetime.datetime(2021, 7, 1, 12)
+    benchmark(accumulator.add, when, 0.25, datetime.timedelta(minutes=15))
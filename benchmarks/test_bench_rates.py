@@ -0,0 +1,81 @@
+"""Benchmark the rate lookup hot paths."""
+
+import datetime
+
+WEEKDAY = datetime.datetime(2021, 8, 13, 10, 21, 34)
+WEEKEND = datetime.datetime(2021, 8, 14, 13, 0, 0)
+MONTH_END = datetime.datetime(2021, 7, 30, 20, 0, 0)
+YEAR_END = datetime.datetime(2021, 12, 31, 20, 0, 0)
+
+
+def test_rate_structure_weekday(benchmark, plan_rates):
+    benchmark(plan_rates.rate_structure, WEEKDAY, "energy")
+
+
+def test_rate_structure_weekend(benchmark, plan_rates):
+    benchmark(plan_rates.rate_structure, WEEKEND, "energy")
+
+
+def test_rate_structure_demand(benchmark, demand_rates):
+    benchmark(demand_rates.rate_structure, WEEKDAY, "demand")
+
+
+def test_next_rate_schedule_same_day(benchmark, plan_rates):
+    result = benchmark(plan_rates.next_rate_schedule, WEEKDAY, "energy")
+    assert result[0] is not None
+
+
+def test_next_rate_schedule_month_boundary(benchmark, plan_rates):
+    result = benchmark(plan_rates.next_rate_schedule, MONTH_END, "energy")
+    assert result[0] is not None
+
+
+def test_next_rate_schedule_year_boundary(benchmark, plan_rates):
+    result = benchmark(plan_rates.next_rate_schedule, YEAR_END, "energy")
+    assert result[0].year == 2022
+
+
+def test_next_rate_schedule_season_change(benchmark, tier_rates):
+    """Seasonal plan: the scan walks months until the winter schedule starts."""
+    result = benchmark(tier_rates.next_rate_schedule, WEEKDAY, "energy")
+    assert result[0] == datetime.datetime(2021, 11, 1, 0, 0)
+
+
+def test_rate_flat(benchmark, plan_rates):
+    benchmark(plan_rates.rate, WEEKDAY)
+
+
+def test_rate_tiered(benchmark, tier_rates):
+    assert benchmark(tier_rates.rate, WEEKDAY) == 0.32596
+
+
+def test_tier_rate_for_month(benchmark, tier_rates):
+    benchmark(tier_rates.tier_rate_for_month, WEEKDAY)
+
+
+def test_all_rates(benchmark, plan_rates):
+    benchmark(lambda: plan_rates.all_rates)
+
+
+def test_snapshot(benchmark, demand_rates):
+    benchmark(demand_rates.snapshot, WEEKDAY)
+
+
+def test_individual_reads(benchmark, demand_rates):
+    """Baseline for test_snapshot: each value computed separately."""
+
+    def read_all():
+        return (
+            demand_rates.rate(WEEKDAY),
+            demand_rates.adjustment(WEEKDAY),
+            demand_rates.tier_rate_for_month(WEEKDAY),
+            demand_rates.sell_rate(WEEKDAY),
+            demand_rates.next_rate_schedule(WEEKDAY, "energy"),
+            demand_rates.next_rate_schedule(WEEKDAY, "energy"),
+            demand_rates.demand_rate(WEEKDAY),
+            demand_rates.demand_adjustment(WEEKDAY),
+            demand_rates.mincharge,
+            demand_rates.fixedchargefirstmeter,
+        )
+
+    benchmark(read_all)
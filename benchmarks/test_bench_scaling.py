@@ -0,0 +1,95 @@
+"""Benchmark how lookups, caching and memory scale with synthetic plans.
+
+Plan counts default to 1, 100 and 10000; set OPENEI_BENCH_PLANS (for
+example "1,1000,100000") to change them.
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import tracemalloc
+
+import pytest
+
+import openeihttp
+from benchmarks.synthetic import generate_plan, generate_plans
+from openeihttp.cache import OpenEICache
+
+PLAN_COUNTS = [int(n) for n in os.environ.get("OPENEI_BENCH_PLANS", "1,100,10000").split(",")]
+CACHE_LIMIT = 1000  # cap on files written per cache round trip
+WHEN = datetime.datetime(2021, 8, 13, 14, 0, 0)
+
+
+def loaded_rates(plans, **kwargs):
+    """Return Rates objects holding the given plans in memory."""
+    objects = []
+    for plan in plans:
+        rates = openeihttp.Rates(api="benchmark", plan=plan["label"], **kwargs)
+        rates._data = plan
+        objects.append(rates)
+    return objects
+
+
+@pytest.mark.parametrize("count", PLAN_COUNTS)
+def test_rate_lookup_scaling(benchmark, count):
+    fleet = loaded_rates(generate_plans(count, periods=4, sell=True))
+
+    def lookup_all():
+        return [rates.rate(WHEN) for rates in fleet]
+
+    result = benchmark(lookup_all)
+    assert len(result) == count
+    benchmark.extra_info["plans"] = count
+
+
+@pytest.mark.parametrize("count", PLAN_COUNTS)
+def test_cache_roundtrip_scaling(benchmark, tmp_path, count):
+    count = min(count, CACHE_LIMIT)
+    caches = [OpenEICache(str(tmp_path / f"plan{index}")) for index in range(count)]
+    payloads = [json.dumps(plan).encode("utf-8") for plan in generate_plans(count)]
+
+    async def roundtrip():
+        await asyncio.gather(*(c.write_cache(p) for c, p in zip(caches, payloads)))
+        return await asyncio.gather(*(c.read_cache() for c in caches))
+
+    result = benchmark(lambda: asyncio.run(roundtrip()))
+    assert len(result) == count
+    benchmark.extra_info["plans"] = count
+
+
+@pytest.mark.parametrize("count", PLAN_COUNTS)
+def test_memory_scaling(benchmark, count):
+    def measure():
+        tracemalloc.start()
+        fleet = loaded_rates(generate_plans(count, periods=4, tiers=3, demand_periods=2))
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return fleet, retained, peak
+
+    fleet, retained, peak = benchmark.pedantic(measure, rounds=1)
+    assert len(fleet) == count
+    benchmark.extra_info.update(
+        plans=count, retained_bytes=retained, peak_bytes=peak, bytes_per_plan=retained // count
+    )
+
+
+@pytest.mark.parametrize(("periods", "tiers"), [(2, 1), (12, 5), (48, 20)])
+def test_complex_plan_lookups(benchmark, periods, tiers):
+    (rates,) = loaded_rates(
+        [generate_plan(periods=periods, tiers=tiers, demand_periods=4, sell=True, seed=1)],
+        reading=10_000.0,
+    )
+
+    def lookups():
+        return (
+            rates.rate(WHEN),
+            rates.sell_rate(WHEN),
+            rates.demand_rate(WHEN),
+            rates.next_rate_schedule(WHEN, "energy"),
+        )
+
+    rate, sell, demand, _ = benchmark(lookups)
+    assert rate is not None
+    assert sell is not None
+    assert demand is not None
@@ -1,19 +1,61 @@
 """Provide a package for python-openei."""
 
-from .client import Rates
+from .accumulator import BillAccumulator
+from .breaker import CircuitBreaker
+from .bulk import LookupResult, lookup_many, warm_up
+from .client import Rates, RateSnapshot, Timeouts
+from .demand import DemandCharges, demand_charges, demand_charges_numpy
 from .exceptions import (
     APIError,
+    CircuitOpen,
     InvalidCall,
     NotAuthorized,
     RateLimit,
     UrlNotFound,
 )
+from .hedging import Hedger
+from .metrics import Metrics, MetricsCollector
+from .netmetering import NetMonth, NetSettlement, net_metering, net_metering_numpy
+from .portfolio import Bill, bill_portfolio
+from .shared import SharedTariffs
+from .sync import SyncRates
+from .tariff import CompiledTariff, IntervalData, MonthBill
+from .tracing import RequestTracer
+from .versions import TariffVersions, fetch_versions
 
 __all__ = [
     "Rates",
+    "RateSnapshot",
+    "SyncRates",
     "APIError",
+    "Bill",
+    "BillAccumulator",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "CompiledTariff",
+    "DemandCharges",
+    "Hedger",
+    "IntervalData",
     "InvalidCall",
+    "LookupResult",
+    "Metrics",
+    "MetricsCollector",
+    "MonthBill",
+    "NetMonth",
+    "NetSettlement",
     "NotAuthorized",
     "RateLimit",
+    "RequestTracer",
+    "SharedTariffs",
+    "TariffVersions",
+    "Timeouts",
     "UrlNotFound",
+    "bill_portfolio",
+    "demand_charges",
+    "demand_charges_numpy",
+    "fetch_versions",
+    "lookup_many",
+    "net_metering",
+    "net_metering_numpy",
+    "warm_up",
 ]
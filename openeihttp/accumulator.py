@@ -0,0 +1,137 @@
+"""Running bill for a live meter."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from .const import BILL_CYCLE_DAY
+from .tariff import HOUR, CompiledTariff, MonthBill
+
+if TYPE_CHECKING:
+    from .client import Rates
+
+
+def _add_month(date: datetime.date) -> datetime.date:
+    """Return the same day one month later."""
+    if date.month == 12:
+        return date.replace(year=date.year + 1, month=1)
+    return date.replace(month=date.month + 1)
+
+
+class BillAccumulator:
+    """Accumulate energy, tier, peak demand and cost as readings arrive.
+
+    Each reading is priced on arrival against the energy used so far in its
+    billing cycle, so ``add()`` does a constant amount of work. Cycles start
+    at midnight on ``cycle_day``; a reading from a later cycle closes the
+    current one.
+    """
+
+    def __init__(self, tariff: CompiledTariff | Rates, cycle_day: int = BILL_CYCLE_DAY) -> None:
+        """Initialize."""
+        if not 1 <= cycle_day <= 28:
+            raise ValueError("cycle_day must be between 1 and 28")
+        self._tariff = CompiledTariff.coerce(tariff)
+        self._cycle_day = cycle_day
+        self._start: datetime.date | None = None
+        self._end: datetime.date | None = None
+        self._days = 0
+        self._kwh = 0.0
+        self._energy = 0.0
+        self._adjustment = 0.0
+        self._period: int | None = None
+        self._peaks: dict[int, float] = {}
+        self._peak = 0.0
+
+    def _cycle(self, when: datetime.datetime) -> datetime.date:
+        """Return the start of the billing cycle containing ``when``."""
+        start = when.date().replace(day=self._cycle_day)
+        if when.day >= self._cycle_day:
+            return start
+        if start.month == 1:
+            return start.replace(year=start.year - 1, month=12)
+        return start.replace(month=start.month - 1)
+
+    def add(
+        self, when: datetime.datetime, kwh: float, duration: datetime.timedelta = HOUR
+    ) -> MonthBill | None:
+        """Add the energy used in the interval starting at ``when``.
+
+        Returns the bill of the previous cycle when this reading starts a new
+        one. Readings from a cycle that has already closed are rejected.
+        """
+        closed = None
+        if self._end is None or when.date() >= self._end:
+            if self._start is not None:
+                closed = self.bill()
+            self._start = self._cycle(when)
+            self._end = _add_month(self._start)
+            self._days = (self._end - self._start).days
+            self._kwh = self._energy = self._adjustment = self._peak = 0.0
+            self._peaks = {}
+        elif self._start is not None and when.date() < self._start:
+            raise ValueError("Reading belongs to a closed billing cycle")
+
+        tariff = self._tariff
+        period = self._period = tariff.energy_period(when)
+        energy, adjustment = tariff.price(period, self._kwh, kwh, self._days)
+        self._energy += energy
+        self._adjustment += adjustment
+        self._kwh += kwh
+
+        hours = duration.total_seconds() / 3600
+        if hours > 0:
+            demand = kwh / hours
+            self._peak = max(self._peak, demand)
+            demand_period = tariff.demand_period(when)
+            if demand_period is not None and demand > self._peaks.get(demand_period, 0.0):
+                self._peaks[demand_period] = demand
+        return closed
+
+    @property
+    def cycle_start(self) -> datetime.date | None:
+        """Return the first day of the current billing cycle."""
+        return self._start
+
+    @property
+    def kwh(self) -> float:
+        """Return the energy used so far this cycle."""
+        return self._kwh
+
+    @property
+    def period(self) -> int | None:
+        """Return the energy rate structure of the latest reading."""
+        return self._period
+
+    @property
+    def tier(self) -> int | None:
+        """Return the tier reached in the latest reading's rate structure."""
+        if self._period is None:
+            return None
+        return self._tariff.tier(self._period, self._kwh, self._days)
+
+    @property
+    def peak_demand(self) -> float:
+        """Return the highest demand this cycle, in kW."""
+        return self._peak
+
+    @property
+    def peak_demand_by_period(self) -> dict[int, float]:
+        """Return the highest demand this cycle per demand rate structure."""
+        return dict(self._peaks)
+
+    @property
+    def cost(self) -> float:
+        """Return the cost so far this cycle, including fixed charges."""
+        if self._start is None:
+            return 0.0
+        return self.bill().total
+
+    def bill(self) -> MonthBill:
+        """Return the bill of the current cycle so far."""
+        if self._start is None:
+            raise ValueError("No readings added")
+        return self._tariff.month_bill(
+            self._start, self._kwh, self._energy, self._adjustment, self._days
+        )
@@ -0,0 +1,83 @@
+"""Circuit breaker for OpenEI API requests."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from .const import BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling the API after repeated timeouts or server errors.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    requests fail fast with CircuitOpen. Once ``reset_timeout`` seconds have
+    passed a single probe request is let through: success closes the
+    breaker, failure opens it again. Pass one instance to several Rates
+    objects to share it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half_open"."""
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are rejected without a probe."""
+        if self._state == HALF_OPEN:
+            return True
+        return self._state == OPEN and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self._state == CLOSED:
+            return True
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            _LOGGER.debug("Circuit half-open, sending a probe request.")
+            self._state = HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a request reached a healthy server."""
+        if self._state != CLOSED:
+            _LOGGER.info("OpenEI API recovered, closing circuit.")
+        self._state = CLOSED
+        self._failures = 0
+
+    def record_cancelled(self) -> None:
+        """Reopen the breaker if its probe was cancelled, without counting a failure."""
+        if self._state == HALF_OPEN:
+            _LOGGER.debug("Probe request cancelled, circuit open until the next probe.")
+            self._state = OPEN
+
+    def record_failure(self) -> None:
+        """Count a timeout or server error and open the breaker if needed."""
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                _LOGGER.warning("OpenEI API failing, opening circuit for %ss.", self.reset_timeout)
+            self._state = OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,146 @@
+"""Operations over many Rates objects at once."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
+
+from .cache import OpenEICache
+from .client import Rates, _digest, _encode
+from .const import DEFAULT_HEADERS, LOOKUP_CONCURRENCY, LOOKUP_PRECISION, WARM_UP_CONCURRENCY
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# An address string or a (lat, lon) pair
+Location = Union[str, tuple[float, float]]
+
+
+class LookupResult(NamedTuple):
+    """Represent the plan lookup of one location."""
+
+    location: Location
+    plans: dict[str, Any] | None
+    error: Exception | None
+
+
+def _read(cache: OpenEICache) -> tuple[Any, str] | None:
+    """Load a cache file and hash it the way update() does."""
+    data = cache.load()
+    if data is None:
+        return None
+    return data, _digest(_encode(data))
+
+
+async def warm_up(rates: Iterable[Rates], concurrency: int = WARM_UP_CONCURRENCY) -> list[Rates]:
+    """Load the cache files of many plans concurrently.
+
+    Each file is checked with a single stat and read, decompressed and
+    parsed in one executor job, with at most ``concurrency`` jobs in flight.
+    Objects that already hold data are left alone. Returns the objects whose
+    cache was missing or invalid, in input order; those need an API fetch.
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = [item for item in rates if item._data is None]
+
+    async def load(item: Rates) -> bool:
+        async with semaphore:
+            loaded = await loop.run_in_executor(None, _read, item._cache())
+        if loaded is None:
+            if item._metrics is not None:
+                item._metrics.record_cache_miss()
+            return False
+        await item._load_cached(*loaded)
+        return True
+
+    results = await asyncio.gather(*(load(item) for item in pending))
+    needs_fetch = [item for item, ok in zip(pending, results) if not ok]
+    _LOGGER.debug(
+        "Warmed %s of %s caches, %s need an API fetch.",
+        len(pending) - len(needs_fetch),
+        len(pending),
+        len(needs_fetch),
+    )
+    return needs_fetch
+
+
+def _location_key(location: Location, precision: int) -> Hashable:
+    """Return the key under which nearby or identical locations share a lookup."""
+    if isinstance(location, str):
+        return " ".join(location.lower().split())
+    lat, lon = location
+    return round(float(lat), precision), round(float(lon), precision)
+
+
+async def lookup_many(
+    api: str,
+    locations: Sequence[Location],
+    concurrency: int = LOOKUP_CONCURRENCY,
+    precision: int = LOOKUP_PRECISION,
+    session: aiohttp.ClientSession | None = None,
+    **kwargs: Any,
+) -> list[LookupResult]:
+    """Run lookup_plans() for many locations.
+
+    Addresses that match after case and whitespace folding, and coordinates
+    equal after rounding to ``precision`` decimals, share one request.
+    Lookups run over one session with at most ``concurrency`` in flight.
+    Results come back in input order, each carrying its plans or the error
+    its lookup raised. Other keyword arguments are passed to Rates.
+    """
+    import asyncio
+
+    import aiohttp
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    # Each key maps to the input index and value of its first location
+    unique: dict[Hashable, tuple[int, Location]] = {}
+    keys = []
+    for index, location in enumerate(locations):
+        key = _location_key(location, precision)
+        unique.setdefault(key, (index, location))
+        keys.append(key)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def lookup(
+        index: int, location: Location, shared: aiohttp.ClientSession
+    ) -> tuple[dict[str, Any] | None, Exception | None]:
+        if isinstance(location, str):
+            rates = Rates(api, address=location, session=shared, **kwargs)
+        else:
+            rates = Rates(api, lat=location[0], lon=location[1], session=shared, **kwargs)
+        async with semaphore:
+            try:
+                return await rates.lookup_plans(), None
+            except Exception as err:
+                # Addresses are secrets and error messages may carry the request URL
+                _LOGGER.debug("Lookup for location %s failed: %s", index, type(err).__name__)
+                return None, err
+
+    async def run(shared: aiohttp.ClientSession) -> dict[Hashable, Any]:
+        outcomes = await asyncio.gather(
+            *(lookup(index, loc, shared) for index, loc in unique.values())
+        )
+        return dict(zip(unique, outcomes))
+
+    if session is not None:
+        outcomes = await run(session)
+    else:
+        tracer = kwargs.get("tracer")
+        async with aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(limit=concurrency),
+            trace_configs=[tracer.trace_config] if tracer is not None else None,
+        ) as shared:
+            outcomes = await run(shared)
+    _LOGGER.debug("Looked up %s locations with %s requests.", len(keys), len(unique))
+    return [LookupResult(location, *outcomes[key]) for location, key in zip(locations, keys)]
@@ -1,65 +1,191 @@
 """Cache functions for python-openei."""
 
+from __future__ import annotations
+
+import gzip
 import json
 import logging
+import os
+import stat
+import time
+import zlib
 from os.path import dirname, join, split
 from typing import Any
 
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
-
-from .const import MIN_CACHE_SIZE
+from .const import GZIP_MAGIC, MIN_CACHE_SIZE, MIN_COMPRESSED_CACHE_SIZE, ZSTD_MAGIC
+from .metrics import Metrics
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _zstd() -> Any:
+    """Return a zstd module, or None when neither backend is installed."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def compress(data: bytes, method: str | None) -> bytes:
+    """Compress cache data with zstd or gzip; None stores it as-is.
+
+    zstd falls back to gzip when no zstd backend is installed.
+    """
+    if method is None:
+        return data
+    if method == "zstd":
+        zstd = _zstd()
+        if zstd is not None:
+            return zstd.compress(data)
+        _LOGGER.debug("zstd unavailable, compressing cache with gzip")
+    elif method != "gzip":
+        raise ValueError(f"Unsupported cache compression: {method}")
+    return gzip.compress(data, mtime=0)
+
+
+def decompress(raw: bytes) -> bytes:
+    """Return cache data, detecting compression from the magic bytes."""
+    if raw.startswith(GZIP_MAGIC):
+        return gzip.decompress(raw)
+    if raw.startswith(ZSTD_MAGIC):
+        zstd = _zstd()
+        if zstd is None:
+            raise ValueError("Cache is zstd-compressed but no zstd backend is installed")
+        if hasattr(zstd, "ZstdDecompressor"):
+            # zstandard needs a size hint for frames without a content size
+            return zstd.ZstdDecompressor().decompressobj().decompress(raw)
+        return zstd.decompress(raw)
+    return raw
+
+
+def _large_enough(size: int, head: bytes) -> bool:
+    """Return True if a cache file of ``size`` bytes starting with ``head`` can hold a plan.
+
+    The minimum depends on whether the file is compressed, which is read
+    from its magic bytes like decompress() does.
+    """
+    compressed = head.startswith((GZIP_MAGIC, ZSTD_MAGIC))
+    return size >= (MIN_COMPRESSED_CACHE_SIZE if compressed else MIN_CACHE_SIZE)
+
+
 class OpenEICache:
     """Represent OpenEI Cache manager."""
 
-    def __init__(self, cache_file: str = "") -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        cache_file: str = "",
+        metrics: Metrics | None = None,
+        compression: str | None = None,
+    ) -> None:
+        """Initialize.
+
+        ``compression`` may be "zstd", "gzip" or None. Reads detect the
+        format of the file regardless of this setting.
+        """
         if not cache_file:
             cache_file = join(dirname(__file__), "openei_cache")
         self._cache_file = cache_file
         self._directory, self._filename = split(cache_file)
+        self._metrics = metrics
+        self._compression = compression
+
+    def sibling(self, suffix: str) -> OpenEICache:
+        """Return a cache with the same settings stored next to this one."""
+        return OpenEICache(self._cache_file + suffix, self._metrics, self._compression)
 
     async def write_cache(self, data: bytes) -> None:
         """Write cache file."""
+        import aiofiles
+        import aiofiles.os
+
+        start = time.perf_counter() if self._metrics is not None else 0.0
         if self._directory != "":
             _LOGGER.debug("Ensuring directory exists: %s", self._directory)
             await aiofiles.os.makedirs(self._directory, exist_ok=True)
         async with aiofiles.open(self._cache_file, mode="wb") as file:
             _LOGGER.debug("Writing file: %s", self._cache_file)
-            await file.write(data)
+            await file.write(compress(data, self._compression))
+        if self._metrics is not None:
+            self._metrics.record_cache_write(time.perf_counter() - start)
 
     async def read_cache(self) -> Any:
         """Read cache file."""
+        import aiofiles
+        import aiofiles.ospath
+
         _LOGGER.debug("Attempting to read file: %s", self._cache_file)
+        start = time.perf_counter() if self._metrics is not None else 0.0
         if await aiofiles.ospath.exists(self._cache_file):
-            async with aiofiles.open(self._cache_file) as file:
+            async with aiofiles.open(self._cache_file, mode="rb") as file:
                 _LOGGER.debug("Reading file: %s", self._cache_file)
                 value = await file.read()
 
                 try:
-                    verify = json.loads(value)
-                    return verify
-                except json.decoder.JSONDecodeError:
-                    _LOGGER.info("Invalid JSON data")
-                return {}
+                    verify = json.loads(decompress(value))
+                except (ValueError, OSError, EOFError, zlib.error) as err:
+                    _LOGGER.info("Invalid JSON data: %s", err)
+                    verify = {}
+                if self._metrics is not None:
+                    self._metrics.record_cache_read(time.perf_counter() - start)
+                return verify
         return {}
 
+    def load(self) -> Any | None:
+        """Read and decode the cache file in one blocking call.
+
+        Uses a single stat for the existence and size checks. Returns the
+        parsed data, or None when the file is missing, too small or invalid.
+        Meant to run in an executor.
+        """
+        start = time.perf_counter() if self._metrics is not None else 0.0
+        try:
+            info = os.stat(self._cache_file)
+        except OSError:
+            return None
+        if not stat.S_ISREG(info.st_mode) or info.st_size < MIN_COMPRESSED_CACHE_SIZE:
+            return None
+        try:
+            with open(self._cache_file, "rb") as file:
+                raw = file.read()
+            if not _large_enough(len(raw), raw):
+                return None
+            data = json.loads(decompress(raw))
+        except (ValueError, OSError, EOFError, zlib.error) as err:
+            _LOGGER.info("Invalid cache file %s: %s", self._cache_file, err)
+            return None
+        if self._metrics is not None:
+            self._metrics.record_cache_read(time.perf_counter() - start)
+        return data
+
     async def cache_exists(self) -> bool:
         """Return bool if cache exists and contains data."""
+        import aiofiles
+        import aiofiles.os
+
         check = await aiofiles.os.path.isfile(self._cache_file)
         _LOGGER.debug("Cache file exists? %s", check)
         if check:
             size = await aiofiles.os.path.getsize(self._cache_file)
             _LOGGER.debug("Checking cache file size: %s", size)
-            return size >= MIN_CACHE_SIZE
+            if size >= MIN_CACHE_SIZE or size < MIN_COMPRESSED_CACHE_SIZE:
+                return size >= MIN_CACHE_SIZE
+            # Only small files need their magic bytes read
+            async with aiofiles.open(self._cache_file, mode="rb") as file:
+                head = await file.read(len(ZSTD_MAGIC))
+            return _large_enough(size, head)
         return False
 
     async def clear_cache(self) -> None:
         """Remove cache file."""
+        import aiofiles.os
+
         if await self.cache_exists():
             await aiofiles.os.remove(self._cache_file)
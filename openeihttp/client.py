@@ -2,22 +2,85 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
+import hashlib
+import inspect
 import json
 import logging
 import time
-from typing import Any
-
-import aiohttp
-from aiohttp.client_exceptions import ContentTypeError, ServerTimeoutError
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from .cache import OpenEICache
-from .const import BASE_URL, DEFAULT_HEADERS, ERROR_TIMEOUT
-from .exceptions import APIError, InvalidCall, NotAuthorized, RateLimit, UrlNotFound
+from .const import (
+    ACCEPT_ENCODING,
+    BASE_URL,
+    CACHE_EXPIRY,
+    DEFAULT_HEADERS,
+    DEFAULT_TIMEOUT,
+    ERROR_RATE_LIMIT,
+    ERROR_TIMEOUT,
+    REFRESH_AHEAD,
+    REFRESH_BACKOFF_MAX,
+    REFRESH_BACKOFF_MIN,
+)
+from .exceptions import APIError, CircuitOpen, InvalidCall, NotAuthorized, RateLimit, UrlNotFound
+from .metrics import Metrics
+from .tracing import RequestSpan, RequestTracer, current_span
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import aiohttp
+
+    from .breaker import CircuitBreaker
+    from .hedging import Hedger
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _encode(data: Any) -> bytes:
+    """Return the canonical JSON encoding used for caching and hashing."""
+    return json.dumps(data, sort_keys=True).encode("utf-8")
+
+
+def _digest(json_data: bytes) -> str:
+    """Return the data hash of canonical JSON bytes."""
+    return hashlib.sha256(json_data).hexdigest()
+
+
+class Timeouts(NamedTuple):
+    """Represent request time limits in seconds; None disables a limit.
+
+    ``connect`` covers taking a pooled connection or opening a new one,
+    ``sock_read`` the longest wait between two reads and ``total`` the whole
+    request including reading the body.
+    """
+
+    total: float | None = DEFAULT_TIMEOUT
+    connect: float | None = None
+    sock_read: float | None = None
+
+
+class RateSnapshot(NamedTuple):
+    """Represent every current value of a plan at one moment."""
+
+    when: datetime.datetime
+    energy_rate_structure: int | None
+    rate: float | None
+    adjustment: float | None
+    monthly_tier_rate: float | None
+    sell_rate: float | None
+    next_energy_rate_structure: int | None
+    next_energy_rate_structure_time: datetime.datetime | None
+    demand_rate_structure: int | None
+    demand_rate: float | None
+    demand_adjustment: float | None
+    mincharge: tuple[Any, Any] | None
+    fixedchargefirstmeter: tuple[Any, Any] | None
+
+
 class Rates:
     """Represent OpenEI Rates."""
 
@@ -32,6 +95,13 @@ class Rates:
         reading: float = 0.0,
         cache_file: str = "",
         session: aiohttp.ClientSession | None = None,
+        metrics: Metrics | None = None,
+        tracer: RequestTracer | None = None,
+        base_url: str = BASE_URL,
+        cache_compression: str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeouts: Timeouts | None = None,
+        hedger: Hedger | None = None,
     ) -> None:
         """Initialize."""
         self._api = api
@@ -47,41 +117,151 @@ class Rates:
             self._address,
         ]
         self._cache_file = cache_file
+        self._cache_compression = cache_compression
         self._timestamp = datetime.datetime(1990, 1, 1, 0, 0, 0)
         self._session = session
+        self._last_bytes = (0, 0)
+        self._total_bytes = (0, 0)
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._metrics = metrics
+        self._tracer = tracer
+        self._base_url = base_url
+        self._memo: dict[str, Any] = {}
+        self._memo_hour: datetime.datetime | None = None
+        self._memo_data: dict[str, Any] | None = None
+        self._data_hash: str | None = None
+        self._listeners: list[Callable[[Rates], Any]] = []
+        self._breaker = circuit_breaker
+        self._timeouts = timeouts or Timeouts()
+        self._hedger = hedger
+
+    def _trace(self, name: str) -> AbstractContextManager[RequestSpan | None]:
+        """Open a trace span unless tracing is off or one is already open."""
+        span = current_span()
+        if self._tracer is None or span is not None:
+            return contextlib.nullcontext(span)
+        return self._tracer.span(name, self._redact)
+
+    async def process_request(
+        self, params: dict[str, Any], timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Process API requests.
+
+        ``timeout`` overrides the total time limit of the configured timeouts.
+        """
+        import asyncio
+
+        timeouts = self._timeouts if timeout is None else self._timeouts._replace(total=timeout)
+        breaker = self._breaker
+        if breaker is None:
+            result, _ = await self._traced_dispatch(params, timeouts)
+            return result
+        if not breaker.allow():
+            _LOGGER.debug("Circuit open, skipping request.")
+            if self._metrics is not None:
+                self._metrics.record_circuit_open()
+            raise CircuitOpen
+        try:
+            result, status = await self._traced_dispatch(params, timeouts)
+        except (UrlNotFound, NotAuthorized):
+            breaker.record_success()
+            raise
+        except asyncio.CancelledError:
+            # Cancelling says nothing about the server's health
+            breaker.record_cancelled()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+        # Timeouts leave no status; 5xx replies mean the server is unhealthy
+        if status is None or status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return result
+
+    async def _traced_dispatch(
+        self, params: dict[str, Any], timeouts: Timeouts
+    ) -> tuple[dict[str, Any], int | None]:
+        """Dispatch the request in one span, shared by hedged copies."""
+        with self._trace("request"):
+            return await self._dispatch(params, timeouts)
+
+    async def _dispatch(
+        self, params: dict[str, Any], timeouts: Timeouts
+    ) -> tuple[dict[str, Any], int | None]:
+        """Send the request, hedged when a hedger is configured.
+
+        Returns the message and the HTTP status, or None when there was none.
+        """
+        if self._hedger is None:
+            return await self._send_request(params, timeouts)
+        return await self._hedger.run(lambda: self._send_request(params, timeouts))
+
+    async def _send_request(
+        self, params: dict[str, Any], timeouts: Timeouts
+    ) -> tuple[dict[str, Any], int | None]:
+        """Send the request, on a session of our own if none was given."""
+        import aiohttp
 
-    async def process_request(self, params: dict[str, Any], timeout: int = 90) -> dict[str, Any]:
-        """Process API requests."""
         if self._session is not None:
-            return await self._execute_request(self._session, params, timeout)
+            return await self._execute_request(self._session, params, timeouts)
 
-        async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-            return await self._execute_request(session, params, timeout)
+        trace_configs = [self._tracer.trace_config] if self._tracer is not None else None
+        async with aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS, trace_configs=trace_configs
+        ) as session:
+            return await self._execute_request(session, params, timeouts)
 
     async def _execute_request(
-        self, session: aiohttp.ClientSession, params: dict[str, Any], timeout: int
-    ) -> dict[str, Any]:
+        self, session: aiohttp.ClientSession, params: dict[str, Any], timeouts: Timeouts
+    ) -> tuple[dict[str, Any], int | None]:
         """Execute the request with the given session."""
-        _LOGGER.debug("URL: %s", BASE_URL)
+        import aiohttp
+        from aiohttp.client_exceptions import ContentTypeError, ServerTimeoutError
+
+        _LOGGER.debug("URL: %s", self._base_url)
+        metrics = self._metrics
+        span = current_span()
+        start = time.perf_counter() if metrics is not None else 0.0
+        status = None
         try:
             async with session.get(
-                BASE_URL,
+                self._base_url,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                headers={"Accept-Encoding": ACCEPT_ENCODING},
+                timeout=aiohttp.ClientTimeout(
+                    total=timeouts.total, connect=timeouts.connect, sock_read=timeouts.sock_read
+                ),
+                trace_request_ctx={"span": span} if span is not None else None,
             ) as response:
                 message: Any = {}
+                status = response.status
+                body = await response.read()
+                if span is not None:
+                    span.since("download", "headers")
+                    decode_start = span.mark("decode_start")
+                self._record_bytes(response.content_length, len(body))
+                if metrics is not None:
+                    metrics.record_request(time.perf_counter() - start, response.status, len(body))
                 try:
                     message = await response.text()
                 except UnicodeDecodeError:
                     _LOGGER.debug("Decoding error.")
-                    data = await response.read()
-                    message = data.decode(errors="replace")
+                    message = body.decode(errors="replace")
+                if metrics is not None and (response.status == 429 or ERROR_RATE_LIMIT in message):
+                    metrics.record_rate_limit()
 
+                parse_start = time.perf_counter() if metrics is not None else 0.0
                 try:
                     message = json.loads(message)
                 except ValueError:
                     _LOGGER.warning("Non-JSON response: %s", message)
                     message = {"error": message}
+                if metrics is not None:
+                    metrics.record_json_parse(time.perf_counter() - parse_start)
+                if span is not None:
+                    span.add("decode", time.perf_counter() - decode_start)
 
                 if response.status == 404:
                     raise UrlNotFound
@@ -94,26 +274,53 @@ class Rates:
                         message,
                     )
                     message = {"error": message}
-                return message
+                return message, status
 
         except (TimeoutError, ServerTimeoutError):
-            _LOGGER.error("%s: %s", ERROR_TIMEOUT, BASE_URL)
-            return {"error": ERROR_TIMEOUT}
+            _LOGGER.error("%s: %s", ERROR_TIMEOUT, self._base_url)
+            if metrics is not None:
+                metrics.record_request(time.perf_counter() - start, None, 0)
+            if span is not None:
+                span.error = f"timeout during {span.stage()}"
+            return {"error": ERROR_TIMEOUT}, None
         except ContentTypeError as err:
             _LOGGER.error("%s", err)
-            return {"error": err}
+            return {"error": err}, status
 
-    async def lookup_plans(self) -> dict[str, Any]:
-        """Return the rate plan names per utility in the area."""
+    def _record_bytes(self, wire: int | None, decoded: int) -> None:
+        """Record the transfer size of a response."""
+        # Content-Length reflects the compressed size; chunked replies omit it
+        if wire is None:
+            wire = decoded
+        self._last_bytes = (wire, decoded)
+        self._total_bytes = (self._total_bytes[0] + wire, self._total_bytes[1] + decoded)
+        _LOGGER.debug("Received %s bytes (%s on the wire)", decoded, wire)
+
+    @property
+    def last_response_bytes(self) -> tuple[int, int]:
+        """Return the (wire, decoded) byte counts of the last response."""
+        return self._last_bytes
+
+    @property
+    def total_response_bytes(self) -> tuple[int, int]:
+        """Return the (wire, decoded) byte counts of all responses."""
+        return self._total_bytes
+
+    async def lookup_plans(self, effective_on: datetime.datetime | None = None) -> dict[str, Any]:
+        """Return the rate plan names per utility in the area.
+
+        Plans are those in effect now, or on ``effective_on`` when given.
+        """
         if self._address == "" and (self._lat is None or self._lon is None):
             _LOGGER.error("Missing location data for a plan lookup.")
             raise InvalidCall
 
-        thetime = time.time()
+        thetime = effective_on.timestamp() if effective_on is not None else time.time()
 
         params: dict[str, Any] = {
             "version": "latest",
             "format": "json",
+            "detail": "minimal",
             "api_key": self._api,
             "orderby": "startdate",
             "sector": "Residential",
@@ -131,7 +338,7 @@ class Rates:
 
         rate_names: dict[str, Any] = {}
 
-        result = await self.process_request(params, timeout=90)
+        result = await self.process_request(params)
 
         if "error" in result:
             err = result["error"]
@@ -155,61 +362,218 @@ class Rates:
         """Update data only if we need to."""
         if self._data is None:
             _LOGGER.debug("No data populated, refreshing data.")
-            cache = OpenEICache(self._cache_file) if self._cache_file else OpenEICache()
+            cache = self._cache()
             # Load cached file if one exists
             if await cache.cache_exists():
                 _LOGGER.debug("Cache file exists, reading...")
-                self._data = await cache.read_cache()
+                data = await cache.read_cache()
+                await self._load_cached(data, _digest(_encode(data)))
             else:
                 _LOGGER.debug("Cache file missing, pulling API data...")
+                if self._metrics is not None:
+                    self._metrics.record_cache_miss()
                 await self.update_data()
             self._timestamp = datetime.datetime.now()
         else:
+            if self.auto_refresh_running:
+                _LOGGER.debug("Auto refresh active, serving current data.")
+                return
             elapsedtime = datetime.datetime.now() - self._timestamp
-            past = datetime.timedelta(hours=24)
+            past = datetime.timedelta(seconds=CACHE_EXPIRY)
             if elapsedtime >= past:
+                if self._breaker is not None and self._breaker.is_open:
+                    _LOGGER.debug("Circuit open, serving cached data.")
+                    return
                 _LOGGER.debug("Data stale, refreshing from API.")
-                await self.update_data()
+                if self._metrics is not None:
+                    self._metrics.record_cache_stale()
+                try:
+                    await self.update_data()
+                except CircuitOpen:
+                    _LOGGER.debug("Circuit opened, serving cached data.")
+                    return
                 self._timestamp = datetime.datetime.now()
 
+    @property
+    def auto_refresh_running(self) -> bool:
+        """Return True if the background refresh task is active."""
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+    def start_auto_refresh(self, interval: float = CACHE_EXPIRY - REFRESH_AHEAD) -> None:
+        """Refresh data in the background ahead of expiry.
+
+        Must be called from a running event loop. While the task runs,
+        update() serves the last good data instead of refreshing inline.
+        """
+        import asyncio
+
+        if self.auto_refresh_running:
+            return
+        loop = asyncio.get_running_loop()
+        self._refresh_task = loop.create_task(self._auto_refresh(interval))
+
+    async def stop_auto_refresh(self) -> None:
+        """Stop the background refresh task."""
+        import asyncio
+
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _auto_refresh(self, interval: float) -> None:
+        """Background refresh loop with exponential backoff on failure."""
+        import asyncio
+
+        backoff = REFRESH_BACKOFF_MIN
+        while True:
+            if self._data is not None:
+                due = self._timestamp + datetime.timedelta(seconds=interval)
+                delay = (due - datetime.datetime.now()).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                if self._data is None:
+                    await self.update()
+                else:
+                    _LOGGER.debug("Refreshing data in the background.")
+                    await self.update_data()
+                    self._timestamp = datetime.datetime.now()
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                _LOGGER.warning("Background refresh failed, retrying in %ss: %r", backoff, err)
+            else:
+                if self._data is not None:
+                    backoff = REFRESH_BACKOFF_MIN
+                    continue
+                _LOGGER.warning("Background refresh returned no data, retrying in %ss", backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, REFRESH_BACKOFF_MAX)
+
     async def update_data(self) -> None:
         """Update the data."""
+        with self._trace("update_data"):
+            await self._update_data()
+
+    async def _update_data(self) -> None:
+        """Fetch the plan and write it to the cache."""
+        data = await self._fetch_plan(self._plan)
+        if data is not None:
+            json_data = _encode(data)
+            digest = _digest(json_data)
+            cache = self._cache()
+            if digest == self._data_hash and await cache.cache_exists():
+                _LOGGER.debug("Plan unchanged, keeping current data.")
+                return
+            span = current_span()
+            write_start = time.perf_counter()
+            await cache.write_cache(json_data)
+            if span is not None:
+                span.add("cache_write", time.perf_counter() - write_start)
+            await self._swap_data(data, digest)
+            _LOGGER.debug("Data updated, results: %s", self._data)
+
+    async def _fetch_plan(self, label: str | None) -> dict[str, Any] | None:
+        """Return the full detail of one plan, or None if it was not found."""
         params = {
             "version": "latest",
             "format": "json",
             "detail": "full",
             "api_key": self._api,
-            "getpage": self._plan,
+            "getpage": label,
         }
 
-        result = await self.process_request(params, timeout=90)
+        result = await self.process_request(params)
 
         if "error" in result:
             err = result["error"]
             message = err["message"] if isinstance(err, dict) and "message" in err else str(err)
             _LOGGER.error("Error: %s", message)
-            if "You have exceeded your rate limit." in message:
+            if ERROR_RATE_LIMIT in message:
                 raise RateLimit
             raise APIError
 
-        if "items" in result:
-            data = result["items"][0]
-            self._data = data
-            # Insert cache writing call here
-            cache = OpenEICache(self._cache_file) if self._cache_file else OpenEICache()
-            json_data = json.dumps(data).encode("utf-8")
-            await cache.write_cache(json_data)
-            _LOGGER.debug("Data updated, results: %s", self._data)
+        if result.get("items"):
+            return result["items"][0]
+        return None
+
+    async def _load_cached(self, data: dict[str, Any], digest: str) -> None:
+        """Use data read from the cache file."""
+        await self._swap_data(data, digest)
+        self._timestamp = datetime.datetime.now()
+        if self._metrics is not None:
+            self._metrics.record_cache_hit()
+
+    async def _swap_data(self, data: dict[str, Any], digest: str) -> None:
+        """Replace the plan data and notify listeners if it changed."""
+        changed = digest != self._data_hash
+        self._data = data
+        self._data_hash = digest
+        if not changed:
+            return
+        for listener in list(self._listeners):
+            try:
+                result = listener(self)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                _LOGGER.exception("Error in change listener %s", listener)
+
+    def add_listener(self, listener: Callable[[Rates], Any]) -> Callable[[], None]:
+        """Call ``listener(rates)`` whenever the plan data changes.
+
+        The listener may be a plain function or a coroutine function.
+        Returns a callable that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    @property
+    def data_hash(self) -> str | None:
+        """Return the SHA-256 of the current plan data."""
+        return self._data_hash
+
+    def _cache(self) -> OpenEICache:
+        """Return the cache manager for this plan."""
+        return OpenEICache(
+            self._cache_file, metrics=self._metrics, compression=self._cache_compression
+        )
 
     async def clear_cache(self) -> None:
         """Clear cache file."""
-        cache = OpenEICache(self._cache_file) if self._cache_file else OpenEICache()
-        await cache.clear_cache()
+        await self._cache().clear_cache()
+
+    def _current(self, key: str, compute: Callable[[datetime.datetime], Any]) -> Any:
+        """Return a value for the current hour, computing it once per hour.
+
+        Schedules have hourly resolution, so current_* answers only change
+        on the hour. The memo is dropped when the hour rolls over or when
+        the plan data object is replaced.
+        """
+        now = datetime.datetime.today()
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if hour != self._memo_hour or self._memo_data is not self._data:
+            self._memo.clear()
+            self._memo_hour = hour
+            self._memo_data = self._data
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute(now)
+            return value
 
     @property
     def current_energy_rate_structure(self) -> int | None:
         """Return the current rate structure."""
-        return self.rate_structure(datetime.datetime.today(), "energy")
+        return self._current("energy_structure", lambda now: self.rate_structure(now, "energy"))
 
     def rate_structure(self, date: datetime.datetime, rate_type: str) -> int | None:
         """Return the rate structure for a specific date."""
@@ -229,12 +593,16 @@ class Rates:
     @property
     def next_energy_rate_structure(self) -> int | None:
         """Return the next rate structure."""
-        return self.next_rate_schedule(datetime.datetime.today(), "energy")[1]
+        return self._next_energy_schedule()[1]
 
     @property
     def next_energy_rate_structure_time(self) -> datetime.datetime | None:
         """Return the time at which the next rate structure will take effect."""
-        return self.next_rate_schedule(datetime.datetime.today(), "energy")[0]
+        return self._next_energy_schedule()[0]
+
+    def _next_energy_schedule(self) -> tuple[datetime.datetime | None, int | None]:
+        """Return the memoized next energy schedule change."""
+        return self._current("next_energy", lambda now: self.next_rate_schedule(now, "energy"))
 
     def next_rate_schedule(
         self, start: datetime.datetime, rate_type: str
@@ -306,53 +674,63 @@ class Rates:
     @property
     def current_rate(self) -> float | None:
         """Return the current rate."""
-        return self.rate(datetime.datetime.today())
+        return self._current("current_rate", self.rate)
 
     def rate(self, date: datetime.datetime) -> float | None:
         """Return the rate for a specific date."""
         assert self._data is not None
         rate_structure = self.rate_structure(date, "energy")
         if rate_structure is not None:
-            if self._reading:
-                value = float(self._reading)
-                rate_data = self._data["energyratestructure"][rate_structure]
-                for rate in rate_data:
-                    if "max" in rate and value < rate["max"]:
-                        return rate["rate"]
-                    continue
-                return rate_data[-1]["rate"]
-            rate = self._data["energyratestructure"][rate_structure][0]["rate"]
-            return rate
+            return self._energy_rate(rate_structure)
         return None
 
+    def _energy_rate(self, rate_structure: int) -> float | None:
+        """Return the energy rate of a structure for the meter reading."""
+        assert self._data is not None
+        if self._reading:
+            value = float(self._reading)
+            rate_data = self._data["energyratestructure"][rate_structure]
+            for rate in rate_data:
+                if "max" in rate and value < rate["max"]:
+                    return rate["rate"]
+                continue
+            return rate_data[-1]["rate"]
+        rate = self._data["energyratestructure"][rate_structure][0]["rate"]
+        return rate
+
     @property
     def current_adjustment(self) -> float | None:
         """Return the current rate."""
-        return self.adjustment(datetime.datetime.today())
+        return self._current("current_adjustment", self.adjustment)
 
     def adjustment(self, date: datetime.datetime) -> float | None:
         """Return the rate for a specific date."""
         assert self._data is not None
         rate_structure = self.rate_structure(date, "energy")
         if rate_structure is not None:
-            adj = None
-            if self._reading:
-                rate_data = self._data["energyratestructure"][rate_structure]
-                if "adj" in rate_data[-1]:
-                    return rate_data[-1]["adj"]
-            adj_data = self._data["energyratestructure"][rate_structure][0]
-            if "adj" in adj_data:
-                adj = adj_data["adj"]
-            return adj
+            return self._energy_adjustment(rate_structure)
         return None
 
+    def _energy_adjustment(self, rate_structure: int) -> float | None:
+        """Return the energy adjustment of a structure."""
+        assert self._data is not None
+        adj = None
+        if self._reading:
+            rate_data = self._data["energyratestructure"][rate_structure]
+            if "adj" in rate_data[-1]:
+                return rate_data[-1]["adj"]
+        adj_data = self._data["energyratestructure"][rate_structure][0]
+        if "adj" in adj_data:
+            adj = adj_data["adj"]
+        return adj
+
     @property
     def monthly_tier_rate(self) -> float | None:
         """Return tier rate.
 
         Requires the monthy accumulative meter reading.
         """
-        return self.tier_rate_for_month(datetime.datetime.today())
+        return self._current("monthly_tier_rate", self.tier_rate_for_month)
 
     def tier_rate_for_month(self, date: datetime.datetime) -> float | None:
         """Return tier rate for a specific month.
@@ -362,15 +740,20 @@ class Rates:
         assert self._data is not None
         rate_structure = self.rate_structure(date, "energy")
         if rate_structure is not None:
-            if self._reading:
-                value = float(self._reading)
-                rate_data = self._data["energyratestructure"][rate_structure]
-                for rate in rate_data:
-                    if "max" in rate and value < (rate["max"] * 29):
-                        return rate["rate"]
-                    continue
-                return rate_data[-1]["rate"]
-            return None
+            return self._tier_rate(rate_structure)
+        return None
+
+    def _tier_rate(self, rate_structure: int) -> float | None:
+        """Return the monthly tier rate of a structure for the meter reading."""
+        assert self._data is not None
+        if self._reading:
+            value = float(self._reading)
+            rate_data = self._data["energyratestructure"][rate_structure]
+            for rate in rate_data:
+                if "max" in rate and value < (rate["max"] * 29):
+                    return rate["rate"]
+                continue
+            return rate_data[-1]["rate"]
         return None
 
     @property
@@ -392,35 +775,45 @@ class Rates:
     @property
     def current_demand_rate(self) -> float | None:
         """Return the current rate."""
-        return self.demand_rate(datetime.datetime.today())
+        return self._current("current_demand_rate", self.demand_rate)
 
     def demand_rate(self, date: datetime.datetime) -> float | None:
         """Return the rate for a specific date."""
         assert self._data is not None
         rate_structure = self.rate_structure(date, "demand")
         if rate_structure is not None:
-            rate = self._data["demandratestructure"][rate_structure][0]["rate"]
-            return rate
+            return self._demand_rate(rate_structure)
         return None
 
+    def _demand_rate(self, rate_structure: int) -> float | None:
+        """Return the demand rate of a structure."""
+        assert self._data is not None
+        rate = self._data["demandratestructure"][rate_structure][0]["rate"]
+        return rate
+
     @property
     def current_demand_adjustment(self) -> float | None:
         """Return the current rate."""
-        return self.demand_adjustment(datetime.datetime.today())
+        return self._current("current_demand_adjustment", self.demand_adjustment)
 
     def demand_adjustment(self, date: datetime.datetime) -> float | None:
         """Return the rate for a specific date."""
         assert self._data is not None
         rate_structure = self.rate_structure(date, "demand")
         if rate_structure is not None:
-            adj = None
-
-            adj_data = self._data["demandratestructure"][rate_structure][0]
-            if "adj" in adj_data:
-                adj = adj_data["adj"]
-            return adj
+            return self._demand_adjustment(rate_structure)
         return None
 
+    def _demand_adjustment(self, rate_structure: int) -> float | None:
+        """Return the demand adjustment of a structure."""
+        assert self._data is not None
+        adj = None
+
+        adj_data = self._data["demandratestructure"][rate_structure][0]
+        if "adj" in adj_data:
+            adj = adj_data["adj"]
+        return adj
+
     @property
     def demand_unit(self) -> str | None:
         """Return the demand rate unit."""
@@ -471,15 +864,48 @@ class Rates:
     @property
     def current_sell_rate(self) -> float | None:
         """Return the current sell rate."""
-        return self.sell_rate(datetime.datetime.today())
+        return self._current("current_sell_rate", self.sell_rate)
 
     def sell_rate(self, date: datetime.datetime) -> float | None:
         """Return the rate for a specific date."""
         assert self._data is not None
         rate_structure = self.rate_structure(date, "energy")
         if rate_structure is not None:
-            try:
-                return self._data["energyratestructure"][rate_structure][0]["sell"]
-            except (KeyError, IndexError):
-                return None
+            return self._sell_rate(rate_structure)
         return None
+
+    def _sell_rate(self, rate_structure: int) -> float | None:
+        """Return the sell rate of a structure."""
+        assert self._data is not None
+        try:
+            return self._data["energyratestructure"][rate_structure][0]["sell"]
+        except (KeyError, IndexError):
+            return None
+
+    def snapshot(self, when: datetime.datetime | None = None) -> RateSnapshot:
+        """Return every current value for a moment in one pass.
+
+        The energy and demand structures are looked up once and shared by
+        all derived values. Defaults to now.
+        """
+        assert self._data is not None
+        if when is None:
+            when = datetime.datetime.today()
+        energy = self.rate_structure(when, "energy")
+        demand = self.rate_structure(when, "demand")
+        next_time, next_structure = self.next_rate_schedule(when, "energy")
+        return RateSnapshot(
+            when=when,
+            energy_rate_structure=energy,
+            rate=self._energy_rate(energy) if energy is not None else None,
+            adjustment=self._energy_adjustment(energy) if energy is not None else None,
+            monthly_tier_rate=self._tier_rate(energy) if energy is not None else None,
+            sell_rate=self._sell_rate(energy) if energy is not None else None,
+            next_energy_rate_structure=next_structure,
+            next_energy_rate_structure_time=next_time,
+            demand_rate_structure=demand,
+            demand_rate=self._demand_rate(demand) if demand is not None else None,
+            demand_adjustment=self._demand_adjustment(demand) if demand is not None else None,
+            mincharge=self.mincharge,
+            fixedchargefirstmeter=self.fixedchargefirstmeter,
+        )
@@ -1,8 +1,39 @@
 """Constants for python-openei."""
 
+ACCEPT_ENCODING = "gzip, deflate"
 BASE_URL = "https://api.openei.org/utility_rates"
+BREAKER_FAILURE_THRESHOLD = 5  # Failures in a row that open the circuit
+BREAKER_RESET_TIMEOUT = 60.0  # Seconds before an open circuit sends a probe
+BILL_CYCLE_DAY = 1  # Day of the month billing cycles start on
+DG_BUY_ALL_SELL_ALL = "Buy All Sell All"
+DG_NET_BILLING_HOURLY = "Net Billing Hourly"
+DG_NET_BILLING_INSTANTANEOUS = "Net Billing Instantaneous"
+DG_NET_METERING = "Net Metering"
+DEMAND_WINDOW_MINUTES = 15  # Default demand averaging window
+DEFAULT_TIMEOUT = 90  # Seconds allowed for a whole API request
 DEFAULT_HEADERS = {
     "Content-Type": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
+CACHE_EXPIRY = 86400  # Seconds before loaded data is considered stale
+ERROR_RATE_LIMIT = "You have exceeded your rate limit."
 ERROR_TIMEOUT = "Timeout while updating"
+HEDGE_BUDGET = 0.05  # Share of requests that may be duplicated by hedging
+HEDGE_MIN_DELAY = 0.05  # Shortest wait before sending a hedge, in seconds
+HEDGE_MIN_SAMPLES = 20  # Latencies observed before hedging starts
+HEDGE_PERCENTILE = 0.95  # Latency percentile that triggers a hedge
+HEDGE_WINDOW = 256  # Recent latencies kept to estimate the percentile
+GZIP_MAGIC = b"\x1f\x8b"
+LOOKUP_CONCURRENCY = 8  # Plan lookups in flight in lookup_many()
+LOOKUP_PRECISION = 3  # Decimals of lat/lon that must match to share a lookup
 MIN_CACHE_SIZE = 194  # Minimum size for a valid JSON cache file from OpenEI
+MIN_COMPRESSED_CACHE_SIZE = 64  # Minimum size for a compressed cache file
+PORTFOLIO_CHUNK_SIZE = 256  # Meters billed per worker task
+REFRESH_AHEAD = 3600  # Seconds before expiry to refresh in the background
+REFRESH_BACKOFF_MAX = 3600
+REFRESH_BACKOFF_MIN = 30
+SYNC_POOL_LIMIT = 100  # Connection pool size shared by all SyncRates objects
+VERSION_LIMIT = 50  # Most superseded versions followed by fetch_versions()
+VERSIONS_SUFFIX = ".versions"  # Cache file suffix for superseded plan versions
+WARM_UP_CONCURRENCY = 16  # Cache files read in parallel by warm_up()
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
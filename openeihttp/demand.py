@@ -0,0 +1,170 @@
+"""Monthly demand charges from interval data."""
+
+from __future__ import annotations
+
+import datetime
+from collections import deque
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import DEMAND_WINDOW_MINUTES
+from .export import _months
+from .tariff import CompiledTariff, IntervalData
+
+if TYPE_CHECKING:
+    from .client import Rates
+
+DEMAND_WINDOW = datetime.timedelta(minutes=DEMAND_WINDOW_MINUTES)
+
+
+class DemandCharges(NamedTuple):
+    """Represent the demand charges of one billing month."""
+
+    month: datetime.date
+    peaks: dict[int, float]
+    peak: float
+    tou_charge: float
+    flat_charge: float
+    total: float
+
+
+def tier_charge(ladder: Sequence[tuple[float, float, float, float]], demand: float) -> float:
+    """Return the charge for ``demand`` kW on a tier ladder, adjustments included."""
+    charge = 0.0
+    floor = 0.0
+    for limit, rate, adj, _ in ladder:
+        if demand <= floor:
+            break
+        charge += (min(demand, limit) - floor) * (rate + adj)
+        floor = limit
+    return charge
+
+
+def _month_charges(
+    tariff: CompiledTariff, month: datetime.date, peaks: dict[int, float], peak: float
+) -> DemandCharges:
+    """Price a month's peaks."""
+    tou = sum(tier_charge(tariff.demand_tiers[period], value) for period, value in peaks.items())
+    flat = 0.0
+    if tariff.flat_demand_months is not None:
+        structure = tariff.flat_demand_months[month.month - 1]
+        flat = tier_charge(tariff.flat_demand_tiers[structure], peak)
+    return DemandCharges(month, peaks, peak, tou, flat, tou + flat)
+
+
+def demand_charges(
+    tariff: CompiledTariff | Rates,
+    intervals: IntervalData,
+    window: datetime.timedelta = DEMAND_WINDOW,
+) -> list[DemandCharges]:
+    """Return the demand charges per calendar month.
+
+    Demand is the average kW over a window sliding one interval at a time;
+    the window must be a whole number of intervals and covers a single
+    interval when it is shorter than one. Only full windows count, each
+    toward the demand period and month of its last interval. Peaks are
+    tracked per TOU demand period and, for flat demand, across the whole
+    month. Demand rates must be per kW; other units raise ValueError.
+    """
+    tariff, size = _prepare(tariff, intervals, window)
+    return list(_demand_charges(tariff, intervals, size))
+
+
+def demand_charges_numpy(
+    tariff: CompiledTariff | Rates,
+    intervals: IntervalData,
+    window: datetime.timedelta = DEMAND_WINDOW,
+) -> list[DemandCharges]:
+    """Return the same demand charges as ``demand_charges()``, computed with NumPy.
+
+    Window sums come from a cumulative sum and the peaks per month and
+    demand period from grouped maxima, so only the monthly pricing runs in
+    Python. ``intervals.values`` may be a NumPy array.
+    """
+    try:
+        import numpy as np
+    except ImportError as err:
+        raise ImportError(
+            "demand_charges_numpy() needs numpy: pip install python-openei[numpy]"
+        ) from err
+
+    tariff, size = _prepare(tariff, intervals, window)
+    values = np.asarray(intervals.values, dtype=np.float64)
+    if not len(values):
+        return []
+    _, index, months, segment = _months(intervals, len(values))
+    count = int(segment[-1]) + 1
+    # Average kW of each full window, placed at its last interval
+    sums = np.concatenate(([0.0], np.cumsum(values)))
+    demand = (sums[size:] - sums[:-size]) / (size * intervals.step.total_seconds() / 3600)
+    segment = segment[size - 1 :]
+    peak = np.zeros(count)
+    np.maximum.at(peak, segment, demand)
+    period_peaks: list[list[float]] = [[]] * count
+    if tariff.demand_table is not None and len(demand):
+        period = np.asarray(tariff.demand_table, dtype=np.int64)[index[size - 1 :]]
+        periods = int(period.max()) + 1
+        by_period = np.zeros(count * periods)
+        np.maximum.at(by_period, segment * periods + period, demand)
+        period_peaks = by_period.reshape(count, periods).tolist()
+    charges = []
+    for month, month_peak, row in zip(months.tolist(), peak.tolist(), period_peaks):
+        peaks = {period: value for period, value in enumerate(row) if value > 0}
+        year, month_index = divmod(month, 12)
+        start = datetime.date(1970 + year, month_index + 1, 1)
+        charges.append(_month_charges(tariff, start, peaks, month_peak))
+    return charges
+
+
+def _prepare(
+    tariff: CompiledTariff | Rates, intervals: IntervalData, window: datetime.timedelta
+) -> tuple[CompiledTariff, int]:
+    """Compile the tariff, validate it and the window, and return the window in intervals."""
+    tariff = CompiledTariff.coerce(tariff)
+    if tariff.demand_unit not in (None, "kW") and (tariff.demand_tiers or tariff.flat_demand_tiers):
+        raise ValueError(f"Unsupported demand unit {tariff.demand_unit}")
+    if window % intervals.step and window > intervals.step:
+        raise ValueError("Demand window must be a multiple of the interval length")
+    return tariff, max(1, window // intervals.step)
+
+
+def _demand_charges(
+    tariff: CompiledTariff, intervals: IntervalData, size: int
+) -> Iterator[DemandCharges]:
+    """Yield one DemandCharges per month covered by the readings."""
+    table = tariff.demand_table
+    hours = intervals.step.total_seconds() / 3600
+    recent: deque[float] = deque()
+    total = 0.0
+    when = intervals.start
+    month: datetime.date | None = None
+    peaks: dict[int, float] = {}
+    peak = 0.0
+    base = 0
+    day = -1
+    for kwh in intervals.values:
+        if month is None or when.month != month.month or when.year != month.year:
+            if month is not None:
+                yield _month_charges(tariff, month, peaks, peak)
+            month = datetime.date(when.year, when.month, 1)
+            peaks = {}
+            peak = 0.0
+            day = -1
+        recent.append(kwh)
+        total += kwh
+        if len(recent) > size:
+            total -= recent.popleft()
+        if len(recent) == size:
+            demand = total / (size * hours)
+            if demand > peak:
+                peak = demand
+            if table is not None:
+                if when.day != day:
+                    day = when.day
+                    base = ((12 if when.weekday() > 4 else 0) + when.month - 1) * 24
+                period = table[base + when.hour]
+                if demand > peaks.get(period, 0.0):
+                    peaks[period] = demand
+        when += intervals.step
+    if month is not None:
+        yield _month_charges(tariff, month, peaks, peak)
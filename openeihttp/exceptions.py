@@ -17,5 +17,9 @@ class RateLimit(Exception):
     """Exception for API errors."""
 
 
+class CircuitOpen(APIError):
+    """Exception for requests rejected while the circuit breaker is open."""
+
+
 class InvalidCall(Exception):
     """Exception for invalid library calls."""
@@ -0,0 +1,157 @@
+"""Export a plan's price timeline as columns for analytics tools."""
+
+from __future__ import annotations
+
+import datetime
+import os
+from typing import TYPE_CHECKING, Any
+
+from .tariff import HOUR, CompiledTariff, IntervalData
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+    from .client import Rates
+
+COLUMNS = ("timestamp", "structure", "rate", "adj", "sell")
+
+
+def _steps(start: datetime.datetime, end: datetime.datetime, step: datetime.timedelta) -> int:
+    """Return the number of intervals from start up to, not including, end."""
+    if step <= datetime.timedelta(0) or step % datetime.timedelta(seconds=1):
+        raise ValueError("step must be a positive whole number of seconds")
+    return max(0, -((start - end) // step))
+
+
+def _timeline(
+    start: datetime.datetime, count: int, step: datetime.timedelta
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return interval start times and their indexes into the compiled schedule tables."""
+    import numpy as np
+
+    seconds = np.timedelta64(int(step.total_seconds()), "s")
+    timestamps = np.datetime64(start, "s") + np.arange(count) * seconds
+    days = timestamps.astype("M8[D]")
+    hour = (timestamps - days) // np.timedelta64(1, "h")
+    month = timestamps.astype("M8[M]").astype(np.int64) % 12
+    # 1970-01-01 was a Thursday; Monday is 0 as in datetime.weekday()
+    weekend = (days.astype(np.int64) + 3) % 7 > 4
+    return timestamps, (weekend * 12 + month) * 24 + hour
+
+
+def _segments(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return where each run of equal keys starts and the run number of every key."""
+    import numpy as np
+
+    starts = np.flatnonzero(np.diff(keys)) + 1
+    segment = np.zeros(len(keys), dtype=np.int64)
+    segment[starts] = 1
+    return np.concatenate(([0], starts)).astype(np.int64), np.cumsum(segment)
+
+
+def _months(
+    intervals: IntervalData, count: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the timeline, schedule indexes, months covered and each reading's month.
+
+    Months are counted from 1970-01 and listed once each, in order.
+    """
+    import numpy as np
+
+    timestamps, index = _timeline(intervals.start, count, intervals.step)
+    month = timestamps.astype("M8[M]").astype(np.int64)
+    starts, segment = _segments(month)
+    return timestamps, index, month[starts], segment
+
+
+def _tier0(tariff: CompiledTariff, field: int) -> list[float]:
+    """Return one tier-0 value per energy rate structure."""
+    return [ladder[0][field] for ladder in tariff.energy_tiers]
+
+
+def price_table(
+    tariff: CompiledTariff | Rates,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step: datetime.timedelta = HOUR,
+) -> dict[str, list[Any]]:
+    """Return the tier-0 price timeline from start to end as lists.
+
+    Columns are the interval start, energy rate structure, rate, adj and
+    sell; missing adjustments and sell rates are 0.
+    """
+    tariff = CompiledTariff.coerce(tariff)
+    rates, adjs, sells = _tier0(tariff, 1), _tier0(tariff, 2), _tier0(tariff, 3)
+    table: dict[str, list[Any]] = {column: [] for column in COLUMNS}
+    when = start
+    for _ in range(_steps(start, end, step)):
+        structure = tariff.energy_period(when)
+        table["timestamp"].append(when)
+        table["structure"].append(structure)
+        table["rate"].append(rates[structure])
+        table["adj"].append(adjs[structure])
+        table["sell"].append(sells[structure])
+        when += step
+    return table
+
+
+def to_numpy(
+    tariff: CompiledTariff | Rates,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step: datetime.timedelta = HOUR,
+) -> dict[str, np.ndarray]:
+    """Return the price timeline as NumPy arrays.
+
+    Timestamps are naive ``datetime64[s]`` in the tariff's local time. The
+    whole timeline is computed with array operations on the compiled tables.
+    """
+    try:
+        import numpy as np
+    except ImportError as err:
+        raise ImportError("to_numpy() needs numpy: pip install python-openei[numpy]") from err
+
+    tariff = CompiledTariff.coerce(tariff)
+    timestamps, index = _timeline(start, _steps(start, end, step), step)
+    structure = np.asarray(tariff.energy_table, dtype=np.int32)[index]
+    return {
+        "timestamp": timestamps,
+        "structure": structure,
+        "rate": np.asarray(_tier0(tariff, 1))[structure],
+        "adj": np.asarray(_tier0(tariff, 2))[structure],
+        "sell": np.asarray(_tier0(tariff, 3))[structure],
+    }
+
+
+def to_arrow(
+    tariff: CompiledTariff | Rates,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step: datetime.timedelta = HOUR,
+) -> pa.Table:
+    """Return the price timeline as an Arrow table.
+
+    The columns wrap the NumPy arrays from ``to_numpy()`` without copying.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as err:
+        raise ImportError("to_arrow() needs pyarrow: pip install python-openei[arrow]") from err
+
+    arrays = to_numpy(tariff, start, end, step)
+    return pa.Table.from_arrays([pa.array(arrays[name]) for name in COLUMNS], names=COLUMNS)
+
+
+def to_parquet(
+    path: str | os.PathLike[str],
+    tariff: CompiledTariff | Rates,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step: datetime.timedelta = HOUR,
+) -> None:
+    """Write the price timeline to a Parquet file."""
+    table = to_arrow(tariff, start, end, step)
+    import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+    pq.write_table(table, path)
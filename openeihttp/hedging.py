@@ -0,0 +1,127 @@
+"""Hedged OpenEI API requests."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable
+from typing import Callable, TypeVar
+
+from .const import (
+    HEDGE_BUDGET,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+    HEDGE_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Recompute the percentile after this many new latencies
+_REFRESH = 16
+
+
+class Hedger:
+    """Send a second copy of a slow request and keep the first to finish.
+
+    Latencies of recent requests are kept in a sliding window. Once
+    ``min_samples`` have been seen, a request still running after the
+    ``percentile`` latency (but at least ``min_delay`` seconds) is sent again
+    and whichever copy finishes first wins; the other is cancelled. Every
+    request earns ``budget`` hedge tokens and each hedge spends one, so at
+    most that share of requests is duplicated and the API rate limit is
+    respected. Pass one instance to several Rates objects to share it.
+    """
+
+    def __init__(
+        self,
+        budget: float = HEDGE_BUDGET,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY,
+        window: int = HEDGE_WINDOW,
+    ) -> None:
+        """Initialize."""
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.budget = budget
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.min_delay = min_delay
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._tokens = 0.0
+        self._max_tokens = max(1.0, budget * _REFRESH)
+        self._delay: float | None = None
+        self._pending = 0
+
+    @property
+    def delay(self) -> float | None:
+        """Return the wait before a hedge is sent, or None until enough samples."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        if self._delay is None or self._pending >= _REFRESH:
+            ordered = sorted(self._latencies)
+            position = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+            self._delay = max(self.min_delay, ordered[position])
+            self._pending = 0
+        return self._delay
+
+    def record(self, latency: float) -> None:
+        """Add the latency of a completed request."""
+        self._latencies.append(latency)
+        self._pending += 1
+
+    def _spend(self) -> bool:
+        """Return True and spend a token if the budget allows a hedge."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call()``, sending a second copy if the first is slow.
+
+        The first copy to finish decides the outcome, including exceptions.
+        """
+        import asyncio
+
+        self._tokens = min(self._max_tokens, self._tokens + self.budget)
+        delay = self.delay
+        start = time.perf_counter()
+        if delay is None:
+            result = await call()
+            self.record(time.perf_counter() - start)
+            return result
+
+        first: asyncio.Future[T] = asyncio.ensure_future(call())
+        tasks = [first]
+        started = {first: start}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._spend():
+                self.hedges += 1
+                _LOGGER.debug("Request slower than %.3fs, sending a hedge.", delay)
+                second: asyncio.Future[T] = asyncio.ensure_future(call())
+                tasks.append(second)
+                started[second] = time.perf_counter()
+            if not done:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            winner = first if first in done else done.pop()
+            if winner is not first:
+                self.hedge_wins += 1
+            self.record(time.perf_counter() - started[winner])
+            return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Retrieved so the losing copy is not logged
@@ -0,0 +1,95 @@
+"""Instrumentation hooks for python-openei."""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+
+
+class Metrics:
+    """Receive instrumentation callbacks.
+
+    Every hook is a no-op; subclass and override the ones you need. Pass an
+    instance as ``metrics=`` to Rates. When no instance is given the client
+    skips all timing and hook calls.
+    """
+
+    def record_request(self, latency: float, status: int | None, nbytes: int) -> None:
+        """Record an API request; status is None when it timed out."""
+
+    def record_json_parse(self, seconds: float) -> None:
+        """Record the time spent decoding a JSON response."""
+
+    def record_cache_hit(self) -> None:
+        """Record data served from the cache file."""
+
+    def record_cache_miss(self) -> None:
+        """Record a missing cache file that required an API fetch."""
+
+    def record_cache_stale(self) -> None:
+        """Record loaded data that expired and required an API fetch."""
+
+    def record_cache_read(self, seconds: float) -> None:
+        """Record the time spent reading and decoding the cache file."""
+
+    def record_cache_write(self, seconds: float) -> None:
+        """Record the time spent writing the cache file."""
+
+    def record_rate_limit(self) -> None:
+        """Record a rate-limit reply from the API."""
+
+    def record_circuit_open(self) -> None:
+        """Record a request rejected by an open circuit breaker."""
+
+
+class MetricsCollector(Metrics):
+    """Keep counters and histograms in memory.
+
+    Each histogram keeps only the latest ``max_samples`` values, so memory
+    stays bounded in long-running processes.
+    """
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        """Initialize."""
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.histograms: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=max_samples)
+        )
+
+    def record_request(self, latency: float, status: int | None, nbytes: int) -> None:
+        """Count the request by status and record its latency and size."""
+        self.counters["requests"] += 1
+        self.counters[f"status_{status if status is not None else 'timeout'}"] += 1
+        self.histograms["request_latency"].append(latency)
+        self.histograms["response_bytes"].append(float(nbytes))
+
+    def record_json_parse(self, seconds: float) -> None:
+        """Record JSON parse time."""
+        self.histograms["json_parse"].append(seconds)
+
+    def record_cache_hit(self) -> None:
+        """Count a cache hit."""
+        self.counters["cache_hit"] += 1
+
+    def record_cache_miss(self) -> None:
+        """Count a cache miss."""
+        self.counters["cache_miss"] += 1
+
+    def record_cache_stale(self) -> None:
+        """Count a stale read."""
+        self.counters["cache_stale"] += 1
+
+    def record_cache_read(self, seconds: float) -> None:
+        """Record cache read time."""
+        self.histograms["cache_read"].append(seconds)
+
+    def record_cache_write(self, seconds: float) -> None:
+        """Record cache write time."""
+        self.histograms["cache_write"].append(seconds)
+
+    def record_rate_limit(self) -> None:
+        """Count a rate-limit event."""
+        self.counters["rate_limit"] += 1
+
+    def record_circuit_open(self) -> None:
+        """Count a rejected request."""
+        self.counters["circuit_open"] += 1
@@ -0,0 +1,288 @@
+"""Net-metering and export credits for customers with generation."""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import (
+    DG_BUY_ALL_SELL_ALL,
+    DG_NET_BILLING_HOURLY,
+    DG_NET_BILLING_INSTANTANEOUS,
+    DG_NET_METERING,
+)
+from .export import _months, _segments
+from .tariff import INFINITY, CompiledTariff, IntervalData
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .client import Rates
+
+RULES = (DG_NET_METERING, DG_NET_BILLING_INSTANTANEOUS, DG_NET_BILLING_HOURLY, DG_BUY_ALL_SELL_ALL)
+
+
+class NetMonth(NamedTuple):
+    """Represent one billing month of a customer with generation."""
+
+    month: datetime.date
+    imported: float
+    exported: float
+    energy_charge: float
+    export_credit: float
+    fixed_charge: float
+    carryover: float
+    total: float
+
+
+class NetSettlement(NamedTuple):
+    """Represent the months up to and including an annual true-up."""
+
+    rule: str
+    months: tuple[NetMonth, ...]
+    surplus_kwh: float
+    settlement_credit: float
+    forfeited_credit: float
+    total: float
+
+
+class _Month:
+    """Accumulate one month of imports, exports, charges and credits."""
+
+    __slots__ = ("month", "days", "used", "imported", "exported", "charge", "credit", "nets")
+
+    def __init__(self, when: datetime.datetime) -> None:
+        """Initialize."""
+        self.month = datetime.date(when.year, when.month, 1)
+        self.days = calendar.monthrange(when.year, when.month)[1]
+        self.used = self.imported = self.exported = self.charge = self.credit = 0.0
+        self.nets: dict[int, float] = {}
+
+    def buy(self, tariff: CompiledTariff, period: int, kwh: float) -> None:
+        """Charge imported energy at retail, continuing the month's tiers."""
+        energy, adjustment = tariff.price(period, self.used, kwh, self.days)
+        self.charge += energy + adjustment
+        self.used += kwh
+
+
+def net_metering(
+    tariff: CompiledTariff | Rates,
+    imports: IntervalData,
+    exports: Sequence[float],
+    rule: str | None = None,
+) -> NetSettlement:
+    """Settle import and export readings under a distributed generation rule.
+
+    ``exports`` lines up with ``imports.values``. ``rule`` defaults to the
+    plan's ``dgrules``:
+
+    * Net Metering: each month, imports and exports are netted per energy
+      period. Net use is billed at retail and net export is credited at the
+      period's tier-0 retail rate.
+    * Net Billing Hourly: readings are netted per clock hour, and the net
+      export is credited at the period's sell rate.
+    * Net Billing Instantaneous and Buy All Sell All: imports are billed at
+      retail and exports are credited at the sell rate, with no netting.
+
+    Credits beyond a month's energy charges carry over to later months.
+    Whatever is left at the end is treated as forfeited at the true-up.
+    Under Net Metering, an annual net surplus is paid at the export-weighted
+    average sell rate.
+    """
+    tariff, rule = _prepare(tariff, imports, exports, rule)
+    retail = [ladder[0][1] + ladder[0][2] for ladder in tariff.energy_tiers]
+    sell = [ladder[0][3] for ladder in tariff.energy_tiers]
+    months: list[_Month] = []
+    current: _Month | None = None
+    hour_key: tuple[datetime.date, int] | None = None
+    hour_period = 0
+    hour_net = 0.0
+    sell_value = 0.0
+    when = imports.start
+
+    def flush_hour(month: _Month) -> None:
+        if hour_net > 0:
+            month.buy(tariff, hour_period, hour_net)
+        else:
+            month.credit -= hour_net * sell[hour_period]
+
+    for bought, sold in zip(imports.values, exports):
+        if current is None or when.month != current.month.month or when.year != current.month.year:
+            if current is not None and hour_key is not None:
+                flush_hour(current)
+                hour_key, hour_net = None, 0.0
+            current = _Month(when)
+            months.append(current)
+        period = tariff.energy_period(when)
+        current.imported += bought
+        current.exported += sold
+        sell_value += sold * sell[period]
+        if rule == DG_NET_METERING:
+            current.nets[period] = current.nets.get(period, 0.0) + bought - sold
+        elif rule == DG_NET_BILLING_HOURLY:
+            key = (when.date(), when.hour)
+            if key != hour_key:
+                if hour_key is not None:
+                    flush_hour(current)
+                hour_key, hour_period, hour_net = key, period, 0.0
+            hour_net += bought - sold
+        else:
+            if bought:
+                current.buy(tariff, period, bought)
+            current.credit += sold * sell[period]
+        when += imports.step
+    if current is not None and hour_key is not None:
+        flush_hour(current)
+
+    for month in months:
+        for period, net in sorted(month.nets.items()):
+            if net > 0:
+                month.buy(tariff, period, net)
+            else:
+                month.credit -= net * retail[period]
+    return _settle(tariff, rule, months, sell_value)
+
+
+def net_metering_numpy(
+    tariff: CompiledTariff | Rates,
+    imports: IntervalData,
+    exports: Sequence[float],
+    rule: str | None = None,
+) -> NetSettlement:
+    """Return the same settlement as ``net_metering()``, computed with NumPy.
+
+    Readings are grouped per month, energy period or clock hour with array
+    sums, and tiered retail charges come from each ladder's cumulative cost
+    curve, so only the monthly settlement runs in Python. ``imports.values``
+    and ``exports`` may be NumPy arrays.
+    """
+    try:
+        import numpy as np
+    except ImportError as err:
+        raise ImportError(
+            "net_metering_numpy() needs numpy: pip install python-openei[numpy]"
+        ) from err
+
+    tariff, rule = _prepare(tariff, imports, exports, rule)
+    bought = np.asarray(imports.values, dtype=np.float64)
+    sold = np.asarray(exports, dtype=np.float64)
+    if not len(bought):
+        return _settle(tariff, rule, [], 0.0)
+    timestamps, index, covered, segment = _months(imports, len(bought))
+    count = len(covered)
+    period = np.asarray(tariff.energy_table, dtype=np.int64)[index]
+    retail = np.asarray([ladder[0][1] + ladder[0][2] for ladder in tariff.energy_tiers])
+    sell = np.asarray([ladder[0][3] for ladder in tariff.energy_tiers])
+    months = []
+    for month in covered.tolist():
+        year, month_index = divmod(month, 12)
+        months.append(_Month(datetime.datetime(1970 + year, month_index + 1, 1)))
+    imported = np.bincount(segment, bought, count).tolist()
+    exported = np.bincount(segment, sold, count).tolist()
+
+    # Energy bought at retail as (month, period, kWh), in the order it is billed
+    if rule == DG_NET_METERING:
+        periods = len(tariff.energy_tiers)
+        nets: np.ndarray = np.bincount(segment * periods + period, bought - sold, count * periods)
+        key = np.arange(count * periods)
+        buy_month, buy_period = key // periods, key % periods
+        credit = np.where(nets < 0, -nets * retail[buy_period], 0.0)
+        taken = nets > 0
+    elif rule == DG_NET_BILLING_HOURLY:
+        starts, hour = _segments(timestamps.astype("M8[h]").astype(np.int64))
+        nets = np.bincount(hour, bought - sold)
+        buy_month, buy_period = segment[starts], period[starts]
+        credit = np.where(nets < 0, -nets * sell[buy_period], 0.0)
+        taken = nets > 0
+    else:
+        nets, buy_month, buy_period = bought, segment, period
+        credit = sold * sell[period]
+        taken = nets != 0
+    credits = np.bincount(buy_month, credit, count).tolist()
+    kwh, buy_month, buy_period = nets[taken], buy_month[taken], buy_period[taken]
+    used = np.bincount(buy_month, kwh, count)
+    # Energy already used in the month before each purchase
+    before = np.cumsum(kwh) - kwh - (np.cumsum(used) - used)[buy_month]
+    days = np.asarray([month.days for month in months])
+    charge = np.zeros(len(kwh))
+    for number, ladder in enumerate(tariff.energy_tiers):
+        rows = buy_period == number
+        scale = days[buy_month[rows]] if tariff.energy_daily[number] else 1
+        charge[rows] = scale * (
+            _ladder_cost(ladder, (before[rows] + kwh[rows]) / scale)
+            - _ladder_cost(ladder, before[rows] / scale)
+        )
+    charges = np.bincount(buy_month, charge, count).tolist()
+
+    for month, *totals in zip(months, imported, exported, used.tolist(), charges, credits):
+        month.imported, month.exported, month.used, month.charge, month.credit = totals
+    return _settle(tariff, rule, months, float(np.dot(sold, sell[period])))
+
+
+def _ladder_cost(
+    ladder: Sequence[tuple[float, float, float, float]], kwh: np.ndarray
+) -> np.ndarray:
+    """Return the rate plus adjustment charge for the first ``kwh`` of a month on one ladder.
+
+    Energy past the last finite tier limit is priced at the last tier, as in
+    ``CompiledTariff.price()``.
+    """
+    import numpy as np
+
+    limits = [0.0] + [limit for limit, _, _, _ in ladder if limit != INFINITY]
+    cost = [0.0]
+    for (_, rate, adj, _), (low, high) in zip(ladder, zip(limits, limits[1:])):
+        cost.append(cost[-1] + (high - low) * (rate + adj))
+    _, rate, adj, _ = ladder[-1]
+    return np.interp(kwh, limits, cost) + np.maximum(kwh - limits[-1], 0.0) * (rate + adj)
+
+
+def _prepare(
+    tariff: CompiledTariff | Rates,
+    imports: IntervalData,
+    exports: Sequence[float],
+    rule: str | None,
+) -> tuple[CompiledTariff, str]:
+    """Compile the tariff and validate the rule and readings."""
+    tariff = CompiledTariff.coerce(tariff)
+    rule = rule or tariff.dgrules
+    if rule not in RULES:
+        raise ValueError(f"Unsupported distributed generation rule: {rule}")
+    if len(exports) != len(imports.values):
+        raise ValueError("Import and export readings must have the same length")
+    return tariff, rule
+
+
+def _settle(
+    tariff: CompiledTariff, rule: str, months: list[_Month], sell_value: float
+) -> NetSettlement:
+    """Carry credits across the priced months and settle the true-up."""
+    bank = 0.0
+    results = []
+    for month in months:
+        due = month.charge - month.credit - bank
+        bank = max(0.0, -due)
+        bill = tariff.month_bill(month.month, month.used, max(0.0, due), 0.0, month.days)
+        results.append(
+            NetMonth(
+                month.month,
+                month.imported,
+                month.exported,
+                month.charge,
+                month.credit,
+                bill.fixed_charge,
+                bank,
+                bill.total,
+            )
+        )
+
+    imported = sum(month.imported for month in months)
+    exported = sum(month.exported for month in months)
+    surplus = max(0.0, exported - imported)
+    settlement = 0.0
+    if rule == DG_NET_METERING and exported:
+        settlement = surplus * sell_value / exported
+    total = sum(month.total for month in results) - settlement
+    return NetSettlement(rule, tuple(results), surplus, settlement, bank, total)
@@ -0,0 +1,93 @@
+"""Bill many meters against their plans in a process pool."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .const import PORTFOLIO_CHUNK_SIZE
+from .shared import SharedTariffs
+from .tariff import CompiledTariff, IntervalData, MonthBill
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from .client import Rates
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tariffs of the current worker process, set once by the pool initializer
+_TARIFFS: Mapping[str, CompiledTariff] = {}
+
+
+class Bill(NamedTuple):
+    """Represent the bills of one meter."""
+
+    meter: Any
+    plan: str
+    months: tuple[MonthBill, ...]
+    total: float
+
+
+def _init_worker(tariffs: Mapping[str, CompiledTariff]) -> None:
+    """Receive the compiled tariffs, or attach to shared ones, once per worker."""
+    global _TARIFFS
+    _TARIFFS = tariffs
+
+
+def _bill_chunk(plan: str, chunk: list[tuple[Any, IntervalData]]) -> list[Bill]:
+    """Bill a chunk of meters that share one plan."""
+    tariff = _TARIFFS[plan]
+    bills = []
+    for meter, intervals in chunk:
+        months = tuple(tariff.bill(intervals))
+        bills.append(Bill(meter, plan, months, sum(month.total for month in months)))
+    return bills
+
+
+def bill_portfolio(
+    meters: Iterable[tuple[Any, str, IntervalData]],
+    tariffs: Mapping[str, CompiledTariff | Rates],
+    max_workers: int | None = None,
+    chunk_size: int = PORTFOLIO_CHUNK_SIZE,
+    mp_context: BaseContext | None = None,
+) -> Iterator[Bill]:
+    """Bill (meter, plan id, interval data) triples and yield results as they finish.
+
+    Meters are grouped by plan and billed in chunks of ``chunk_size``. Each
+    worker receives the compiled tariffs once, when it starts, so tasks only
+    carry meter ids and readings. ``tariffs`` maps plan ids to compiled
+    tariffs or to Rates objects with loaded data. Pass a SharedTariffs to
+    have workers attach to its block instead of each receiving a copy.
+    Results arrive in completion order, not input order.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    groups: dict[str, list[tuple[Any, IntervalData]]] = {}
+    for meter, plan, intervals in meters:
+        if plan not in tariffs:
+            raise ValueError(f"No tariff for plan {plan}")
+        groups.setdefault(plan, []).append((meter, intervals))
+    if not groups:
+        return
+
+    compiled: Mapping[str, CompiledTariff]
+    if isinstance(tariffs, SharedTariffs):
+        compiled = tariffs
+    else:
+        compiled = {plan: CompiledTariff.coerce(tariffs[plan]) for plan in groups}
+    _LOGGER.debug("Billing %s meters on %s plans.", sum(map(len, groups.values())), len(groups))
+
+    with ProcessPoolExecutor(
+        max_workers, mp_context=mp_context, initializer=_init_worker, initargs=(compiled,)
+    ) as pool:
+        futures = [
+            pool.submit(_bill_chunk, plan, group[index : index + chunk_size])
+            for plan, group in groups.items()
+            for index in range(0, len(group), chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
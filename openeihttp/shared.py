@@ -0,0 +1,297 @@
+"""Compiled tariff tables in shared memory for worker processes."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from .tariff import CompiledTariff
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+    from .client import Rates
+
+_LOGGER = logging.getLogger(__name__)
+
+# Plan index length, then the start of the entries, floats and ints and the end
+_HEADER = struct.Struct("<5Q")
+
+# Scalar CompiledTariff fields kept in the metadata
+_FIELDS = (
+    "label",
+    "name",
+    "energy_daily",
+    "demand_unit",
+    "fixed_charge",
+    "fixed_units",
+    "min_charge",
+    "min_units",
+    "dgrules",
+)
+
+
+class _Ladder(Sequence[tuple[float, float, float, float]]):
+    """Read a tier ladder from flat (limit, rate, adj, sell) values."""
+
+    __slots__ = ("_values", "_start", "_count")
+
+    def __init__(self, values: memoryview[float], start: int, count: int) -> None:
+        """Initialize."""
+        self._values = values
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of tiers."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[float, float, float, float]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[tuple[float, float, float, float]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return one tier, or a list of tiers for a slice."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < self._count:
+            raise IndexError("tier index out of range")
+        values = self._values
+        base = self._start + index * 4
+        return values[base], values[base + 1], values[base + 2], values[base + 3]
+
+    def __iter__(self) -> Iterator[tuple[float, float, float, float]]:
+        """Iterate over the tiers."""
+        flat = iter(self._values[self._start : self._start + self._count * 4].tolist())
+        return zip(flat, flat, flat, flat)
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking over its cleanup."""
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    return shared_memory.SharedMemory(name)
+
+
+class SharedTariffs(Mapping[str, CompiledTariff]):
+    """Map plan ids to compiled tariffs stored in one shared memory block.
+
+    A loader process calls ``create()`` once; every worker attaches by name
+    and reads the schedule tables and tier ladders through read-only views
+    of the block, so they are stored once however many workers there are.
+    Identical schedules are stored once too. Tariffs returned here behave
+    like any CompiledTariff but cannot be pickled; pickle the
+    SharedTariffs instead, which reattaches by name.
+
+    The creator owns the block and should ``unlink()`` it, or use it as a
+    context manager, once no worker needs it. On Python < 3.13, workers
+    must be started by the creator (as multiprocessing and
+    ProcessPoolExecutor do) so they share its resource tracker; an
+    unrelated process that attaches would remove the block when it exits.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Attach to the block created under ``name``."""
+        self._attach(_open(name), owner=False)
+
+    def _attach(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        """Read the metadata and map the value regions."""
+        self._shm = shm
+        self._owner = owner
+        buf = shm.buf
+        assert buf is not None
+        length, self._entries, floats_start, ints_start, end = _HEADER.unpack_from(buf, 0)
+        self._plans: dict[str, list[int]] = json.loads(
+            bytes(buf[_HEADER.size : _HEADER.size + length])
+        )
+        view = buf[:end].toreadonly()
+        floats = view[floats_start:ints_start]
+        ints = view[ints_start:end]
+        self._floats = floats.cast("d")
+        self._ints = ints.cast("i")
+        self._views: list[memoryview[Any]] = [view, floats, ints, self._floats, self._ints]
+        self._tables: dict[tuple[int, int], memoryview[int]] = {}
+        self._tariffs: dict[str, CompiledTariff] = {}
+
+    @classmethod
+    def create(
+        cls, tariffs: Mapping[str, CompiledTariff | Rates], name: str | None = None
+    ) -> SharedTariffs:
+        """Compile ``tariffs`` into a new shared memory block.
+
+        ``tariffs`` maps plan ids to compiled tariffs or to Rates objects with
+        loaded data. ``name`` defaults to a random one; read it back from
+        ``name`` to hand to workers.
+        """
+        floats = array("d")
+        ints = array("i")
+        tables: dict[tuple[int, ...], int] = {}
+
+        def table(values: Sequence[int] | None) -> int | None:
+            if values is None:
+                return None
+            key = tuple(values)
+            if key not in tables:
+                tables[key] = len(ints)
+                ints.extend(key)
+            return tables[key]
+
+        def ladders(
+            tiers: Sequence[Sequence[tuple[float, float, float, float]]],
+        ) -> list[list[int]]:
+            spans = []
+            for ladder in tiers:
+                spans.append([len(floats), len(ladder)])
+                for tier in ladder:
+                    floats.extend(tier)
+            return spans
+
+        index = {}
+        entries = bytearray()
+        for plan, source in tariffs.items():
+            tariff = CompiledTariff.coerce(source)
+            entry = {field: getattr(tariff, field) for field in _FIELDS}
+            entry["energy_table"] = table(tariff.energy_table)
+            entry["demand_table"] = table(tariff.demand_table)
+            entry["flat_demand_months"] = [
+                table(tariff.flat_demand_months),
+                len(tariff.flat_demand_months or ()),
+            ]
+            entry["energy_tiers"] = ladders(tariff.energy_tiers)
+            entry["demand_tiers"] = ladders(tariff.demand_tiers)
+            entry["flat_demand_tiers"] = ladders(tariff.flat_demand_tiers)
+            encoded = json.dumps(entry, separators=(",", ":")).encode("utf-8")
+            index[plan] = [len(entries), len(encoded)]
+            entries += encoded
+
+        # Workers parse the plan index up front and each entry on first use
+        encoded = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        entries_start = _HEADER.size + len(encoded)
+        # Align the float region to 8 bytes
+        floats_start = -(-(entries_start + len(entries)) // 8) * 8
+        ints_start = floats_start + len(floats) * floats.itemsize
+        end = ints_start + len(ints) * ints.itemsize
+
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name, create=True, size=end)
+        buf = shm.buf
+        assert buf is not None
+        _HEADER.pack_into(buf, 0, len(encoded), entries_start, floats_start, ints_start, end)
+        buf[_HEADER.size : entries_start] = encoded
+        buf[entries_start : entries_start + len(entries)] = entries
+        buf[floats_start:ints_start] = floats.tobytes()
+        buf[ints_start:end] = ints.tobytes()
+        _LOGGER.debug(
+            "Shared %s tariffs in %s bytes as %s, %s distinct schedules.",
+            len(index),
+            end,
+            shm.name,
+            len(tables),
+        )
+        shared = cls.__new__(cls)
+        shared._attach(shm, owner=True)
+        return shared
+
+    @property
+    def name(self) -> str:
+        """Return the name workers attach with."""
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes used in the block."""
+        return self._views[0].nbytes
+
+    def __getitem__(self, plan: str) -> CompiledTariff:
+        """Return a compiled tariff reading from shared memory."""
+        tariff = self._tariffs.get(plan)
+        if tariff is None:
+            offset, length = self._plans[plan]
+            start = self._entries + offset
+            entry = json.loads(bytes(self._views[0][start : start + length]))
+            tariff = self._tariffs[plan] = self._view(entry)
+        return tariff
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over plan ids."""
+        return iter(self._plans)
+
+    def __len__(self) -> int:
+        """Return the number of tariffs."""
+        return len(self._plans)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by name so unpickling attaches to the same block."""
+        return SharedTariffs, (self.name,)
+
+    def _table(self, offset: int | None, length: int = 576) -> memoryview[int] | None:
+        """Return a view of an int table, shared by tariffs that use the same one."""
+        if offset is None:
+            return None
+        table = self._tables.get((offset, length))
+        if table is None:
+            table = self._tables[offset, length] = self._ints[offset : offset + length]
+            self._views.append(table)
+        return table
+
+    def _ladders(self, spans: list[list[int]]) -> tuple[_Ladder, ...]:
+        """Return tier ladders reading from the float region."""
+        return tuple(_Ladder(self._floats, offset, count) for offset, count in spans)
+
+    def _view(self, entry: dict[str, Any]) -> CompiledTariff:
+        """Build a CompiledTariff whose tables are views of the block."""
+        tariff = CompiledTariff.__new__(CompiledTariff)
+        for field in _FIELDS:
+            setattr(tariff, field, entry[field])
+        tariff.energy_daily = tuple(entry["energy_daily"])
+        energy_table = self._table(entry["energy_table"])
+        assert energy_table is not None
+        tariff.energy_table = energy_table
+        tariff.demand_table = self._table(entry["demand_table"])
+        tariff.flat_demand_months = self._table(*entry["flat_demand_months"])
+        tariff.energy_tiers = self._ladders(entry["energy_tiers"])
+        tariff.demand_tiers = self._ladders(entry["demand_tiers"])
+        tariff.flat_demand_tiers = self._ladders(entry["flat_demand_tiers"])
+        return tariff
+
+    def close(self) -> None:
+        """Detach from the block; tariffs handed out stop working."""
+        self._tariffs.clear()
+        self._tables.clear()
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._shm.close()
+
+    def __del__(self) -> None:
+        """Detach when collected, unless views are still exported."""
+        if getattr(self, "_views", None):
+            with contextlib.suppress(BufferError):
+                self.close()
+
+    def unlink(self) -> None:
+        """Remove the block once every process has closed it."""
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedTariffs:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the block, and remove it if this process created it."""
+        self.close()
+        if self._owner:
+            self.unlink()
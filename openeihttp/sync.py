@@ -0,0 +1,184 @@
+"""Synchronous facade for python-openei."""
+
+from __future__ import annotations
+
+import atexit
+import datetime
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .client import Rates
+from .const import DEFAULT_HEADERS, SYNC_POOL_LIMIT
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import aiohttp
+
+    from .tracing import RequestTracer
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class _LoopThread:
+    """Run one event loop and connection pool in a daemon thread.
+
+    Each tracer gets its own session so its trace config sees the requests;
+    all sessions share one connector.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._connector: aiohttp.TCPConnector | None = None
+        self._sessions: dict[RequestTracer | None, aiohttp.ClientSession] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop on first use."""
+        import asyncio
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="openeihttp-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                _LOGGER.debug("Started background event loop.")
+            return self._loop
+
+    async def session(self, tracer: RequestTracer | None = None) -> aiohttp.ClientSession:
+        """Return the shared session for ``tracer``, creating it on the loop thread."""
+        import aiohttp
+
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(limit=SYNC_POOL_LIMIT)
+            self._sessions = {}
+        session = self._sessions.get(tracer)
+        if session is None or session.closed:
+            session = self._sessions[tracer] = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                connector=self._connector,
+                connector_owner=False,
+                trace_configs=[tracer.trace_config] if tracer is not None else None,
+            )
+        return session
+
+    def run(self, coro: Coroutine[Any, Any, _T], timeout: float | None = None) -> _T:
+        """Run a coroutine on the background loop and wait for the result.
+
+        On timeout the coroutine is cancelled so it stops holding connections.
+        """
+        import asyncio
+        from concurrent.futures import TimeoutError as FutureTimeout
+
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Close the shared sessions and stop the loop."""
+        import asyncio
+
+        with self._lock:
+            loop, thread, connector = self._loop, self._thread, self._connector
+            sessions = list(self._sessions.values())
+            self._loop = self._thread = self._connector = None
+            self._sessions = {}
+        if loop is None or thread is None:
+            return
+        if connector is not None:
+            asyncio.run_coroutine_threadsafe(_close_pool(sessions, connector), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _reset_after_fork(self) -> None:
+        """Drop state inherited from the parent; its thread does not exist here."""
+        self._lock = threading.Lock()
+        self._loop = self._thread = self._connector = None
+        self._sessions = {}
+
+
+async def _close_pool(
+    sessions: list[aiohttp.ClientSession], connector: aiohttp.TCPConnector
+) -> None:
+    """Close the sessions, then the connector they share."""
+    for session in sessions:
+        await session.close()
+    await connector.close()
+
+
+_LOOP_THREAD = _LoopThread()
+atexit.register(_LOOP_THREAD.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_LOOP_THREAD._reset_after_fork)
+
+
+class SyncRates:
+    """Blocking wrapper around Rates for synchronous callers.
+
+    All instances in a process share one background event loop and one
+    connection pool, with one session per tracer. Properties and rate
+    lookups are read from the wrapped Rates object directly.
+    """
+
+    def __init__(self, *args: Any, call_timeout: float | None = None, **kwargs: Any) -> None:
+        """Initialize."""
+        self._rates = Rates(*args, **kwargs)
+        self._call_timeout = call_timeout
+        self._shared_session = self._rates._session is None
+
+    @property
+    def rates(self) -> Rates:
+        """Return the wrapped async Rates object."""
+        return self._rates
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped Rates object."""
+        if name == "_rates":
+            raise AttributeError(name)
+        return getattr(self._rates, name)
+
+    async def _with_session(self, coro_fn: Any) -> Any:
+        """Attach the shared session, then await the coroutine function."""
+        if self._shared_session:
+            self._rates._session = await _LOOP_THREAD.session(self._rates._tracer)
+        return await coro_fn()
+
+    def _call(self, coro_fn: Any) -> Any:
+        """Dispatch a Rates coroutine function onto the background loop."""
+        return _LOOP_THREAD.run(self._with_session(coro_fn), self._call_timeout)
+
+    def update(self) -> None:
+        """Update data only if we need to."""
+        self._call(self._rates.update)
+
+    def update_data(self) -> None:
+        """Update the data."""
+        self._call(self._rates.update_data)
+
+    def lookup_plans(self, effective_on: datetime.datetime | None = None) -> dict[str, Any]:
+        """Return the rate plan names per utility in the area."""
+        return self._call(lambda: self._rates.lookup_plans(effective_on))
+
+    def clear_cache(self) -> None:
+        """Clear cache file."""
+        self._call(self._rates.clear_cache)
+
+
+def shutdown() -> None:
+    """Close the shared session and stop the background loop."""
+    _LOOP_THREAD.close()
@@ -0,0 +1,249 @@
+"""Compiled, picklable tariff tables for bulk bill calculation."""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .exceptions import InvalidCall
+
+if TYPE_CHECKING:
+    from .client import Rates
+
+HOUR = datetime.timedelta(hours=1)
+INFINITY = float("inf")
+
+
+class IntervalData(NamedTuple):
+    """Represent evenly spaced meter readings.
+
+    ``values`` holds the energy used in each interval, in kWh, starting at
+    ``start`` in the tariff's local (naive) time.
+    """
+
+    start: datetime.datetime
+    values: Sequence[float]
+    step: datetime.timedelta = HOUR
+
+
+class MonthBill(NamedTuple):
+    """Represent the charges of one billing month."""
+
+    month: datetime.date
+    kwh: float
+    energy_charge: float
+    adjustment_charge: float
+    fixed_charge: float
+    total: float
+
+
+def _ladder(
+    tiers: list[dict[str, Any]],
+) -> tuple[tuple[tuple[float, float, float, float], ...], bool]:
+    """Return a tier ladder and whether its limits are daily.
+
+    Each tier is an (upper limit, rate, adjustment, sell rate) tuple.
+    """
+    ladder = tuple(
+        (
+            float(tier.get("max", INFINITY)),
+            float(tier.get("rate", 0.0)),
+            float(tier.get("adj", 0.0)),
+            float(tier.get("sell", 0.0)),
+        )
+        for tier in tiers
+    )
+    daily = any(tier.get("unit") == "kWh daily" for tier in tiers)
+    return ladder, daily
+
+
+def _table(weekday: list[list[int]], weekend: list[list[int]]) -> tuple[int, ...]:
+    """Flatten two 12x24 schedules into one (weekend, month, hour) table."""
+    return tuple(period for schedule in (weekday, weekend) for row in schedule for period in row)
+
+
+def _monthly(amount: Any, units: Any, days: int) -> float:
+    """Return a fixed or minimum charge for a month of ``days`` days."""
+    if not amount:
+        return 0.0
+    if units == "$/day":
+        return float(amount) * days
+    if units == "$/month":
+        return float(amount)
+    return 0.0
+
+
+class CompiledTariff:
+    """Hold a plan's schedules and tiers as flat tuples.
+
+    Lookups are plain index arithmetic, and instances pickle cheaply so they
+    can be shipped to worker processes.
+    """
+
+    __slots__ = (
+        "label",
+        "name",
+        "energy_table",
+        "energy_tiers",
+        "energy_daily",
+        "demand_table",
+        "demand_tiers",
+        "flat_demand_months",
+        "flat_demand_tiers",
+        "demand_unit",
+        "fixed_charge",
+        "fixed_units",
+        "min_charge",
+        "min_units",
+        "dgrules",
+    )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize."""
+        self.label: str = data.get("label", "")
+        self.name: str = data.get("name", "")
+        if "energyratestructure" not in data:
+            raise InvalidCall
+        self.energy_table: Sequence[int] = _table(
+            data["energyweekdayschedule"], data["energyweekendschedule"]
+        )
+        ladders = [_ladder(tiers) for tiers in data["energyratestructure"]]
+        self.energy_tiers: Sequence[Sequence[tuple[float, float, float, float]]] = tuple(
+            ladder for ladder, _ in ladders
+        )
+        self.energy_daily = tuple(daily for _, daily in ladders)
+        self.demand_table: Sequence[int] | None = None
+        self.demand_tiers: Sequence[Sequence[tuple[float, float, float, float]]] = tuple(
+            _ladder(tiers)[0] for tiers in data.get("demandratestructure", ())
+        )
+        if self.demand_tiers:
+            self.demand_table = _table(data["demandweekdayschedule"], data["demandweekendschedule"])
+        self.flat_demand_months: Sequence[int] | None = None
+        self.flat_demand_tiers: Sequence[Sequence[tuple[float, float, float, float]]] = tuple(
+            _ladder(tiers)[0] for tiers in data.get("flatdemandstructure", ())
+        )
+        if self.flat_demand_tiers:
+            self.flat_demand_months = tuple(data.get("flatdemandmonths", [0] * 12))
+        self.demand_unit: str | None = data.get("demandrateunit")
+        self.fixed_charge = data.get("fixedchargefirstmeter")
+        self.fixed_units = data.get("fixedchargeunits")
+        self.min_charge = data.get("mincharge")
+        self.min_units = data.get("minchargeunits")
+        self.dgrules: str | None = data.get("dgrules")
+
+    @classmethod
+    def from_rates(cls, rates: Rates) -> CompiledTariff:
+        """Compile the plan data a Rates object has loaded."""
+        if rates._data is None:
+            raise InvalidCall
+        return cls(rates._data)
+
+    @classmethod
+    def coerce(cls, tariff: CompiledTariff | Rates) -> CompiledTariff:
+        """Return a compiled tariff as is, or compile a Rates object's plan data."""
+        if isinstance(tariff, CompiledTariff):
+            return tariff
+        return cls.from_rates(tariff)
+
+    def energy_period(self, when: datetime.datetime) -> int:
+        """Return the energy rate structure in effect at ``when``."""
+        weekend = 12 if when.weekday() > 4 else 0
+        return self.energy_table[(weekend + when.month - 1) * 24 + when.hour]
+
+    def demand_period(self, when: datetime.datetime) -> int | None:
+        """Return the demand rate structure in effect at ``when``."""
+        if self.demand_table is None:
+            return None
+        weekend = 12 if when.weekday() > 4 else 0
+        return self.demand_table[(weekend + when.month - 1) * 24 + when.hour]
+
+    def tier(self, period: int, used: float, days: int) -> int:
+        """Return the index of the tier ``used`` kWh has reached in ``period``."""
+        ladder = self.energy_tiers[period]
+        scale = days if self.energy_daily[period] else 1
+        for index, (limit, _, _, _) in enumerate(ladder):
+            if used < limit * scale:
+                return index
+        return len(ladder) - 1
+
+    def price(self, period: int, used: float, kwh: float, days: int) -> tuple[float, float]:
+        """Return the (rate, adjustment) charges for ``kwh`` in ``period``.
+
+        ``used`` is the energy already used in the billing month; the
+        interval is split across tier limits from that point on.
+        """
+        ladder = self.energy_tiers[period]
+        if len(ladder) == 1:
+            _, rate, adj, _ = ladder[0]
+            return kwh * rate, kwh * adj
+        scale = days if self.energy_daily[period] else 1
+        energy = adjustment = 0.0
+        remaining = kwh
+        position = used
+        for limit, rate, adj, _ in ladder:
+            cap = limit * scale
+            if position < cap:
+                take = min(remaining, cap - position)
+                energy += take * rate
+                adjustment += take * adj
+                position += take
+                remaining -= take
+                if remaining <= 0:
+                    return energy, adjustment
+        _, rate, adj, _ = ladder[-1]
+        return energy + remaining * rate, adjustment + remaining * adj
+
+    def month_bill(
+        self,
+        month: datetime.date,
+        kwh: float,
+        energy: float,
+        adjustment: float,
+        days: int | None = None,
+    ) -> MonthBill:
+        """Return a month's bill from its accumulated energy charges.
+
+        ``days`` is the length of the billing period; it defaults to the
+        calendar month starting at ``month``.
+        """
+        if days is None:
+            days = calendar.monthrange(month.year, month.month)[1]
+        fixed = _monthly(self.fixed_charge, self.fixed_units, days)
+        total = max(energy + adjustment + fixed, _monthly(self.min_charge, self.min_units, days))
+        return MonthBill(month, kwh, energy, adjustment, fixed, total)
+
+    def bill(self, intervals: IntervalData) -> list[MonthBill]:
+        """Return the monthly bills for a run of interval readings."""
+        return list(self._bill(intervals))
+
+    def _bill(self, intervals: IntervalData) -> Iterator[MonthBill]:
+        """Yield one bill per calendar month covered by the readings."""
+        table = self.energy_table
+        price = self.price
+        when = intervals.start
+        step = intervals.step
+        month: datetime.date | None = None
+        days = 0
+        used = energy = adjustment = 0.0
+        base = 0
+        day = -1
+        for kwh in intervals.values:
+            if month is None or when.month != month.month or when.year != month.year:
+                if month is not None:
+                    yield self.month_bill(month, used, energy, adjustment, days)
+                month = datetime.date(when.year, when.month, 1)
+                days = calendar.monthrange(when.year, when.month)[1]
+                used = energy = adjustment = 0.0
+                day = -1
+            if when.day != day:
+                day = when.day
+                base = ((12 if when.weekday() > 4 else 0) + when.month - 1) * 24
+            charge, adj = price(table[base + when.hour], used, kwh, days)
+            energy += charge
+            adjustment += adj
+            used += kwh
+            when += step
+        if month is not None:
+            yield self.month_bill(month, used, energy, adjustment, days)
@@ -0,0 +1,215 @@
+"""Per-request phase tracing for python-openei."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import quote, quote_plus
+
+if TYPE_CHECKING:
+    import aiohttp
+
+REDACTED = "**REDACTED**"
+
+_CURRENT_SPAN: ContextVar[RequestSpan | None] = ContextVar("openeihttp_span", default=None)
+
+
+def _redact(text: str, secrets: Iterable[str]) -> str:
+    """Replace every plain or URL-quoted form of each secret in ``text``."""
+    for secret in secrets:
+        if not secret:
+            continue
+        for form in {secret, quote(secret), quote_plus(secret)}:
+            text = text.replace(form, REDACTED)
+    return text
+
+
+def current_span() -> RequestSpan | None:
+    """Return the span of the operation running in this context."""
+    return _CURRENT_SPAN.get()
+
+
+class RequestSpan:
+    """Collect phase timings for one client operation."""
+
+    __slots__ = ("name", "url", "status", "error", "phases", "marks", "started", "_start")
+
+    def __init__(self, name: str) -> None:
+        """Initialize."""
+        self.name = name
+        self.url = ""
+        self.status: int | None = None
+        self.error: str | None = None
+        self.phases: dict[str, float] = {}
+        self.marks: dict[str, float] = {}
+        self.started = time.time()
+        self._start = time.perf_counter()
+
+    def mark(self, key: str) -> float:
+        """Record a point in time and return it."""
+        now = self.marks[key] = time.perf_counter()
+        return now
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add a duration to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def since(self, phase: str, mark: str) -> None:
+        """Record the time elapsed since a mark as a phase."""
+        if mark in self.marks:
+            self.add(phase, time.perf_counter() - self.marks[mark])
+
+    def stage(self) -> str:
+        """Return the network stage the request had reached."""
+        if "headers" in self.marks:
+            return "download"
+        if "sent" in self.marks or "connected" in self.marks:
+            return "ttfb"
+        return "connect"
+
+    def as_record(self, redact: Iterable[str] = ()) -> dict[str, Any]:
+        """Return the span as a structured record with secrets removed."""
+        redact = list(redact)
+        return {
+            "name": self.name,
+            "url": _redact(self.url, redact),
+            "status": self.status,
+            "error": None if self.error is None else _redact(self.error, redact),
+            "started": self.started,
+            "total": time.perf_counter() - self._start,
+            "phases": dict(self.phases),
+        }
+
+
+class RequestTracer:
+    """Trace client operations and export span records.
+
+    Rates wires ``trace_config`` into the sessions it creates. Sessions
+    passed in by the caller must be built with
+    ``trace_configs=[tracer.trace_config]`` to get network phases.
+    aiohttp reports TCP connect and TLS handshake as one "connect" phase.
+    """
+
+    def __init__(
+        self,
+        exporter: Callable[[dict[str, Any]], None] | None = None,
+        max_spans: int = 1000,
+    ) -> None:
+        """Initialize."""
+        import aiohttp
+
+        self._exporter = exporter
+        self.spans: deque[dict[str, Any]] = deque(maxlen=max_spans)
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(_on_request_start)
+        self.trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+        self.trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+        self.trace_config.on_connection_create_start.append(_on_connect_start)
+        self.trace_config.on_connection_create_end.append(_on_connect_end)
+        self.trace_config.on_request_headers_sent.append(_on_headers_sent)
+        self.trace_config.on_request_end.append(_on_request_end)
+        self.trace_config.on_request_exception.append(_on_request_exception)
+
+    @contextlib.contextmanager
+    def span(self, name: str, redact: Iterable[str] = ()) -> Iterator[RequestSpan]:
+        """Open a span for the enclosed operation and export it on exit."""
+        span = RequestSpan(name)
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as err:
+            span.error = span.error or repr(err)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            self._export(span.as_record(redact))
+
+    def _export(self, record: dict[str, Any]) -> None:
+        """Store and forward a finished span record."""
+        self.spans.append(record)
+        if self._exporter is not None:
+            self._exporter(record)
+
+
+def _span(ctx: SimpleNamespace) -> RequestSpan | None:
+    """Return the span attached to an aiohttp trace context."""
+    request_ctx = ctx.trace_request_ctx
+    span = request_ctx.get("span") if isinstance(request_ctx, dict) else None
+    return span if isinstance(span, RequestSpan) else None
+
+
+async def _on_request_start(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.url = str(params.url)
+        span.mark("request_start")
+
+
+async def _on_dns_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceDnsResolveHostStartParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.mark("dns_start")
+
+
+async def _on_dns_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceDnsResolveHostEndParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.since("dns", "dns_start")
+
+
+async def _on_connect_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateStartParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.mark("connect_start")
+
+
+async def _on_connect_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.since("connect", "connect_start")
+        span.mark("connected")
+
+
+async def _on_headers_sent(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestHeadersSentParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.mark("sent")
+
+
+async def _on_request_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestEndParams
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.status = params.response.status
+        span.since("ttfb", "sent" if "sent" in span.marks else "request_start")
+        span.mark("headers")
+
+
+async def _on_request_exception(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestExceptionParams,
+) -> None:
+    if (span := _span(ctx)) is not None:
+        span.error = f"{params.exception!r} during {span.stage()}"
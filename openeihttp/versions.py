@@ -0,0 +1,157 @@
+"""Historical versions of a plan, indexed by effective date."""
+
+from __future__ import annotations
+
+import bisect
+import calendar
+import datetime
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .client import Rates, _encode
+from .const import VERSION_LIMIT, VERSIONS_SUFFIX
+from .tariff import CompiledTariff, IntervalData, MonthBill
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _local(timestamp: Any, tz: datetime.tzinfo) -> datetime.datetime:
+    """Return an OpenEI epoch timestamp as naive time in ``tz``."""
+    return datetime.datetime.fromtimestamp(timestamp, tz).replace(tzinfo=None)
+
+
+class TariffVersions:
+    """Index a plan's versions by the interval each one is in effect.
+
+    Versions are ordered by ``startdate`` and each stays in effect until the
+    next one starts. The newest version ends at its ``enddate`` if it has a
+    valid one. Epoch dates are converted to naive time in ``tz`` so they can
+    be compared with interval data in the tariff's local time.
+    """
+
+    def __init__(
+        self, plans: Iterable[dict[str, Any]], tz: datetime.tzinfo = datetime.timezone.utc
+    ) -> None:
+        """Initialize."""
+        ordered = sorted(plans, key=lambda plan: plan.get("startdate", 0))
+        if not ordered:
+            raise ValueError("No plan versions given")
+        self.plans = ordered
+        self.tariffs = [CompiledTariff(plan) for plan in ordered]
+        self.starts = [
+            _local(plan["startdate"], tz) if "startdate" in plan else datetime.datetime.min
+            for plan in ordered
+        ]
+        self.ends = [*self.starts[1:], datetime.datetime.max]
+        newest = ordered[-1]
+        if "enddate" in newest and _local(newest["enddate"], tz) > self.starts[-1]:
+            self.ends[-1] = _local(newest["enddate"], tz)
+
+    def __len__(self) -> int:
+        """Return the number of versions."""
+        return len(self.plans)
+
+    @property
+    def labels(self) -> list[str]:
+        """Return the version labels, oldest first."""
+        return [plan.get("label", "") for plan in self.plans]
+
+    def index(self, when: datetime.datetime) -> int | None:
+        """Return the position of the version in effect at ``when``."""
+        position = bisect.bisect_right(self.starts, when) - 1
+        if position < 0 or when >= self.ends[position]:
+            return None
+        return position
+
+    def at(self, when: datetime.datetime) -> CompiledTariff | None:
+        """Return the version in effect at ``when``."""
+        position = self.index(when)
+        return None if position is None else self.tariffs[position]
+
+    def _find(self, when: datetime.datetime) -> int:
+        """Return the position of the version in effect, or raise."""
+        position = self.index(when)
+        if position is None:
+            raise ValueError(f"No plan version in effect at {when}")
+        return position
+
+    def bill(self, intervals: IntervalData) -> list[MonthBill]:
+        """Return monthly bills, pricing each interval with its own version."""
+        return list(self._bill(intervals))
+
+    def _bill(self, intervals: IntervalData) -> Iterator[MonthBill]:
+        """Yield one bill per calendar month covered by the readings.
+
+        The index is searched only when a version boundary is crossed.
+        Tiers keep counting across a mid-month change; fixed and minimum
+        charges come from the version in effect when the month starts.
+        """
+        when = intervals.start
+        step = intervals.step
+        position = self._find(when)
+        tariff = self.tariffs[position]
+        boundary = self.ends[position]
+        month_tariff = tariff
+        month: datetime.date | None = None
+        days = 0
+        used = energy = adjustment = 0.0
+        for kwh in intervals.values:
+            if when >= boundary:
+                position = self._find(when)
+                tariff = self.tariffs[position]
+                boundary = self.ends[position]
+            if month is None or when.month != month.month or when.year != month.year:
+                if month is not None:
+                    yield month_tariff.month_bill(month, used, energy, adjustment, days)
+                month = datetime.date(when.year, when.month, 1)
+                days = calendar.monthrange(when.year, when.month)[1]
+                used = energy = adjustment = 0.0
+                month_tariff = tariff
+            charge, adj = tariff.price(tariff.energy_period(when), used, kwh, days)
+            energy += charge
+            adjustment += adj
+            used += kwh
+            when += step
+        if month is not None:
+            yield month_tariff.month_bill(month, used, energy, adjustment, days)
+
+
+async def fetch_versions(
+    rates: Rates,
+    limit: int = VERSION_LIMIT,
+    tz: datetime.tzinfo = datetime.timezone.utc,
+) -> TariffVersions:
+    """Return the plan of ``rates`` and the versions it supersedes.
+
+    Follows the ``supersedes`` chain back from the current plan, up to
+    ``limit`` versions in total. Superseded versions never change, so they
+    are kept in a cache file next to the plan's own and only versions
+    missing from it are fetched.
+    """
+    await rates.update()
+    assert rates._data is not None
+    cache = rates._cache().sibling(VERSIONS_SUFFIX)
+    stored = await cache.read_cache()
+    known = {plan["label"]: plan for plan in stored} if isinstance(stored, list) else {}
+
+    chain = [rates._data]
+    seen = {rates._data.get("label")}
+    fetched = 0
+    label = rates._data.get("supersedes")
+    while label and label not in seen and len(chain) < limit:
+        plan = known.get(label)
+        if plan is None:
+            plan = await rates._fetch_plan(label)
+            if plan is None:
+                _LOGGER.debug("Superseded plan %s not found.", label)
+                break
+            fetched += 1
+        chain.append(plan)
+        seen.add(label)
+        label = plan.get("supersedes")
+
+    if fetched:
+        await cache.write_cache(_encode(chain[1:]))
+    _LOGGER.debug("Loaded %s versions, %s fetched from the API.", len(chain), fetched)
+    return TariffVersions(chain, tz)
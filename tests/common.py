@@ -1,10 +1,28 @@
 """Provide common pytest fixtures."""
 
+import asyncio
+import json
 import os
 
+import openeihttp
+
 
 def load_fixture(filename):
     """Load a fixture."""
     path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
     with open(path, encoding="utf-8") as fptr:
         return fptr.read()
+
+
+def load_plan(filename):
+    """Return the first plan item of a fixture file."""
+    return json.loads(load_fixture(filename))["items"][0]
+
+
+def cached_rates(tmp_path, filename, api="fakeAPIKey", **kwargs):
+    """Return Rates loaded from a cache file seeded with a fixture plan."""
+    cache_file = tmp_path / filename
+    cache_file.write_text(json.dumps(load_plan(filename)))
+    rates = openeihttp.Rates(api=api, cache_file=str(cache_file), **kwargs)
+    asyncio.run(rates.update())
+    return rates
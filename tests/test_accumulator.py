@@ -0,0 +1,65 @@
+"""Test the live bill accumulator."""
+
+import datetime
+
+import pytest
+
+from openeihttp import BillAccumulator, CompiledTariff, IntervalData
+from tests.common import load_plan
+
+
+def test_matches_batch_bill():
+    """Test reading by reading matches billing the month at once."""
+    tariff = CompiledTariff(load_plan("plan_tier_data.json"))
+    start = datetime.datetime(2021, 3, 1)
+    values = [1.5 + (hour % 24) / 10 for hour in range(31 * 24)]
+    accumulator = BillAccumulator(tariff)
+    for hour, kwh in enumerate(values):
+        assert accumulator.add(start + datetime.timedelta(hours=hour), kwh) is None
+
+    (expected,) = tariff.bill(IntervalData(start, values))
+    assert accumulator.bill() == pytest.approx(expected)
+    assert accumulator.cost == pytest.approx(expected.total)
+    assert accumulator.tier == 2
+
+
+def test_cycle_day_rollover():
+    """Test cycles start on the configured day and close on rollover."""
+    tariff = CompiledTariff(load_plan("plan_data.json"))
+    accumulator = BillAccumulator(tariff, cycle_day=15)
+    assert accumulator.cost == 0.0
+    assert accumulator.add(datetime.datetime(2021, 1, 10, 12), 4.0) is None
+    assert accumulator.cycle_start == datetime.date(2020, 12, 15)
+    assert accumulator.add(datetime.datetime(2021, 1, 14, 23), 2.0) is None
+
+    closed = accumulator.add(datetime.datetime(2021, 1, 15), 1.0)
+
+    assert closed.month == datetime.date(2020, 12, 15)
+    assert closed.kwh == 6.0
+    assert closed.fixed_charge == 16.91
+    assert accumulator.cycle_start == datetime.date(2021, 1, 15)
+    assert accumulator.kwh == 1.0
+    with pytest.raises(ValueError):
+        accumulator.add(datetime.datetime(2021, 1, 14), 1.0)
+
+
+def test_peak_demand_by_period():
+    """Test peak demand is tracked per demand period from interval length."""
+    accumulator = BillAccumulator(CompiledTariff(load_plan("plan_demand_data.json")))
+    quarter = datetime.timedelta(minutes=15)
+    weekday = datetime.datetime(2021, 1, 4)
+    accumulator.add(weekday.replace(hour=3), 1.0, quarter)
+    accumulator.add(weekday.replace(hour=16), 2.0, quarter)
+    accumulator.add(weekday.replace(hour=17), 1.0)
+
+    assert accumulator.peak_demand == 8.0
+    assert accumulator.peak_demand_by_period == {0: 4.0, 1: 8.0}
+    assert accumulator.period == 1
+
+
+def test_invalid_cycle_day():
+    """Test cycle days past the 28th are rejected."""
+    with pytest.raises(ValueError):
+        BillAccumulator(CompiledTariff(load_plan("plan_data.json")), cycle_day=31)
+    with pytest.raises(ValueError):
+        BillAccumulator(CompiledTariff(load_plan("plan_data.json"))).bill()
@@ -0,0 +1,165 @@
+"""Test the circuit breaker."""
+
+import asyncio
+import datetime
+import json
+import re
+
+import pytest
+from aioresponses import CallbackResult
+
+import openeihttp
+from openeihttp import CircuitBreaker, CircuitOpen
+from openeihttp import breaker as breaker_module
+from openeihttp.const import ERROR_TIMEOUT
+from tests.common import load_fixture, load_plan
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the breaker."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_breaker_states(clock):
+    """Test the breaker opens, probes once when half-open and closes on success."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    clock[0] += 30
+    assert not breaker.is_open
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+
+
+async def test_breaker_shared_and_serving_cache(mock_aioclient, tmp_path, clock):
+    """Test server errors open a shared breaker and update() keeps cached data."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    metrics = openeihttp.MetricsCollector()
+    cached = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=str(tmp_path / "plan"),
+        circuit_breaker=breaker,
+        metrics=metrics,
+    )
+    (tmp_path / "plan").write_text(json.dumps(load_plan("plan_data.json")))
+    await cached.update()
+    other = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, circuit_breaker=breaker)
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=503, body="down", repeat=True)
+    for _ in range(2):
+        with pytest.raises(openeihttp.APIError):
+            await other.lookup_plans()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        await other.lookup_plans()
+    with pytest.raises(CircuitOpen):
+        await cached.update_data()
+    assert metrics.counters["circuit_open"] == 1
+
+    # Stale data keeps being served while the circuit is open
+    cached._timestamp -= datetime.timedelta(days=2)
+    await cached.update()
+    assert cached.rate_name == "Residential Service TOU Time Advantage 7PM-Noon (ET-2)"
+    assert sum(len(calls) for calls in mock_aioclient.requests.values()) == 2
+
+
+async def test_breaker_probe_recovers(mock_aioclient, clock):
+    """Test a successful probe closes the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    rates = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, circuit_breaker=breaker)
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=500, body="down")
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=200, body=load_fixture("lookup.json"))
+    with pytest.raises(openeihttp.APIError):
+        await rates.lookup_plans()
+    assert breaker.state == "open"
+
+    clock[0] += 60
+    assert "Arizona Public Service Co" in await rates.lookup_plans()
+    assert breaker.state == "closed"
+
+
+async def test_breaker_client_errors_close(mock_aioclient):
+    """Test 4xx replies count as a healthy server."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    rates = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, circuit_breaker=breaker)
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=401)
+    with pytest.raises(openeihttp.NotAuthorized):
+        await rates.lookup_plans()
+    assert breaker.state == "closed"
+
+
+async def test_breaker_concurrent_outcomes(mock_aioclient):
+    """Test each concurrent request reports its own outcome to the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    rates = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, circuit_breaker=breaker)
+
+    calls = []
+
+    async def reply(url, **kwargs):
+        # The first request times out after the second one has succeeded
+        calls.append(url)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise asyncio.TimeoutError
+        return CallbackResult(status=200, body=load_fixture("lookup.json"))
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=reply, repeat=True)
+    timed_out, _ = await asyncio.gather(
+        rates.process_request({"version": "latest"}),
+        rates.process_request({"version": "latest"}),
+    )
+    assert timed_out == {"error": ERROR_TIMEOUT}
+    assert breaker.state == "open"
+
+
+async def test_breaker_cancelled_probe(mock_aioclient, clock):
+    """Test a cancelled probe leaves the breaker open without counting a failure."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    rates = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, circuit_breaker=breaker)
+    started = asyncio.Event()
+
+    async def hang(url, **kwargs):
+        started.set()
+        await asyncio.sleep(60)
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=500, body="down")
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=hang)
+    with pytest.raises(openeihttp.APIError):
+        await rates.lookup_plans()
+
+    clock[0] += 60
+    probe = asyncio.ensure_future(rates.lookup_plans())
+    await started.wait()
+    assert breaker.state == "half_open"
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert breaker.state == "open"
+    assert breaker._failures == 1
+
+    # The next request probes again right away
+    assert breaker.allow()
+    assert breaker.state == "half_open"
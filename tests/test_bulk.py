@@ -0,0 +1,137 @@
+"""Test operations over many Rates objects."""
+
+import json
+import logging
+import re
+
+import pytest
+
+import openeihttp
+from tests.common import load_fixture, load_plan
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+PLAN = load_plan("plan_data.json")
+
+
+def _fleet(tmp_path, count, metrics=None):
+    return [
+        openeihttp.Rates(
+            api="fakeAPIKey",
+            plan="574613aa5457a3557e906f5b",
+            cache_file=str(tmp_path / f"plan{index}"),
+            metrics=metrics,
+        )
+        for index in range(count)
+    ]
+
+
+async def test_warm_up(tmp_path):
+    """Test warm_up loads valid caches and reports the rest."""
+    payload = json.dumps(PLAN, sort_keys=True)
+    for index in range(0, 6, 2):
+        (tmp_path / f"plan{index}").write_text(payload)
+    (tmp_path / "plan3").write_text("{}")
+    (tmp_path / "plan5").write_bytes(b"x" * 500)
+    metrics = openeihttp.MetricsCollector()
+    fleet = _fleet(tmp_path, 6, metrics)
+
+    needs_fetch = await openeihttp.warm_up(fleet, concurrency=2)
+
+    assert needs_fetch == [fleet[1], fleet[3], fleet[5]]
+    for rates in fleet[::2]:
+        assert rates.rate_name == PLAN["name"]
+    assert metrics.counters["cache_hit"] == 3
+    assert metrics.counters["cache_miss"] == 3
+
+
+async def test_warm_up_matches_update(mock_aioclient, tmp_path):
+    """Test warmed data hashes the same as data loaded by update()."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+    )
+    fetched = _fleet(tmp_path, 1)[0]
+    await fetched.update()
+    warmed = _fleet(tmp_path, 1)
+    assert await openeihttp.warm_up(warmed) == []
+    assert warmed[0].data_hash == fetched.data_hash
+    # Objects that already hold data are skipped
+    assert await openeihttp.warm_up([fetched]) == []
+
+
+async def test_warm_up_unsorted_cache(mock_aioclient, tmp_path):
+    """Test a cache written with unsorted keys hashes the same as update()."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+    )
+    fetched = _fleet(tmp_path / "fetched", 1)[0]
+    await fetched.update()
+    unsorted = dict(reversed(list(PLAN.items())))
+    (tmp_path / "plan0").write_text(json.dumps(unsorted, indent=2))
+    warmed = _fleet(tmp_path, 1)
+    assert await openeihttp.warm_up(warmed) == []
+    assert warmed[0].data_hash == fetched.data_hash
+
+
+async def test_warm_up_invalid_concurrency(tmp_path):
+    """Test warm_up rejects a concurrency below one."""
+    with pytest.raises(ValueError):
+        await openeihttp.warm_up(_fleet(tmp_path, 1), concurrency=0)
+
+
+async def test_lookup_many(mock_aioclient):
+    """Test nearby and repeated locations share one lookup and keep their order."""
+    lookup_pattern = r"^https://api\.openei\.org/utility_rates\?.*lat=1\.0001.*$"
+    mock_aioclient.get(re.compile(lookup_pattern), status=200, body=load_fixture("lookup.json"))
+    mock_aioclient.get(
+        re.compile(r"^https://api\.openei\.org/utility_rates\?.*address=.*$"),
+        status=200,
+        body=load_fixture("lookup_radius.json"),
+    )
+    mock_aioclient.get(
+        re.compile(r"^https://api\.openei\.org/utility_rates\?.*lat=5\.0.*$"),
+        status=401,
+    )
+    locations = [
+        (1.0001, 2.0),
+        "1 Main St, Phoenix",
+        (5.0, 5.0),
+        (1.0002, 2.0),
+        "1  MAIN st, phoenix",
+    ]
+
+    results = await openeihttp.lookup_many("fakeAPIKey", locations, concurrency=2)
+
+    assert [result.location for result in results] == locations
+    assert len(mock_aioclient.requests) == 3
+    first, address, failed, nearby, same_address = results
+    assert "Arizona Public Service Co" in first.plans
+    assert first.error is None
+    assert nearby.plans is first.plans
+    assert same_address.plans is address.plans
+    assert failed.plans is None
+    assert isinstance(failed.error, openeihttp.NotAuthorized)
+
+
+async def test_lookup_many_logs_no_address(mock_aioclient, caplog):
+    """Test failed lookups are logged by input index, never by address."""
+    mock_aioclient.get(re.compile(TEST_PATTERN), status=401, repeat=True)
+    caplog.set_level(logging.DEBUG, logger="openeihttp.bulk")
+    locations = [(1.0, 2.0), "1 Main St, Phoenix"]
+
+    results = await openeihttp.lookup_many("fakeAPIKey", locations)
+
+    assert all(isinstance(result.error, openeihttp.NotAuthorized) for result in results)
+    assert "Lookup for location 1 failed: NotAuthorized" in caplog.text
+    assert "Main" not in caplog.text
+
+
+async def test_lookup_many_invalid_concurrency():
+    """Test lookup_many rejects a concurrency below one."""
+    with pytest.raises(ValueError):
+        await openeihttp.lookup_many("fakeAPIKey", [(1.0, 1.0)], concurrency=0)
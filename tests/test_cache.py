@@ -0,0 +1,95 @@
+"""Test the cache manager."""
+
+import gzip
+import json
+import re
+
+import pytest
+
+import openeihttp
+from openeihttp import cache as cache_module
+from openeihttp.cache import OpenEICache
+from tests.common import load_fixture, load_plan
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+PLAN = load_plan("plan_data.json")
+PAYLOAD = json.dumps(PLAN).encode("utf-8")
+
+
+@pytest.mark.parametrize("method", ["gzip", "zstd"])
+async def test_compressed_roundtrip(tmp_path, method):
+    """Test compressed caches are smaller and read back transparently."""
+    if method == "zstd" and cache_module._zstd() is None:
+        pytest.skip("no zstd backend installed")
+    cache = OpenEICache(str(tmp_path / "plan"), compression=method)
+    await cache.write_cache(PAYLOAD)
+    assert (tmp_path / "plan").stat().st_size < len(PAYLOAD)
+    assert await cache.cache_exists()
+    assert await cache.read_cache() == PLAN
+    # A reader configured without compression still detects the format
+    assert await OpenEICache(str(tmp_path / "plan")).read_cache() == PLAN
+
+
+async def test_zstd_falls_back_to_gzip(tmp_path, monkeypatch):
+    """Test zstd compression falls back to gzip without a backend."""
+    monkeypatch.setattr(cache_module, "_zstd", lambda: None)
+    cache = OpenEICache(str(tmp_path / "plan"), compression="zstd")
+    await cache.write_cache(PAYLOAD)
+    raw = (tmp_path / "plan").read_bytes()
+    assert gzip.decompress(raw) == PAYLOAD
+
+
+async def test_corrupt_compressed_cache(tmp_path):
+    """Test a truncated compressed cache reads as empty."""
+    (tmp_path / "plan").write_bytes(gzip.compress(PAYLOAD)[:100])
+    assert await OpenEICache(str(tmp_path / "plan")).read_cache() == {}
+
+
+async def test_minimum_size_follows_file_format(tmp_path):
+    """Test the size check uses the file's format, not the configured compression."""
+    small = {"label": "small", "items": list(range(40))}
+    path = tmp_path / "plan"
+    path.write_bytes(gzip.compress(json.dumps(small).encode("utf-8"), mtime=0))
+    assert 64 <= path.stat().st_size < 194
+    plain = OpenEICache(str(path))
+    assert await plain.cache_exists()
+    assert plain.load() == small
+
+    path.write_text(json.dumps(small)[:120])
+    compressed = OpenEICache(str(path), compression="gzip")
+    assert not await compressed.cache_exists()
+    assert compressed.load() is None
+
+
+async def test_invalid_compression(tmp_path):
+    """Test unknown compression methods are rejected."""
+    with pytest.raises(ValueError):
+        await OpenEICache(str(tmp_path / "plan"), compression="lzma").write_cache(PAYLOAD)
+
+
+async def test_rates_compressed_cache(mock_aioclient, tmp_path):
+    """Test Rates writes and reloads a compressed cache."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+    )
+    cache_file = str(tmp_path / "plan")
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=cache_file,
+        cache_compression="gzip",
+    )
+    await test_rates.update()
+    reloaded = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=cache_file,
+        cache_compression="gzip",
+    )
+    await reloaded.update()
+    assert reloaded.rate_name == test_rates.rate_name
+    assert reloaded.data_hash == test_rates.data_hash
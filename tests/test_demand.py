@@ -0,0 +1,130 @@
+"""Test demand charges."""
+
+import datetime
+
+import pytest
+
+from openeihttp import CompiledTariff, IntervalData, demand_charges, demand_charges_numpy
+from openeihttp.demand import tier_charge
+from tests.common import cached_rates, load_plan
+
+QUARTER = datetime.timedelta(minutes=15)
+MONDAY = datetime.datetime(2021, 1, 4)
+
+
+def _day(spikes):
+    """Return one day of 15-minute kWh readings with spikes at given slots."""
+    values = [0.5] * 96
+    for slot, kwh in spikes.items():
+        values[slot] = kwh
+    return values
+
+
+def test_tou_demand_windows(tmp_path):
+    """Test peaks per demand period with 15 and 30 minute windows."""
+    rates = cached_rates(tmp_path, "plan_demand_data.json")
+    # 16:00 is on peak (period 1); 03:00 is off peak (period 0)
+    intervals = IntervalData(MONDAY, _day({16 * 4: 3.0, 16 * 4 + 1: 1.0, 3 * 4: 4.0}), QUARTER)
+
+    (month,) = demand_charges(rates, intervals)
+    assert month.month == datetime.date(2021, 1, 1)
+    assert month.peaks == {0: 16.0, 1: 12.0}
+    assert month.peak == 16.0
+    assert month.tou_charge == pytest.approx(12.0 * (8.4 + 0.838))
+    assert month.flat_charge == 0.0
+
+    (month,) = demand_charges(rates, intervals, window=datetime.timedelta(minutes=30))
+    assert month.peaks == {0: 9.0, 1: 8.0}
+
+
+def test_flat_tiered_demand():
+    """Test flat demand uses the month's structure and its tiers."""
+    plan = load_plan("plan_data.json")
+    plan["flatdemandstructure"] = [
+        [{"max": 10, "rate": 5.0}, {"rate": 7.0, "adj": 1.0}],
+        [{"rate": 1.0}],
+    ]
+    plan["flatdemandmonths"] = [0] * 6 + [1] * 6
+    tariff = CompiledTariff(plan)
+    hourly = [2.0] * 24 * 31 + [2.0] * 24 * 28
+    hourly[5] = 15.0
+
+    january, february = demand_charges(tariff, IntervalData(datetime.datetime(2021, 1, 1), hourly))
+    assert january.peaks == {}
+    assert january.flat_charge == 10 * 5.0 + 5 * 8.0
+    assert february.flat_charge == 2 * 5.0
+
+    plan["flatdemandmonths"] = [1] * 12
+    (july,) = demand_charges(
+        CompiledTariff(plan), IntervalData(datetime.datetime(2021, 7, 1), [3.0])
+    )
+    assert july.total == 3.0
+
+
+def test_window_validation():
+    """Test windows must line up with the interval length."""
+    tariff = CompiledTariff(load_plan("plan_demand_data.json"))
+    intervals = IntervalData(MONDAY, [1.0] * 8, QUARTER)
+    with pytest.raises(ValueError):
+        demand_charges(tariff, intervals, window=datetime.timedelta(minutes=20))
+    # Windows shorter than an interval use the interval itself
+    (month,) = demand_charges(tariff, intervals._replace(step=datetime.timedelta(hours=1)))
+    assert month.peak == 1.0
+
+
+def test_partial_windows_skipped():
+    """Test readings before the first full window do not set a peak."""
+    tariff = CompiledTariff(load_plan("plan_demand_data.json"))
+    five = datetime.timedelta(minutes=5)
+    (month,) = demand_charges(tariff, IntervalData(MONDAY, [6.0] + [0.0] * 11, five))
+    assert month.peak == 24.0
+    (month,) = demand_charges(tariff, IntervalData(MONDAY, [6.0, 0.0], five))
+    assert month.peak == 0.0
+    assert month.peaks == {}
+
+
+def test_demand_unit():
+    """Test demand rates in units other than kW are rejected."""
+    plan = load_plan("plan_demand_data.json")
+    plan["demandrateunit"] = "kVA"
+    with pytest.raises(ValueError):
+        demand_charges(CompiledTariff(plan), IntervalData(MONDAY, [1.0] * 4, QUARTER))
+
+
+@pytest.mark.parametrize("minutes", [5, 15, 30, 60])
+def test_numpy_matches_scalar(minutes):
+    """Test the NumPy engine prices TOU and flat demand like the scalar one."""
+    pytest.importorskip("numpy")
+    plan = load_plan("plan_demand_data.json")
+    plan["flatdemandstructure"] = [[{"max": 10, "rate": 5.0}, {"rate": 7.0}], [{"rate": 1.0}]]
+    plan["flatdemandmonths"] = [0] * 6 + [1] * 6
+    tariff = CompiledTariff(plan)
+    values = [(index * 7919 % 97) / 40 for index in range(35040)]
+    intervals = IntervalData(datetime.datetime(2021, 1, 1), values, QUARTER)
+    window = datetime.timedelta(minutes=minutes)
+
+    expected = demand_charges(tariff, intervals, window)
+    months = demand_charges_numpy(tariff, intervals, window)
+    assert len(months) == len(expected) == 12
+    for month, scalar in zip(months, expected):
+        assert month.month == scalar.month
+        assert month.peaks == pytest.approx(scalar.peaks)
+        assert month.peak == pytest.approx(scalar.peak)
+        assert month.total == pytest.approx(scalar.total)
+
+
+def test_numpy_short_data():
+    """Test the NumPy engine with no readings and with fewer than one window."""
+    pytest.importorskip("numpy")
+    tariff = CompiledTariff(load_plan("plan_demand_data.json"))
+    assert demand_charges_numpy(tariff, IntervalData(MONDAY, [], QUARTER)) == []
+    short = IntervalData(MONDAY, [6.0, 0.0], datetime.timedelta(minutes=5))
+    assert demand_charges_numpy(tariff, short) == demand_charges(tariff, short)
+
+
+def test_tier_charge():
+    """Test tier ladders split demand at each limit."""
+    ladder = [(5.0, 1.0, 0.0, 0.0), (float("inf"), 2.0, 0.5, 0.0)]
+    assert tier_charge(ladder, 0.0) == 0.0
+    assert tier_charge(ladder, 4.0) == 4.0
+    assert tier_charge(ladder, 7.0) == 5.0 + 2 * 2.5
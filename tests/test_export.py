@@ -0,0 +1,66 @@
+"""Test price timeline exports."""
+
+import datetime
+
+import pytest
+
+from openeihttp.export import COLUMNS, price_table, to_arrow, to_numpy, to_parquet
+from tests.common import cached_rates
+
+START = datetime.datetime(2021, 4, 30)
+END = datetime.datetime(2021, 5, 4)
+
+
+@pytest.fixture
+def rates(tmp_path):
+    """Rates with the TOU fixture plan loaded."""
+    return cached_rates(tmp_path, "plan_data.json")
+
+
+def test_price_table(rates):
+    """Test the list timeline matches Rates lookups."""
+    table = price_table(rates, START, END)
+    assert tuple(table) == COLUMNS
+    assert len(table["timestamp"]) == 96
+    for when, structure, rate, adj, sell in zip(*table.values()):
+        assert structure == rates.rate_structure(when, "energy")
+        assert rate == rates.rate(when)
+        assert adj == rates.adjustment(when)
+        assert sell == 0.0
+
+
+def test_price_table_steps(rates):
+    """Test sub-hourly steps, empty ranges and invalid steps."""
+    table = price_table(
+        rates, START, START + datetime.timedelta(hours=1), datetime.timedelta(minutes=15)
+    )
+    assert len(table["rate"]) == 4
+    assert price_table(rates, END, START)["rate"] == []
+    with pytest.raises(ValueError):
+        price_table(rates, START, END, datetime.timedelta(0))
+
+
+def test_to_numpy(rates):
+    """Test the NumPy timeline matches the list timeline."""
+    np = pytest.importorskip("numpy")
+    step = datetime.timedelta(minutes=30)
+    arrays = to_numpy(rates, START, END, step)
+    expected = price_table(rates, START, END, step)
+    assert arrays["timestamp"].dtype == np.dtype("M8[s]")
+    assert arrays["timestamp"].astype(datetime.datetime).tolist() == expected["timestamp"]
+    for column in COLUMNS[1:]:
+        assert arrays[column].tolist() == expected[column]
+
+
+def test_to_arrow_and_parquet(rates, tmp_path):
+    """Test Arrow tables wrap the NumPy columns and round-trip through Parquet."""
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    table = to_arrow(rates, START, END)
+    assert table.column_names == list(COLUMNS)
+    assert table.num_rows == 96
+    assert table.column("rate").to_pylist() == price_table(rates, START, END)["rate"]
+
+    to_parquet(tmp_path / "prices.parquet", rates, START, END)
+    # Parquet stores second timestamps as milliseconds
+    assert parquet.read_table(tmp_path / "prices.parquet").to_pylist() == table.to_pylist()
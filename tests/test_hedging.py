@@ -0,0 +1,164 @@
+"""Test timeouts and hedged requests."""
+
+import asyncio
+import re
+
+import pytest
+from aioresponses import CallbackResult
+
+import openeihttp
+from openeihttp import Hedger, Timeouts
+from tests.common import load_fixture
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+
+
+def _warmed(latency=0.01, **kwargs):
+    """Return a hedger that has seen enough requests to hedge."""
+    hedger = Hedger(min_samples=4, min_delay=0.01, **kwargs)
+    for _ in range(4):
+        hedger.record(latency)
+    hedger._tokens = 1.0
+    return hedger
+
+
+async def test_hedger_delay():
+    """Test the hedge delay follows the percentile and respects the floor."""
+    hedger = Hedger(min_samples=10, min_delay=0.05)
+    for value in range(1, 10):
+        hedger.record(value / 10)
+    assert hedger.delay is None
+    hedger.record(1.0)
+    assert hedger.delay == 1.0
+
+    floor = Hedger(min_samples=1, min_delay=0.05)
+    floor.record(0.001)
+    assert floor.delay == 0.05
+    with pytest.raises(ValueError):
+        Hedger(budget=2)
+    with pytest.raises(ValueError):
+        Hedger(percentile=1)
+
+
+async def test_hedger_sends_hedge():
+    """Test a slow request is sent again and the faster copy wins."""
+    hedger = _warmed()
+    calls = []
+    cancelled = asyncio.Event()
+
+    async def call():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "fast"
+
+    assert await hedger.run(call) == "fast"
+    assert len(calls) == 2
+    assert hedger.hedges == hedger.hedge_wins == 1
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_hedger_budget():
+    """Test no hedge is sent once the budget is spent."""
+    hedger = _warmed(budget=0.0)
+    hedger._tokens = 0.0
+    calls = []
+
+    async def call():
+        calls.append(None)
+        await asyncio.sleep(0.03)
+        return "only"
+
+    assert await hedger.run(call) == "only"
+    assert len(calls) == 1
+    assert hedger.hedges == 0
+
+
+async def test_hedger_first_finish_raises():
+    """Test the first copy to finish decides the outcome, even an error."""
+    hedger = _warmed()
+
+    async def call():
+        raise openeihttp.UrlNotFound
+
+    with pytest.raises(openeihttp.UrlNotFound):
+        await hedger.run(call)
+    assert hedger.hedges == 0
+
+
+async def test_rates_hedged_lookup(mock_aioclient):
+    """Test Rates hedges a slow API request through its shared hedger."""
+    hedger = _warmed()
+    body = load_fixture("lookup.json")
+    replies = []
+
+    async def reply(url, **kwargs):
+        replies.append(kwargs["timeout"])
+        if len(replies) == 1:
+            await asyncio.sleep(10)
+        return CallbackResult(status=200, body=body)
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=reply, repeat=True)
+    rates = openeihttp.Rates(
+        api="fakeAPIKey",
+        lat=1.0,
+        lon=1.0,
+        timeouts=Timeouts(total=30, connect=5, sock_read=10),
+        hedger=hedger,
+    )
+    assert "Arizona Public Service Co" in await rates.lookup_plans()
+    assert hedger.hedge_wins == 1
+    timeout = replies[0]
+    assert (timeout.total, timeout.connect, timeout.sock_read) == (30, 5, 10)
+
+
+async def test_hedged_request_one_span(mock_aioclient):
+    """Test a hedged request exports a single span without the loser's cancellation."""
+    body = load_fixture("lookup.json")
+    replies = []
+
+    async def reply(url, **kwargs):
+        replies.append(url)
+        if len(replies) == 1:
+            await asyncio.sleep(10)
+        return CallbackResult(status=200, body=body)
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=reply, repeat=True)
+    exported = []
+    rates = openeihttp.Rates(
+        api="fakeAPIKey",
+        lat=1.0,
+        lon=1.0,
+        hedger=_warmed(),
+        tracer=openeihttp.RequestTracer(exporter=exported.append),
+    )
+    await rates.lookup_plans()
+    # Let the cancelled copy finish unwinding
+    await asyncio.sleep(0.01)
+    assert len(replies) == 2
+    assert len(exported) == 1
+    assert exported[0]["name"] == "request"
+    assert exported[0]["error"] is None
+
+
+async def test_process_request_timeout_override(mock_aioclient):
+    """Test an explicit timeout replaces only the total limit."""
+    seen = []
+
+    def reply(url, **kwargs):
+        seen.append(kwargs["timeout"])
+        return CallbackResult(status=200, body=load_fixture("lookup.json"))
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=reply, repeat=True)
+    rates = openeihttp.Rates(api="fakeAPIKey", lat=1.0, lon=1.0, timeouts=Timeouts(connect=3))
+    await rates.process_request({"version": "latest"}, timeout=7)
+    await rates.lookup_plans()
+    assert (seen[0].total, seen[0].connect) == (7, 3)
+    assert (seen[1].total, seen[1].connect) == (90, 3)
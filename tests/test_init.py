@@ -1,6 +1,8 @@
 """Test main functions."""
 
+import asyncio
 import datetime
+import hashlib
 import logging
 import re
 
@@ -1524,3 +1526,253 @@ async def test_partial_coordinates():
     test_lookup_lon = openeihttp.Rates(api="fakeAPIKey", lon=1.0)
     with pytest.raises(openeihttp.InvalidCall):
         await test_lookup_lon.lookup_plans()
+
+
+async def test_lookup_requests_minimal_detail(mock_aioclient):
+    """Test plan lookups request the minimal detail level."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("lookup.json"),
+    )
+    test_lookup = openeihttp.Rates(api="fakeAPIKey", lat="1", lon="1")
+    await test_lookup.lookup_plans()
+    (request_key,) = mock_aioclient.requests
+    assert request_key[1].query["detail"] == "minimal"
+    call = mock_aioclient.requests[request_key][0]
+    assert call.kwargs["headers"]["Accept-Encoding"] == "gzip, deflate"
+
+
+async def test_response_byte_counters(mock_aioclient):
+    """Test per-request byte counters."""
+    body = load_fixture("lookup.json")
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=body,
+        repeat=True,
+    )
+    test_lookup = openeihttp.Rates(api="fakeAPIKey", lat="1", lon="1")
+    assert test_lookup.last_response_bytes == (0, 0)
+    await test_lookup.lookup_plans()
+    size = len(body.encode("utf-8"))
+    assert test_lookup.last_response_bytes[1] == size
+    await test_lookup.lookup_plans()
+    assert test_lookup.total_response_bytes[1] == size * 2
+
+
+async def test_auto_refresh(mock_aioclient, caplog, tmp_path):
+    """Test background refresh keeps data current without blocking reads."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+        repeat=True,
+    )
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", cache_file=str(tmp_path / "auto_refresh")
+    )
+    await test_rates.clear_cache()
+    test_rates.start_auto_refresh(interval=0.01)
+    assert test_rates.auto_refresh_running
+    with caplog.at_level(logging.DEBUG):
+        await asyncio.sleep(0.1)
+        await test_rates.update()
+    assert test_rates.rate_name is not None
+    assert "Refreshing data in the background." in caplog.text
+    assert "Auto refresh active, serving current data." in caplog.text
+    await test_rates.stop_auto_refresh()
+    assert not test_rates.auto_refresh_running
+
+
+async def test_auto_refresh_failure_keeps_data(mock_aioclient, caplog, tmp_path):
+    """Test refresh failures back off instead of surfacing."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+    )
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("rate_limit.json"),
+        repeat=True,
+    )
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", cache_file=str(tmp_path / "auto_refresh")
+    )
+    await test_rates.clear_cache()
+    await test_rates.update()
+    test_rates.start_auto_refresh(interval=0)
+    await asyncio.sleep(0.05)
+    assert test_rates.auto_refresh_running
+    assert "Background refresh failed, retrying in 30s" in caplog.text
+    assert test_rates.current_rate is not None
+    await test_rates.stop_auto_refresh()
+
+
+async def test_custom_base_url(mock_aioclient):
+    """Test requests go to a configured endpoint."""
+    mock_aioclient.get(
+        re.compile(r"^http://127\.0\.0\.1:8080/utility_rates\?.*$"),
+        status=200,
+        body=load_fixture("lookup.json"),
+    )
+    test_lookup = openeihttp.Rates(
+        api="fakeAPIKey", lat="1", lon="1", base_url="http://127.0.0.1:8080/utility_rates"
+    )
+    status = await test_lookup.lookup_plans()
+    assert "Arizona Public Service Co" in status
+
+
+async def test_import_defers_network_modules():
+    """Test importing the package does not pull in network or process pool modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, openeihttp; "
+        "print(','.join(m for m in sys.modules if m.split('.')[0] in "
+        "('aiohttp', 'aiofiles', 'multiprocessing', 'concurrent')))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+async def test_current_values_memoized_per_hour(mock_aioclient, tmp_path):
+    """Test current_* properties compute once per hour and data swap."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+        repeat=True,
+    )
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", cache_file=str(tmp_path / "memo")
+    )
+    await test_rates.clear_cache()
+    await test_rates.update()
+
+    calls = []
+    original = test_rates.rate
+
+    def counting_rate(date):
+        calls.append(date)
+        return original(date)
+
+    test_rates.rate = counting_rate
+    with freeze_time("2021-08-13 10:05:00") as frozen:
+        assert test_rates.current_rate == 0.06118
+        frozen.move_to("2021-08-13 10:59:59")
+        assert test_rates.current_rate == 0.06118
+        assert len(calls) == 1
+        frozen.move_to("2021-08-13 13:00:00")
+        assert test_rates.current_rate == 0.24477
+        assert len(calls) == 2
+        assert test_rates.next_energy_rate_structure_time == datetime.datetime(2021, 8, 13, 19, 0)
+        test_rates._data = dict(test_rates._data)
+        assert test_rates.current_rate == 0.24477
+        assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("fixture", "reading"),
+    [
+        ("plan_data.json", 0.0),
+        ("plan_demand_data.json", 0.0),
+        ("plan_tier_data.json", 10.3),
+        ("sell_rate.json", 0.0),
+    ],
+)
+@freeze_time("2021-08-13 13:20:00")
+async def test_snapshot_matches_properties(mock_aioclient, fixture, reading, tmp_path):
+    """Test snapshot() agrees with the individual properties."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture(fixture),
+    )
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="snapshot", reading=reading, cache_file=str(tmp_path / "snapshot")
+    )
+    await test_rates.update_data()
+    snap = test_rates.snapshot()
+    assert isinstance(snap, openeihttp.RateSnapshot)
+    assert snap.when == datetime.datetime(2021, 8, 13, 13, 20)
+    assert snap.energy_rate_structure == test_rates.current_energy_rate_structure
+    assert snap.rate == test_rates.current_rate
+    assert snap.adjustment == test_rates.current_adjustment
+    assert snap.monthly_tier_rate == test_rates.monthly_tier_rate
+    assert snap.sell_rate == test_rates.current_sell_rate
+    assert snap.next_energy_rate_structure == test_rates.next_energy_rate_structure
+    assert snap.next_energy_rate_structure_time == test_rates.next_energy_rate_structure_time
+    assert snap.demand_rate == test_rates.current_demand_rate
+    assert snap.demand_adjustment == test_rates.current_demand_adjustment
+    assert snap.mincharge == test_rates.mincharge
+    assert snap.fixedchargefirstmeter == test_rates.fixedchargefirstmeter
+
+
+async def test_change_detection(mock_aioclient, caplog, tmp_path, monkeypatch):
+    """Test unchanged refreshes skip the cache write and listeners."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+        repeat=2,
+    )
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_tier_data.json"),
+    )
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", cache_file=str(tmp_path / "change")
+    )
+    await test_rates.clear_cache()
+    changes = []
+    async_changes = []
+
+    async def async_listener(rates):
+        async_changes.append(rates.data_hash)
+
+    test_rates.add_listener(lambda rates: changes.append(rates.data_hash))
+    remove = test_rates.add_listener(async_listener)
+
+    await test_rates.update_data()
+    first = test_rates.data_hash
+    data = test_rates._data
+    assert changes == [first]
+    assert async_changes == [first]
+
+    with caplog.at_level(logging.DEBUG):
+        await test_rates.update_data()
+    assert "Plan unchanged, keeping current data." in caplog.text
+    assert test_rates._data is data
+    assert changes == [first]
+
+    remove()
+    hashes = []
+    sha256 = hashlib.sha256
+    monkeypatch.setattr(hashlib, "sha256", lambda data: hashes.append(data) or sha256(data))
+    await test_rates.update_data()
+    # A changed refresh hashes the plan once
+    assert len(hashes) == 1
+    assert test_rates.data_hash != first
+    assert changes == [first, test_rates.data_hash]
+    assert async_changes == [first]
+
+
+async def test_lookup_effective_on(mock_aioclient):
+    """Test plan lookups can ask for the plans of a past date."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("lookup.json"),
+    )
+    test_lookup = openeihttp.Rates(api="fakeAPIKey", lat="1", lon="1")
+    when = datetime.datetime(2020, 6, 1, tzinfo=datetime.timezone.utc)
+    await test_lookup.lookup_plans(effective_on=when)
+    (request_key,) = mock_aioclient.requests
+    assert request_key[1].query["effective_on_date"] == str(when.timestamp())
@@ -0,0 +1,94 @@
+"""Test instrumentation hooks."""
+
+import datetime
+import re
+
+import pytest
+from freezegun import freeze_time
+
+import openeihttp
+from tests.common import load_fixture
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+
+
+async def test_metrics_request_and_cache(mock_aioclient, tmp_path):
+    """Test request, cache and stale metrics are recorded."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+        repeat=True,
+    )
+    metrics = openeihttp.MetricsCollector()
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=str(tmp_path / "metrics"),
+        metrics=metrics,
+    )
+    await test_rates.clear_cache()
+    await test_rates.update()
+    assert metrics.counters["cache_miss"] == 1
+    assert metrics.counters["requests"] == 1
+    assert metrics.counters["status_200"] == 1
+    assert len(metrics.histograms["json_parse"]) == 1
+    assert len(metrics.histograms["cache_write"]) == 1
+    assert metrics.histograms["response_bytes"][0] > 0
+
+    cached = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=str(tmp_path / "metrics"),
+        metrics=metrics,
+    )
+    await cached.update()
+    assert metrics.counters["cache_hit"] == 1
+    assert len(metrics.histograms["cache_read"]) == 1
+
+    with freeze_time(datetime.datetime.now() + datetime.timedelta(days=2)):
+        await cached.update()
+    assert metrics.counters["cache_stale"] == 1
+
+
+async def test_metrics_rate_limit(mock_aioclient):
+    """Test rate-limit events are counted."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("rate_limit.json"),
+    )
+    metrics = openeihttp.MetricsCollector()
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", metrics=metrics
+    )
+    with pytest.raises(openeihttp.RateLimit):
+        await test_rates.update_data()
+    assert metrics.counters["rate_limit"] == 1
+
+
+async def test_metrics_rate_limit_429(mock_aioclient):
+    """Test a 429 reply carrying the rate-limit message is counted once."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=429,
+        body=load_fixture("rate_limit.json"),
+    )
+    metrics = openeihttp.MetricsCollector()
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", metrics=metrics
+    )
+    with pytest.raises(openeihttp.RateLimit):
+        await test_rates.update_data()
+    assert metrics.counters["status_429"] == 1
+    assert metrics.counters["rate_limit"] == 1
+
+
+async def test_metrics_histograms_bounded():
+    """Test histograms keep only the latest samples."""
+    metrics = openeihttp.MetricsCollector(max_samples=3)
+    for seconds in range(10):
+        metrics.record_cache_read(float(seconds))
+    assert list(metrics.histograms["cache_read"]) == [7.0, 8.0, 9.0]
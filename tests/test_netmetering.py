@@ -0,0 +1,93 @@
+"""Test net-metering and export credits."""
+
+import datetime
+
+import pytest
+
+from openeihttp import CompiledTariff, IntervalData, net_metering, net_metering_numpy
+from openeihttp.netmetering import RULES
+from tests.common import load_plan
+
+RETAIL = 0.16182 + 0.06655
+SELL = 0.085252
+QUARTER = datetime.timedelta(minutes=15)
+JANUARY = datetime.datetime(2021, 1, 4)
+
+
+@pytest.fixture
+def tariff():
+    """Plan whose January hours all use one period with a sell rate."""
+    return CompiledTariff(load_plan("sell_rate.json"))
+
+
+@pytest.mark.parametrize(
+    ("rule", "charge", "credit"),
+    [
+        ("Net Billing Instantaneous", RETAIL, SELL),
+        ("Buy All Sell All", RETAIL, SELL),
+        ("Net Billing Hourly", 0.0, 0.0),
+        ("Net Metering", 0.0, 0.0),
+    ],
+)
+def test_rules_within_an_hour(tariff, rule, charge, credit):
+    """Test which rules net an import and an export in the same hour."""
+    imports = IntervalData(JANUARY, [1.0, 0.0, 0.0, 0.0], QUARTER)
+    result = net_metering(tariff, imports, [0.0, 1.0, 0.0, 0.0], rule)
+    (month,) = result.months
+    assert month.energy_charge == pytest.approx(charge)
+    assert month.export_credit == pytest.approx(credit)
+    assert month.total == pytest.approx(8.73 + max(0.0, charge - credit))
+
+
+def test_net_billing_hourly_export(tariff):
+    """Test hourly net export is credited at the sell rate."""
+    imports = IntervalData(JANUARY, [1.0, 0.0, 0.0, 0.0, 0.0], QUARTER)
+    result = net_metering(tariff, imports, [0.0, 3.0, 0.0, 0.0, 0.0], "Net Billing Hourly")
+    assert result.months[0].export_credit == pytest.approx(2 * SELL)
+    assert result.months[0].energy_charge == 0.0
+
+
+def test_net_metering_carryover_and_true_up(tariff):
+    """Test credits roll over, expire at true-up and surplus is paid at the sell rate."""
+    hours = [datetime.datetime(2021, 1, 31, 23), datetime.datetime(2021, 2, 1)]
+    imports = IntervalData(hours[0], [0.0, 5.0])
+    result = net_metering(tariff, imports, [10.0, 0.0])
+    assert result.rule == "Net Metering"
+    january, february = result.months
+
+    assert january.export_credit == pytest.approx(10 * RETAIL)
+    assert january.carryover == pytest.approx(10 * RETAIL)
+    assert january.total == 8.73
+    assert february.energy_charge == pytest.approx(5 * RETAIL)
+    assert february.carryover == pytest.approx(5 * RETAIL)
+    assert february.total == 8.73
+
+    assert result.surplus_kwh == 5.0
+    assert result.settlement_credit == pytest.approx(5 * SELL)
+    assert result.forfeited_credit == pytest.approx(5 * RETAIL)
+    assert result.total == pytest.approx(2 * 8.73 - 5 * SELL)
+
+
+def test_invalid_input(tariff):
+    """Test unknown rules and misaligned readings are rejected."""
+    imports = IntervalData(JANUARY, [1.0])
+    with pytest.raises(ValueError):
+        net_metering(tariff, imports, [1.0], "Feed In Tariff")
+    with pytest.raises(ValueError):
+        net_metering(tariff, imports, [])
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("plan", ["sell_rate.json", "plan_tier_data.json"])
+def test_numpy_matches_scalar(plan, rule):
+    """Test the NumPy engine settles tiered, netted readings like the scalar one."""
+    tariff = CompiledTariff(load_plan(plan))
+    start = datetime.datetime(2021, 1, 30, 22, 45)
+    imports = IntervalData(start, [0.5 + (i % 7) / 4 for i in range(400)], QUARTER)
+    exports = [(i % 11) / 3 if i % 96 < 48 else 0.0 for i in range(400)]
+    expected = net_metering(tariff, imports, exports, rule)
+    result = net_metering_numpy(tariff, imports, exports, rule)
+    assert [month.month for month in result.months] == [month.month for month in expected.months]
+    for month, expected_month in zip(result.months, expected.months):
+        assert month[1:] == pytest.approx(expected_month[1:])
+    assert result[2:] == pytest.approx(expected[2:])
@@ -0,0 +1,52 @@
+"""Test portfolio billing."""
+
+import datetime
+
+import pytest
+
+from openeihttp import CompiledTariff, IntervalData, bill_portfolio
+from tests.common import load_plan
+
+PLANS = {
+    name: CompiledTariff(load_plan(f"{name}.json")) for name in ("plan_data", "plan_tier_data")
+}
+
+
+def _meters(count):
+    start = datetime.datetime(2021, 1, 1)
+    return [
+        (
+            f"meter{index}",
+            "plan_data" if index % 2 else "plan_tier_data",
+            IntervalData(start, [0.5 + index / 10] * 24 * 60),
+        )
+        for index in range(count)
+    ]
+
+
+def test_bill_portfolio():
+    """Test every meter is billed with its own plan."""
+    meters = _meters(7)
+    bills = {
+        bill.meter: bill for bill in bill_portfolio(meters, PLANS, max_workers=2, chunk_size=2)
+    }
+
+    assert len(bills) == 7
+    for meter, plan, intervals in meters:
+        months = tuple(PLANS[plan].bill(intervals))
+        assert bills[meter].plan == plan
+        assert bills[meter].months == months
+        assert bills[meter].total == pytest.approx(sum(month.total for month in months))
+
+
+def test_bill_portfolio_errors():
+    """Test unknown plans and bad chunk sizes are rejected."""
+    with pytest.raises(ValueError):
+        list(
+            bill_portfolio(
+                [("meter", "missing", IntervalData(datetime.datetime(2021, 1, 1), []))], PLANS
+            )
+        )
+    with pytest.raises(ValueError):
+        list(bill_portfolio(_meters(1), PLANS, chunk_size=0))
+    assert list(bill_portfolio([], PLANS)) == []
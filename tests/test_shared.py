@@ -0,0 +1,69 @@
+"""Test compiled tariffs in shared memory."""
+
+import datetime
+import pickle
+from multiprocessing import shared_memory
+
+import pytest
+
+from openeihttp import CompiledTariff, IntervalData, SharedTariffs, bill_portfolio, demand_charges
+from tests.common import cached_rates, load_plan
+
+YEAR = IntervalData(datetime.datetime(2021, 1, 1), [0.9] * 8760)
+
+
+@pytest.fixture
+def plans():
+    """Compiled fixture plans, including tiers and demand charges."""
+    return {
+        name: CompiledTariff(load_plan(f"{name}.json"))
+        for name in ("plan_data", "plan_tier_data", "plan_demand_data", "sell_rate")
+    }
+
+
+def test_shared_tariffs_match(plans, tmp_path):
+    """Test shared views bill, price demand and look up like the originals."""
+    rates = cached_rates(tmp_path, "plan_data.json")
+    with SharedTariffs.create({**plans, "from_rates": rates}) as shared:
+        assert sorted(shared) == sorted([*plans, "from_rates"])
+        assert shared["from_rates"].bill(YEAR) == plans["plan_data"].bill(YEAR)
+        for name, tariff in plans.items():
+            view = shared[name]
+            assert view is shared[name]
+            assert view.bill(YEAR) == tariff.bill(YEAR)
+            assert demand_charges(view, YEAR) == demand_charges(tariff, YEAR)
+            assert list(view.energy_tiers[0]) == list(tariff.energy_tiers[0])
+            assert view.energy_tiers[0][-1] == tariff.energy_tiers[0][-1]
+            assert (view.label, view.fixed_charge) == (tariff.label, tariff.fixed_charge)
+        with pytest.raises(TypeError):
+            shared["plan_data"].energy_table[0] = 1
+
+
+def test_shared_tariffs_attach_and_unlink(plans):
+    """Test pickling attaches by name and the creator removes the block."""
+    shared = SharedTariffs.create(plans)
+    name = shared.name
+    with shared:
+        attached = pickle.loads(pickle.dumps(shared))  # noqa: S301
+        assert attached.name == name
+        assert attached["plan_tier_data"].bill(YEAR) == plans["plan_tier_data"].bill(YEAR)
+        attached.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name)
+
+
+def test_shared_tariffs_dedupe(plans):
+    """Test identical schedules are stored once."""
+    with SharedTariffs.create({"one": plans["plan_data"]}) as one:
+        with SharedTariffs.create({"one": plans["plan_data"], "two": plans["plan_data"]}) as two:
+            tables = 576 * 4
+            assert two.size - one.size < tables
+
+
+def test_bill_portfolio_shared(plans):
+    """Test workers attach to shared tariffs instead of receiving copies."""
+    meters = [(index, name, YEAR) for index, name in enumerate(plans)]
+    with SharedTariffs.create(plans) as shared:
+        bills = {bill.meter: bill for bill in bill_portfolio(meters, shared, max_workers=2)}
+    for index, name, intervals in meters:
+        assert bills[index].months == tuple(plans[name].bill(intervals))
@@ -0,0 +1,95 @@
+"""Test the synchronous facade."""
+
+import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+import pytest
+
+import openeihttp
+from openeihttp import sync
+from tests.common import load_fixture
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+
+
+def test_sync_lookup_concurrent(mock_aioclient):
+    """Test many sync callers share one loop and session."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("lookup.json"),
+        repeat=True,
+    )
+    clients = [openeihttp.SyncRates(api="fakeAPIKey", lat="1", lon="1") for _ in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda client: client.lookup_plans(), clients))
+    assert all("Arizona Public Service Co" in result for result in results)
+    sessions = {id(client.rates._session) for client in clients}
+    assert len(sessions) == 1
+    sync.shutdown()
+
+
+def test_sync_tracer_session(mock_aioclient):
+    """Test traced clients get a shared session carrying their tracer's trace config."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("lookup.json"),
+        repeat=True,
+    )
+    tracer = openeihttp.RequestTracer()
+    traced = [
+        openeihttp.SyncRates(api="fakeAPIKey", lat="1", lon="1", tracer=tracer) for _ in range(2)
+    ]
+    plain = openeihttp.SyncRates(api="fakeAPIKey", lat="1", lon="1")
+    for client in [*traced, plain]:
+        client.lookup_plans()
+    assert traced[0].rates._session is traced[1].rates._session
+    assert traced[0].rates._session is not plain.rates._session
+    assert tracer.trace_config in traced[0].rates._session._trace_configs
+    assert not plain.rates._session._trace_configs
+    assert traced[0].rates._session.connector is plain.rates._session.connector
+    assert len(tracer.spans) == 2
+    sync.shutdown()
+    assert traced[0].rates._session.closed
+    assert plain.rates._session.closed
+
+
+def test_sync_update(mock_aioclient, tmp_path):
+    """Test sync update and property delegation."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+        repeat=True,
+    )
+    test_rates = openeihttp.SyncRates(
+        api="fakeAPIKey", plan="574613aa5457a3557e906f5b", cache_file=str(tmp_path / "sync_update")
+    )
+    test_rates.clear_cache()
+    test_rates.update()
+    assert test_rates.rate_name == "Residential Service TOU Time Advantage 7PM-Noon (ET-2)"
+    assert test_rates.all_rates is not None
+    sync.shutdown()
+
+
+def test_sync_call_timeout_cancels(mock_aioclient):
+    """Test a call that times out is cancelled on the loop thread."""
+    cancelled = threading.Event()
+
+    async def slow(url, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_aioclient.get(re.compile(TEST_PATTERN), callback=slow)
+    client = openeihttp.SyncRates(api="fakeAPIKey", lat="1", lon="1", call_timeout=0.05)
+    with pytest.raises(FutureTimeout):
+        client.lookup_plans()
+    assert cancelled.wait(1)
+    sync.shutdown()
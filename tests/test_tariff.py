@@ -0,0 +1,76 @@
+"""Test compiled tariffs."""
+
+import datetime
+import pickle
+
+import pytest
+
+import openeihttp
+from openeihttp import CompiledTariff, IntervalData, InvalidCall
+from tests.common import cached_rates, load_plan
+
+
+def test_bill_matches_rates(tmp_path):
+    """Test TOU energy charges match Rates.rate() and adjustment() hour by hour."""
+    rates = cached_rates(tmp_path, "plan_data.json")
+    tariff = CompiledTariff.from_rates(rates)
+    start = datetime.datetime(2021, 1, 1)
+    hours = [start + datetime.timedelta(hours=hour) for hour in range(31 * 24)]
+
+    (january,) = tariff.bill(IntervalData(start, [1.0] * len(hours)))
+
+    assert january.month == datetime.date(2021, 1, 1)
+    assert january.kwh == len(hours)
+    assert january.energy_charge == pytest.approx(sum(rates.rate(hour) for hour in hours))
+    assert january.adjustment_charge == pytest.approx(sum(rates.adjustment(hour) for hour in hours))
+    assert january.fixed_charge == 16.91
+    assert january.total == pytest.approx(january.energy_charge + january.adjustment_charge + 16.91)
+
+
+def test_bill_daily_tiers():
+    """Test daily tier limits scale with the days in the month."""
+    tariff = CompiledTariff(load_plan("plan_tier_data.json"))
+    start = datetime.datetime(2021, 1, 4)
+    assert tariff.energy_period(start) == 1
+
+    (january,) = tariff.bill(IntervalData(start, [200.0, 200.0]))
+
+    baseline = 8.2 * 31
+    assert january.energy_charge == pytest.approx(baseline * 0.25902 + (400 - baseline) * 0.32596)
+    # Nothing used: the minimum charge applies
+    (february,) = tariff.bill(IntervalData(datetime.datetime(2021, 2, 1), [0.0]))
+    assert february.total == 10
+
+
+def test_bill_splits_months():
+    """Test readings that cross a month boundary produce one bill per month."""
+    tariff = CompiledTariff(load_plan("plan_data.json"))
+    intervals = IntervalData(
+        datetime.datetime(2021, 1, 31, 23, 30), [1.0] * 4, datetime.timedelta(minutes=15)
+    )
+    months = tariff.bill(intervals)
+    assert [(month.month.month, month.kwh) for month in months] == [(1, 2.0), (2, 2.0)]
+
+
+def test_compile_errors():
+    """Test compiling requires energy data."""
+    with pytest.raises(InvalidCall):
+        CompiledTariff.from_rates(openeihttp.Rates(api="fakeAPIKey"))
+    with pytest.raises(InvalidCall):
+        CompiledTariff({"label": "empty"})
+
+
+def test_coerce():
+    """Test coerce passes compiled tariffs through and compiles Rates data."""
+    tariff = CompiledTariff(load_plan("plan_data.json"))
+    assert CompiledTariff.coerce(tariff) is tariff
+    with pytest.raises(InvalidCall):
+        CompiledTariff.coerce(openeihttp.Rates(api="fakeAPIKey"))
+
+
+def test_pickle_roundtrip():
+    """Test compiled tariffs survive pickling."""
+    tariff = CompiledTariff(load_plan("plan_tier_data.json"))
+    copy = pickle.loads(pickle.dumps(tariff))  # noqa: S301
+    intervals = IntervalData(datetime.datetime(2021, 7, 1), [5.0] * 100)
+    assert copy.bill(intervals) == tariff.bill(intervals)
@@ -0,0 +1,69 @@
+"""Test request tracing."""
+
+import re
+
+import pytest
+
+import openeihttp
+from openeihttp.tracing import RequestSpan
+from tests.common import load_fixture
+
+pytestmark = pytest.mark.asyncio
+
+TEST_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*$"
+
+
+async def test_update_data_span(mock_aioclient, tmp_path):
+    """Test update_data exports one span with decode and cache phases."""
+    mock_aioclient.get(
+        re.compile(TEST_PATTERN),
+        status=200,
+        body=load_fixture("plan_data.json"),
+    )
+    exported = []
+    tracer = openeihttp.RequestTracer(exporter=exported.append)
+    test_rates = openeihttp.Rates(
+        api="fakeAPIKey",
+        plan="574613aa5457a3557e906f5b",
+        cache_file=str(tmp_path / "tracing"),
+        tracer=tracer,
+    )
+    await test_rates.update_data()
+    assert len(exported) == 1
+    record = exported[0]
+    assert record["name"] == "update_data"
+    assert record["error"] is None
+    assert {"decode", "cache_write"} <= set(record["phases"])
+    assert list(tracer.spans) == exported
+
+
+async def test_lookup_timeout_span(mock_aioclient):
+    """Test a timed out request records where it stalled."""
+    mock_aioclient.get(re.compile(TEST_PATTERN), exception=TimeoutError())
+    tracer = openeihttp.RequestTracer()
+    test_lookup = openeihttp.Rates(api="fakeAPIKey", lat="1", lon="1", tracer=tracer)
+    with pytest.raises(openeihttp.APIError):
+        await test_lookup.lookup_plans()
+    (record,) = tracer.spans
+    assert record["name"] == "request"
+    assert record["error"] == "timeout during connect"
+
+
+async def test_span_redaction():
+    """Test the API key and address are redacted from span URLs."""
+    span = RequestSpan("request")
+    span.url = "https://api.openei.org/utility_rates?api_key=secret&address=1+Main+St"
+    record = span.as_record(["secret", "1 Main St"])
+    assert "secret" not in record["url"]
+    assert "Main" not in record["url"]
+    assert record["url"].count("**REDACTED**") == 2
+
+
+async def test_span_error_redaction():
+    """Test secrets in exception text are redacted from span errors."""
+    span = RequestSpan("request")
+    span.error = "ClientResponseError(url=URL('https://api.openei.org/?api_key=secret'))"
+    record = span.as_record(["secret"])
+    assert "secret" not in record["error"]
+    assert "api_key=**REDACTED**" in record["error"]
+    assert RequestSpan("request").as_record(["secret"])["error"] is None
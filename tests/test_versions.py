@@ -0,0 +1,86 @@
+"""Test historical plan versions."""
+
+import datetime
+import json
+import re
+
+import pytest
+
+import openeihttp
+from openeihttp import IntervalData, TariffVersions, fetch_versions
+from tests.common import load_plan
+
+pytestmark = pytest.mark.asyncio
+
+HEAD_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*getpage=574613aa5457a3557e906f5b.*$"
+OLD_PATTERN = r"^https://api\.openei\.org/utility_rates\?.*getpage=562bea025457a31838418740.*$"
+HEAD = load_plan("plan_data.json")
+# 2016-05-03 07:00 UTC
+SWITCH = datetime.datetime(2016, 5, 3, 7)
+
+
+def _old_plan():
+    plan = dict(HEAD)
+    plan.update(
+        label="562bea025457a31838418740",
+        startdate=1420070400,
+        energyratestructure=[[{"rate": 0.1, "unit": "kWh"}]] * 4,
+    )
+    del plan["supersedes"]
+    del plan["enddate"]
+    return plan
+
+
+async def test_fetch_versions_cached(mock_aioclient, tmp_path):
+    """Test the supersedes chain is fetched once and then read from the cache."""
+    mock_aioclient.get(re.compile(HEAD_PATTERN), status=200, body=json.dumps({"items": [HEAD]}))
+    mock_aioclient.get(
+        re.compile(OLD_PATTERN), status=200, body=json.dumps({"items": [_old_plan()]})
+    )
+    cache_file = str(tmp_path / "plan")
+    rates = openeihttp.Rates(api="fakeAPIKey", plan=HEAD["label"], cache_file=cache_file)
+
+    versions = await fetch_versions(rates)
+
+    assert versions.labels == ["562bea025457a31838418740", HEAD["label"]]
+    assert (tmp_path / "plan.versions").exists()
+    # A fresh object reads both the plan and its old versions from disk
+    reloaded = openeihttp.Rates(api="fakeAPIKey", plan=HEAD["label"], cache_file=cache_file)
+    assert (await fetch_versions(reloaded)).labels == versions.labels
+    assert len(mock_aioclient.requests) == 2
+    assert await fetch_versions(reloaded, limit=1) is not None
+
+
+async def test_version_index():
+    """Test each timestamp resolves to the version in effect."""
+    versions = TariffVersions([HEAD, _old_plan()])
+    assert versions.index(datetime.datetime(2014, 12, 31)) is None
+    assert versions.at(datetime.datetime(2015, 6, 1)) is versions.tariffs[0]
+    assert versions.at(SWITCH - datetime.timedelta(seconds=1)) is versions.tariffs[0]
+    assert versions.at(SWITCH) is versions.tariffs[1]
+    assert versions.at(datetime.datetime(2030, 1, 1)) is versions.tariffs[1]
+    with pytest.raises(ValueError):
+        TariffVersions([])
+
+
+async def test_bill_across_versions():
+    """Test a month that spans a version change prices each part with its version."""
+    versions = TariffVersions([HEAD, _old_plan()])
+    start = datetime.datetime(2016, 5, 1)
+    values = [1.0] * 24 * 31
+    (may,) = versions.bill(IntervalData(start, values))
+
+    old, new = versions.tariffs
+    split = int((SWITCH - start).total_seconds() // 3600)
+    expected = sum(
+        (old if hour < split else new).price(
+            (old if hour < split else new).energy_period(start + datetime.timedelta(hours=hour)),
+            0.0,
+            1.0,
+            31,
+        )[0]
+        for hour in range(len(values))
+    )
+    assert may.energy_charge == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        versions.bill(IntervalData(datetime.datetime(2014, 1, 1), [1.0]))